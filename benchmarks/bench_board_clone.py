@@ -0,0 +1,38 @@
+"""
+Board clone benchmark: the cost of a board for one request, copy.deepcopy of the cached board against Board.clone(),
+for boards of different widths.  The cached board has no rows, the way MondayFactory keeps it.
+
+    python -m benchmarks.bench_board_clone [copies]
+"""
+import copy
+import logging
+import sys
+from time import perf_counter
+
+from benchmarks.bench_row_memory import BenchBoard
+
+WIDTHS = (10, 30, 100, 300)
+
+
+def timed(copy_board, board, copies) -> float:
+    start = perf_counter()
+    for _ in range(copies):
+        copy_board(board)
+    return (perf_counter() - start) / copies
+
+
+def main():
+    logging.disable(logging.INFO)
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    print(f"{'columns':>8} {'deepcopy':>12} {'clone':>12}")
+    for width in WIDTHS:
+        board = BenchBoard(column_count=width)
+        assert board.clone().column_id_map is board.column_id_map
+        deepcopy_seconds = timed(copy.deepcopy, board, copies)
+        clone_seconds = timed(lambda b: b.clone(), board, copies)
+        print(f"{width:>8} {deepcopy_seconds * 1000:>9.3f} ms {clone_seconds * 1000:>9.3f} ms "
+              f"({deepcopy_seconds / clone_seconds:,.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
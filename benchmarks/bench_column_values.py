@@ -0,0 +1,110 @@
+"""
+Column value benchmark: builds the column_values payload for wide rows with the old string built builder and with
+ColumnValue, every cell of every row is modified.
+
+    python -m benchmarks.bench_column_values [rows]
+"""
+import json
+import logging
+import sys
+from time import perf_counter
+
+from benchmarks.bench_row_memory import BenchBoard, COLUMN_COUNT, make_item
+from monday.c_cell import Cell
+from monday.c_column_value import ColumnValue
+from monday.c_select import MondaySelect
+from std_utility.c_datetime import DateTime
+
+
+def legacy_update_query(q_data) -> str:
+    """ the string built payload used before ColumnValue, kept here as the baseline """
+    data = '{'
+    for _cel in q_data:
+        _cell: Cell = _cel
+        if not _cell.modified:
+            continue
+        if _cell.value is None:
+            continue
+
+        if data != '{':
+            data += ','
+        try:
+            if _cell.type == 'link':
+                if _cell.source is None or not isinstance(_cell.source, dict):
+                    continue
+                text = _cell.value2
+                if text is None or len(str(text)) == 0:
+                    text = _cell.source.get('title')
+                url = _cell.value
+                if text is None or url is None:
+                    continue
+                data += ' \\"' + _cell.id + '\\" : {\\"url\\" : \\"' + url + '\\", \\"text\\":\\"' + text + '\\" } '
+                continue
+
+            if _cell.type == 'datetime':
+                _c: DateTime = _cell.value
+                dd: str = _c.to_date_str()
+                dt: str = _c.to_time_str()
+                data += ' \\"' + _cell.id + '\\" : {\\"date\\" : \\"' + dd + '\\", \\"time\\" : \\"' + dt + '\\" } '
+                continue
+
+            if _cell.modified and _cell.type == 'boolean':
+                a_value = 'false'
+                if _cell.value is True:
+                    a_value = 'true'
+
+                data += """ \\"ID\\": {\\"checked\\": \\"VALUE\\" } """ \
+                    .replace('ID', _cell.id) \
+                    .replace('VALUE', a_value)
+                continue
+
+            the_value = str(_cell.value)
+
+            if _cell.type == 'date':
+                _c: DateTime = _cell.value
+                the_value = _c.to_date_str()
+
+            if _cell.modified and _cell.value is not None:
+                data += """ \\"ID\\": \\"VALUE\\" """ \
+                    .replace('ID', _cell.id) \
+                    .replace('VALUE', the_value)
+                # data += '\\"' + _cell.id + '\\' + '\":' + '\\' + '\"' + the_value + '\\' + '\"'
+        except Exception as ex:
+            logging.error(ex)
+
+    retval = data + '}'
+
+    return retval
+
+
+def modified_rows(row_count):
+    board = BenchBoard()
+    rows = MondaySelect.process_rows(board, [make_item(item_id, board.columns) for item_id in range(row_count)])
+    for row in rows:
+        for cell in row.cells:
+            cell.modified = True
+    return rows
+
+
+def timed(build, rows):
+    start = perf_counter()
+    payloads = [build(row.cells) for row in rows]
+    return perf_counter() - start, payloads
+
+
+def main():
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rows = modified_rows(row_count)
+
+    legacy_seconds, legacy = timed(legacy_update_query, rows)
+    seconds, payloads = timed(ColumnValue.dumps, rows)
+    # the legacy payload is escaped for a query string, both decode to the same columns
+    assert set(json.loads(json.loads('"' + legacy[0] + '"'))) == set(json.loads(payloads[0]))
+
+    print(f"{row_count} rows x {COLUMN_COUNT} columns")
+    print(f"string builder: {legacy_seconds:.3f} seconds")
+    print(f"ColumnValue:    {seconds:.3f} seconds ({legacy_seconds / seconds:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
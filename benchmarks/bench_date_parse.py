@@ -0,0 +1,61 @@
+"""
+Date parse benchmark: 100k date cells as monday sends them, half dates and half datetimes over one year.
+    dateutil    parser.parse and plus(), the way every DateTime was made before the fast path
+    DateTime    fromisoformat for monday's formats
+    DateCache   a board's DateCache, each text is parsed once
+
+    python -m benchmarks.bench_date_parse [cells]
+"""
+import sys
+from datetime import date, timedelta
+from time import perf_counter
+
+from dateutil import parser
+
+from std_utility.c_datetime import DateTime, DateCache
+
+CELLS = 100000
+
+
+def make_texts(cell_count):
+    start = date(2024, 1, 1)
+    texts = []
+    for index in range(cell_count):
+        day = (start + timedelta(days=index % 365)).isoformat()
+        texts.append(day if index % 2 == 0 else f"{day} {index % 24:02d}:{index % 4 * 15:02d}")
+    return texts
+
+
+def dateutil_datetime(text):
+    value = DateTime.__new__(DateTime)
+    value.dt = text
+    value._datetime = parser.parse(text)
+    value._datetime = value.plus()
+    return value
+
+
+def timed(make, texts) -> float:
+    start = perf_counter()
+    for text in texts:
+        make(text)
+    return perf_counter() - start
+
+
+def main():
+    cell_count = int(sys.argv[1]) if len(sys.argv) > 1 else CELLS
+    texts = make_texts(cell_count)
+    cache = DateCache()
+    for text in texts[:100]:
+        assert DateTime(text).to_str() == dateutil_datetime(text).to_str() == DateTime.from_text(text, cache).to_str()
+
+    baseline = timed(dateutil_datetime, texts)
+    print(f"{cell_count} date cells")
+    print(f"{'dateutil':>10} {baseline:>8.3f} s")
+    board_cache = DateCache()
+    for name, make in (('DateTime', DateTime), ('DateCache', lambda text: DateTime.from_text(text, board_cache))):
+        seconds = timed(make, texts)
+        print(f"{name:>10} {seconds:>8.3f} s ({baseline / seconds:,.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
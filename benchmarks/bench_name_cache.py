@@ -0,0 +1,57 @@
+"""
+Name cache benchmark: rows per second for a board with 40 columns, with the Format and Utility name caches and with
+the conversions run every time (the way they were before the caches).  Each row is created by process_rows and
+written out with as_db_dict, both convert the column and group names.
+
+    python -m benchmarks.bench_name_cache [rows]
+"""
+import logging
+import sys
+from contextlib import contextmanager
+from time import perf_counter
+
+from benchmarks.bench_row_memory import BenchBoard, make_item
+from conversion.c_format import Format
+from monday.c_select import MondaySelect
+from std_utility.c_utility import Utility
+
+COLUMN_COUNT = 40
+
+
+@contextmanager
+def without_name_caches():
+    cached = Format.snake_case_of, Format.name_of, Utility.db_name_of
+    Format.snake_case_of = staticmethod(cached[0].__wrapped__)
+    Format.name_of = staticmethod(cached[1].__wrapped__)
+    Utility.db_name_of = staticmethod(cached[2].__wrapped__)
+    try:
+        yield
+    finally:
+        Format.snake_case_of, Format.name_of, Utility.db_name_of = (staticmethod(f) for f in cached)
+
+
+def rows_per_second(board, items) -> float:
+    start = perf_counter()
+    rows = MondaySelect.process_rows(board, items, track=False)
+    for row in rows:
+        row.as_db_dict()
+    return len(rows) / (perf_counter() - start)
+
+
+def main():
+    logging.disable(logging.INFO)
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    board = BenchBoard(column_count=COLUMN_COUNT)
+    items = [make_item(item_id, board.columns) for item_id in range(row_count)]
+
+    with without_name_caches():
+        uncached = rows_per_second(board, items)
+    Format.clear_name_caches()
+    cached = rows_per_second(board, items)
+    print(f"{row_count} rows x {COLUMN_COUNT} columns: {uncached:,.0f} rows/s without the name caches, "
+          f"{cached:,.0f} rows/s with them ({cached / uncached:,.1f}x)")
+    print(f"snake_case {Format.snake_case_of.cache_info()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Row memory benchmark: builds rows for a board with 30 columns from generated json and reports the bytes used per row.
+
+    python -m benchmarks.bench_row_memory [rows]
+"""
+import gc
+import json
+import sys
+import tracemalloc
+
+from monday.c_board import Board
+from monday.c_select import MondaySelect
+from result.c_result import Result
+
+COLUMN_COUNT = 30
+GROUP = {'id': 'topics', 'title': 'Default Group'}
+STATUS_LABELS = {'0': 'Working on it', '1': 'Done', '2': 'Stuck'}
+
+
+def make_columns(column_count=COLUMN_COUNT):
+    columns = [{'id': 'name', 'title': 'Name', 'type': 'name', 'settings_str': '{}'},
+               {'id': 'status', 'title': 'Status', 'type': 'color', 'settings_str': json.dumps({'labels': STATUS_LABELS})},
+               {'id': 'date4', 'title': 'Date', 'type': 'date', 'settings_str': '{}'}]
+    for index in range(len(columns), column_count):
+        columns.append({'id': f"text{index}", 'title': f"Text {index}", 'type': 'text', 'settings_str': '{}'})
+    return columns
+
+
+def make_item(item_id, columns):
+    values = []
+    for column in columns[1:]:
+        if column.get('id') == 'status':
+            text = STATUS_LABELS[str(item_id % 3)]
+        elif column.get('id') == 'date4':
+            text = f"2024-01-{(item_id % 28) + 1:02d}"
+        else:
+            text = f"{column.get('title')} {item_id}"
+        values.append({'id': column.get('id'), 'column': {'title': column.get('title')}, 'text': text})
+    return {'id': str(item_id), 'name': f"Item {item_id}", 'assets': [], 'group': GROUP, 'column_values': values}
+
+
+class BenchBoard(Board):
+    """ a board that answers the column query from generated json """
+    def __init__(self, column_count=COLUMN_COUNT):
+        self.columns = make_columns(column_count)
+        super().__init__(1, 'bench-token')
+
+    def execute(self, query, files=None) -> Result:
+        return Result(0, data={'data': {'boards': [{
+            'id': '1', 'name': 'Bench Board', 'permissions': 'everyone', 'tags': [], 'groups': [GROUP],
+            'items_page': {'items': [make_item(1, self.columns)]}, 'columns': self.columns}]}})
+
+
+def bytes_per_row(row_count):
+    board = BenchBoard()
+    items = [make_item(item_id, board.columns) for item_id in range(row_count)]
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    rows = MondaySelect.process_rows(board, items)
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    used = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    assert len(rows) == row_count
+    return used / row_count
+
+
+def main():
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    per_row = bytes_per_row(row_count)
+    print(f"{row_count} rows x {COLUMN_COUNT} columns: {per_row:,.0f} bytes per row, "
+          f"{per_row * 50000 / 1024 / 1024:,.1f} MB for 50k rows")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,18 +1,46 @@
 """
 CachedResources class that maintains cached objects, can be used by all webhooks
+
+CachedResource is bounded, a worker that runs for weeks keeps a steady footprint:
+    max_entries     the least recently used entry is evicted when there are more entries
+    max_bytes       the least recently used entries are evicted while the approximate size is larger
+    expire_seconds  an expired entry is removed when it is read, and by a sweep of the whole cache at most once
+                    every sweep_seconds when the cache is used, so entries nobody reads again do not stay forever
+hits, misses, evictions and expirations are counted, see stats()
+
+    Example: cache = CachedResource(expire_seconds=3600, max_entries=100, max_bytes=512 * 1024 * 1024)
 """
+import sys
+import threading
+import types
+from collections import OrderedDict
 from datetime import datetime
 from datetime import timedelta
+from time import monotonic
 from typing import TypeVar
 
 T = TypeVar("T")
 
 EXPIRE_SECONDS_DEFAULT = 14400
+SWEEP_SECONDS_DEFAULT = 60
+
+# not part of an object's size, shared with everything else in the process
+SKIP_SIZE_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+# classes with __cache_shared__ = True are shared by many cached objects (schedulers, response caches), an object
+# that refers to one is not charged for it
+SHARED_ATTRIBUTE = '__cache_shared__'
+
 
 class CacheItem:
-    def __init__(self, obj, expire_seconds=EXPIRE_SECONDS_DEFAULT):
-        self.expire_time: datetime = datetime.now() + timedelta(seconds=expire_seconds)
+    __slots__ = ('expire_time', 'obj', 'size')
+
+    def __init__(self, obj, expire_seconds=EXPIRE_SECONDS_DEFAULT, size=0):
+        self.expire_time = monotonic() + expire_seconds
         self.obj = obj
+        self.size = size
+
+    def expired(self, now=None) -> bool:
+        return (monotonic() if now is None else now) > self.expire_time
 
 
 class CachedResource:
@@ -22,12 +50,26 @@ class CachedResource:
     The names are used to build a unique key to locate cached objects and are needed to retrieve the objects
     You can enable or disable the cache as desired, useful when calling a parent class where the cache is enabled
     and pass the number of seconds a cached item will last.
+    max_entries and max_bytes bound the cache, None means no limit.
     """
 
-    def __init__(self, enable_cache=True, expire_seconds=EXPIRE_SECONDS_DEFAULT):
-        self.cached_resource = {}
+    def __init__(self, enable_cache=True, expire_seconds=EXPIRE_SECONDS_DEFAULT, max_entries=None, max_bytes=None,
+                 sweep_seconds=SWEEP_SECONDS_DEFAULT):
+        assert max_entries is None or max_entries > 0, "max_entries must be 1 or more"
+        assert max_bytes is None or max_bytes > 0, "max_bytes must be 1 or more"
+        self.cached_resource = OrderedDict()
         self.enabled = enable_cache
         self.expire_seconds = expire_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sweep_seconds = sweep_seconds
+        self.next_sweep = monotonic() + sweep_seconds
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._cache_lock = threading.RLock()
 
     @staticmethod
     def get_key(*args) -> str:
@@ -36,23 +78,57 @@ class CachedResource:
             key += ':' + str(arg)
         return key
 
+    @staticmethod
+    def approximate_size(obj) -> int:
+        """ the number of bytes used by the object and everything it refers to, each object is counted once.
+            shared objects, see SHARED_ATTRIBUTE, are only counted when they are the object itself """
+        seen = set()
+        total = 0
+        pending = [obj]
+        while pending:
+            item = pending.pop()
+            if id(item) in seen or isinstance(item, SKIP_SIZE_TYPES):
+                continue
+            if item is not obj and getattr(type(item), SHARED_ATTRIBUTE, False):
+                continue
+            seen.add(id(item))
+            total += sys.getsizeof(item, 0)
+            if isinstance(item, (str, bytes, bytearray, int, float, bool)) or item is None:
+                continue
+            if isinstance(item, dict):
+                pending.extend(item.keys())
+                pending.extend(item.values())
+            elif isinstance(item, (list, tuple, set, frozenset)):
+                pending.extend(item)
+            if hasattr(item, '__dict__'):
+                pending.append(vars(item))
+            for cls in type(item).__mro__:
+                for name in cls.__dict__.get('__slots__', ()):
+                    if hasattr(item, name) and name not in ('__dict__', '__weakref__'):
+                        pending.append(getattr(item, name))
+        return total
+
     def disable_cache(self):
-        self.cached_resource = {}
+        self.reset()
         self.enabled = False
 
     def enable_cache(self):
         self.enabled = True
 
     def clear_cache(self):
-        self.cached_resource = {}
+        self.reset()
 
     def reset(self):
-        self.cached_resource = {}
+        with self._cache_lock:
+            self.cached_resource = OrderedDict()
+            self.bytes = 0
 
     def is_available(self, key):
         if not self.enabled:
             return False
-        return key in self.cached_resource
+        with self._cache_lock:
+            cached_item: CacheItem = self.cached_resource.get(key)
+            return cached_item is not None and not cached_item.expired()
 
     def get_cache_item(self, *args) -> object:
         """
@@ -60,17 +136,23 @@ class CachedResource:
         """
         key = self.get_key(*args)
 
-        if self.enabled:
+        if not self.enabled:
+            return None
+
+        with self._cache_lock:
+            self._sweep()
             cached_item: CacheItem = self.cached_resource.get(key)
+            if cached_item is not None and cached_item.expired():
+                self._pop(key)
+                self.expirations += 1
+                cached_item = None
             if cached_item is None:
-                return None
-            if datetime.now() > cached_item.expire_time:
-                self.cached_resource.pop(key)
+                self.misses += 1
                 return None
 
+            self.cached_resource.move_to_end(key)
+            self.hits += 1
             return cached_item.obj
-        else:
-            return None
 
     @staticmethod
     def cache_key(*args):
@@ -82,22 +164,64 @@ class CachedResource:
         if expire_seconds is None:
             expire_seconds = EXPIRE_SECONDS_DEFAULT
         if self.enabled:
-            self.cached_resource[key] = CacheItem(obj=obj, expire_seconds=expire_seconds)
+            self._put(key, obj, expire_seconds)
 
     def update_cache(self, obj, *args):
         if self.enabled:
-            key = self.get_key(*args)
-            self.cached_resource[key] = CacheItem(obj=obj, expire_seconds=self.expire_seconds)
+            self._put(self.get_key(*args), obj, self.expire_seconds)
 
     def remove(self, *args):
         key = self.get_key(*args)
-        if self.enabled and key in self.cached_resource:
-            self.cached_resource.pop(key)
+        if self.enabled:
+            with self._cache_lock:
+                self._pop(key)
+
+    def _put(self, key, obj, expire_seconds):
+        # the size is only needed, and only worth the walk over the object, when there is a byte limit
+        size = self.approximate_size(obj) if self.max_bytes is not None else 0
+        with self._cache_lock:
+            self._sweep()
+            self._pop(key)
+            self.cached_resource[key] = CacheItem(obj=obj, expire_seconds=expire_seconds, size=size)
+            self.bytes += size
+            self._evict()
+
+    def _pop(self, key):
+        cached_item: CacheItem = self.cached_resource.pop(key, None)
+        if cached_item is not None:
+            self.bytes -= cached_item.size
+        return cached_item
+
+    def _evict(self):
+        """ removes the least recently used entries until the cache is within its limits, keeps the newest one """
+        while len(self.cached_resource) > 1 and \
+                ((self.max_entries is not None and len(self.cached_resource) > self.max_entries) or
+                 (self.max_bytes is not None and self.bytes > self.max_bytes)):
+            self._pop(next(iter(self.cached_resource)))
+            self.evictions += 1
+
+    def _sweep(self, force=False):
+        """ removes every expired entry, at most once every sweep_seconds so the cost is spread over many calls """
+        now = monotonic()
+        if not force and now < self.next_sweep:
+            return
+        self.next_sweep = now + self.sweep_seconds
+        for key in [key for key, cached_item in self.cached_resource.items() if cached_item.expired(now)]:
+            self._pop(key)
+            self.expirations += 1
+
+    def sweep(self):
+        with self._cache_lock:
+            self._sweep(force=True)
 
     @property
     def size(self):
         return len(self.cached_resource)
 
+    def stats(self) -> dict:
+        return {'size': self.size, 'bytes': self.bytes, 'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'expirations': self.expirations}
+
 
 class CachedResources:
     def __init__(self, enable_cache=False, expire_seconds=14400):
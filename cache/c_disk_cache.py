@@ -0,0 +1,106 @@
+"""
+DiskCache class that keeps json objects in files so they survive a restart and can be shared by worker processes.
+
+Every entry is written with the cache version, the key and an expire time, an entry with a different version,
+a different key or an expired time is removed and treated as missing.  Files are written to a temp file and then
+renamed, so a reader never sees half an entry.
+
+    Example: cache = DiskCache('/tmp/monday', expire_seconds=3600)
+             cache.update_cache(obj, board_id, 'schema')
+             obj = cache.get_cache_item(board_id, 'schema')
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+DISK_CACHE_VERSION = 1
+EXPIRE_SECONDS_DEFAULT = 14400
+
+
+class DiskCache:
+    def __init__(self, directory, expire_seconds=EXPIRE_SECONDS_DEFAULT, version=DISK_CACHE_VERSION):
+        self.directory = directory
+        self.expire_seconds = expire_seconds
+        self.version = version
+        self.enabled = True
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def get_key(*args) -> str:
+        key = ''
+        for arg in args:
+            key += ':' + str(arg)
+        return key
+
+    def file_name(self, key) -> str:
+        return os.path.join(self.directory, hashlib.sha256(key.encode('utf-8')).hexdigest() + '.json')
+
+    def get_cache_item(self, *args):
+        """ returns the cached object or None when it is missing, expired or not valid """
+        if not self.enabled:
+            return None
+
+        key = self.get_key(*args)
+        file_name = self.file_name(key)
+        try:
+            with open(file_name, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as ex:
+            logging.warning(f"Removing unreadable cache file {file_name}: {ex}")
+            self._remove_file(file_name)
+            return None
+
+        if not isinstance(entry, dict) \
+                or entry.get('version') != self.version \
+                or entry.get('key') != key \
+                or not isinstance(entry.get('expire_time'), (int, float)) \
+                or time.time() > entry.get('expire_time'):
+            self._remove_file(file_name)
+            return None
+
+        return entry.get('obj')
+
+    def update_cache(self, obj, *args, expire_seconds=None):
+        if not self.enabled:
+            return
+        if expire_seconds is None:
+            expire_seconds = self.expire_seconds
+
+        key = self.get_key(*args)
+        entry = {'version': self.version, 'key': key, 'expire_time': time.time() + expire_seconds, 'obj': obj}
+        file_name = self.file_name(key)
+        try:
+            fd, temp_name = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(entry, f)
+                os.replace(temp_name, file_name)
+            except BaseException:
+                self._remove_file(temp_name)
+                raise
+        except (OSError, TypeError, ValueError) as ex:
+            logging.warning(f"Unable to write cache file {file_name}: {ex}")
+
+    def remove(self, *args):
+        self._remove_file(self.file_name(self.get_key(*args)))
+
+    def clear_cache(self):
+        for name in os.listdir(self.directory):
+            if name.endswith('.json') or name.endswith('.tmp'):
+                self._remove_file(os.path.join(self.directory, name))
+
+    @staticmethod
+    def _remove_file(file_name):
+        try:
+            os.remove(file_name)
+        except OSError:
+            pass
+
+    @property
+    def size(self):
+        return len([name for name in os.listdir(self.directory) if name.endswith('.json')])
@@ -0,0 +1,84 @@
+"""
+SingleFlight class that runs one call per key at a time, callers that ask for the same key while it runs wait for
+it and share its result, or its exception, instead of doing the same work again.
+
+    Example: flight = SingleFlight()
+             board = flight.do(board_id, load_board, board_id)      # many threads, one load per board_id
+
+lock(key) returns the lock for a key, for work on a key that must not run at the same time as other work on it.
+"""
+import threading
+
+
+class InFlight:
+    __slots__ = ('done', 'value', 'error', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._locks = {}
+        self.calls = 0
+        self.shared = 0
+
+    # there is one of each per process, copies share it
+    __cache_shared__ = True
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def do(self, key, fn, *args, **kwargs):
+        """ calls fn unless a call for the key is running, then waits for that call and returns its result """
+        with self._lock:
+            call: InFlight = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = InFlight()
+                self._calls[key] = call
+                self.calls += 1
+            else:
+                call.waiters += 1
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = fn(*args, **kwargs)
+            return call.value
+        except BaseException as ex:
+            call.error = ex
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def in_flight(self, key) -> bool:
+        with self._lock:
+            return key in self._calls
+
+    def lock(self, key) -> threading.RLock:
+        with self._lock:
+            key_lock = self._locks.get(key)
+            if key_lock is None:
+                key_lock = threading.RLock()
+                self._locks[key] = key_lock
+            return key_lock
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'calls': self.calls, 'shared': self.shared, 'in_flight': len(self._calls)}
@@ -10,16 +10,21 @@ then in your code:
 
 c1 = foo.Instance() gets the database class.
 """
+import threading
 
 
 class Singleton:
     def __init__(self, klass):
         self.klass = klass
         self.instance = None
+        self._lock = threading.Lock()
 
     def __call__(self, *args,**kwds):
         if self.instance is None:
-            self.instance = self.klass(*args, **kwds)
+            # two threads asking for the first instance at the same time get the same one
+            with self._lock:
+                if self.instance is None:
+                    self.instance = self.klass(*args, **kwds)
         return self.instance
 
 
@@ -1,8 +1,15 @@
+import functools
 import re
+import sys
 import unicodedata
 
 from more_itertools import peekable
 
+# column, group and board titles repeat for every row, the conversions keep the most recent NAME_CACHE_SIZE names
+NAME_CACHE_SIZE = 4096
+# the cached conversions of other modules built on these names (Utility.db_name_of), cleared with Format's own
+NAME_CACHES = []
+
 
 class Format:
     def __init__(self, value, fixup=False):
@@ -13,7 +20,15 @@ class Format:
     @property
     def snake_case(self):
         s = self.value
-        if isinstance(s, str) and not self.is_snake_case:
+        if isinstance(s, str):
+            s = Format.snake_case_of(s)
+        return s
+
+    @staticmethod
+    @functools.lru_cache(maxsize=NAME_CACHE_SIZE)
+    def snake_case_of(s: str) -> str:
+        """ snake_case for a string, the result is kept and interned so every row shares one copy """
+        if not Format(s).is_snake_case:
             s = Format.convert_symbols_to_words(s)
             s = Format.as_ascii(s)
             s = Format.upper_case_to_space_lower_case(s)
@@ -22,7 +37,7 @@ class Format:
             s = s.lower()
             s = s.strip()
             s = s.replace(' ', '_')
-        return s
+        return sys.intern(s) if type(s) is str else s
 
     @property
     def camel_case(self):
@@ -42,11 +57,26 @@ class Format:
     def name(self):
         s = self.value
         if isinstance(s, str):
-            s = Format.convert_symbols_to_words(s)
-            s = Format.as_ascii(s)
-            s = Format.only_one_space_between_words(s)
+            s = Format.name_of(s)
         return s
 
+    @staticmethod
+    @functools.lru_cache(maxsize=NAME_CACHE_SIZE)
+    def name_of(s: str) -> str:
+        """ name for a string, the result is kept and interned so every row shares one copy """
+        s = Format.convert_symbols_to_words(s)
+        s = Format.as_ascii(s)
+        s = Format.only_one_space_between_words(s)
+        return sys.intern(s)
+
+    @staticmethod
+    def clear_name_caches():
+        """ empties the name caches, including the ones in NAME_CACHES """
+        Format.snake_case_of.cache_clear()
+        Format.name_of.cache_clear()
+        for cache in NAME_CACHES:
+            cache.cache_clear()
+
     @property
     def title_case(self):
         s = self.name
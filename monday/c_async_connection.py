@@ -0,0 +1,79 @@
+"""
+  AsyncMondayConnection: executes Monday.com api requests without blocking the event loop.
+
+  The request, retry and complexity back-off rules are the same as MondayConnection.execute, the difference is that
+  waits use asyncio.sleep and the http request runs on the pooled sessions in a worker thread, so one process can have
+  many Monday requests in flight.
+
+      Example: result = await AsyncMondayConnection(board).execute(query)
+      Example: result = await board.execute_async(query)
+"""
+import asyncio
+import logging
+from time import time
+
+from monday.c_connection import MondayConnection, MAX_RETRIES
+from networking.c_requests import Network
+from result.c_result import Result
+from status.c_status import Status
+
+
+class AsyncMondayConnection(object):
+    def __init__(self, connection: MondayConnection):
+        self.connection = connection
+
+    async def execute(self, query, files=None) -> Result:
+        connection = self.connection
+        logging.debug(f"ready to execute async query = [{query}]")
+        cached = connection.cached_response(query, files)
+        if cached is not None:
+            return cached
+
+        request = query
+        api_endpoint = connection.api_endpoint(files)
+        query = connection.scheduled_query(query, files)
+
+        result = Result()
+        try:
+            retry_count = 0
+            try_again = True
+            while retry_count < MAX_RETRIES and try_again:
+                ticket = await self.acquire(query)
+                start = time()
+                try:
+                    r = await Network.post_async(api_endpoint, headers=connection.headers,
+                                                 timeout=connection.monday_timeout_seconds, files=files,
+                                                 **connection.request_body(query))
+                    result = MondayConnection.check_response(r)
+                finally:
+                    connection.release(ticket, result)
+                end = time()
+                logging.debug(f'Completed async Monday.com request in {round(end - start, 3)} seconds')
+                wait_seconds = connection.retry_wait_seconds(result, retry_count)
+                try_again = wait_seconds is not None
+                if try_again:
+                    retry_count += 1
+                    await asyncio.sleep(connection.scheduled_wait_seconds(result, wait_seconds))
+
+        except Exception as ex:
+            logging.error(ex)
+            result.status = Status(2003, ex)
+
+        return connection.cache_response(request, connection.check_result(result), files)
+
+    async def acquire(self, query):
+        """ waits for the complexity scheduler to admit the query, without holding a worker thread """
+        scheduler = self.connection.scheduler
+        if scheduler is None:
+            return None
+        ticket = scheduler.enqueue(self.connection.monday_token, query, priority=self.connection.priority)
+        try:
+            wait_seconds = scheduler.try_admit(ticket)
+            while wait_seconds is not None:
+                await asyncio.sleep(wait_seconds)
+                wait_seconds = scheduler.try_admit(ticket)
+        except BaseException:
+            # cancelled or timed out while waiting, the tickets behind this one must not wait for it
+            scheduler.cancel(ticket)
+            raise
+        return ticket
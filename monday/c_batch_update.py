@@ -0,0 +1,178 @@
+"""
+BatchUpdate: updates many rows with one request by sending their mutations as GraphQL aliases.
+
+    mutation ($v0: JSON!, $v1: JSON!) {
+        m0: change_multiple_column_values (item_id: 1, board_id: 2, column_values: $v0) {id}
+        m1: change_multiple_column_values (item_id: 3, board_id: 2, column_values: $v1) {id} }
+
+Each alias is mapped back to its row, monday answers a failed alias with null and an error whose path is the alias,
+the other aliases are still applied.  Cell.modified is only cleared for the rows that were updated.  The batch size
+is limited by the complexity budget when the board has a scheduler, the cost of one mutation is learned from the
+complexity field of every response.  run() sends any list of mutations the same way, UnitOfWork uses it for
+inserts and deletes.
+
+    Example: result = board.update_rows(rows, batch_size=50)
+             outcome: BatchOutcome = result.data
+             outcome.updated -> [Row], outcome.failed -> [(Row, message)]
+"""
+import logging
+from collections import namedtuple
+
+from monday.c_column_value import ColumnValue
+from monday.c_row import Row
+from result.c_result import Result
+
+BatchOutcome = namedtuple('BatchOutcome', 'updated failed skipped requests')
+
+MAX_BATCH_SIZE = 50
+BUDGET_SHARE = 0.5          # one batch may use at most this part of the complexity budget
+
+
+class BatchUpdate:
+    def __init__(self, parent_board, batch_size=MAX_BATCH_SIZE, add_missing_labels=False):
+        assert batch_size is None or batch_size > 0, "batch_size must be 1 or more"
+        self.parent_board = parent_board
+        self.batch_size = MAX_BATCH_SIZE if batch_size is None else batch_size
+        self.add_missing_labels = add_missing_labels
+        self.item_cost = None
+        self.requests = 0
+
+    @staticmethod
+    def alias(index) -> str:
+        return f"m{index}"
+
+    def mutation(self, row) -> ():
+        """ the update for one row, subitems are updated on the subitem board """
+        board_id = getattr(row, 'sub_board_id', None) or self.parent_board.board_id
+        labels = ', create_labels_if_missing: true' if self.add_missing_labels else ''
+        return f'change_multiple_column_values (item_id: {row.row_id}, board_id: {board_id}, ' \
+               f'column_values: $columnValues{labels}) {{id}}', ColumnValue.dumps(row.loaded_cells)
+
+    @staticmethod
+    def gen_batch(mutations) -> dict:
+        """
+        mutations is a list of (text, column values), $columnValues in the text is replaced by a variable for the
+        column values when there are column values.  returns one mutation with an alias for each of the mutations
+        """
+        declarations = []
+        variables = {}
+        aliased = []
+        for i, (text, column_values) in enumerate(mutations):
+            if column_values is not None:
+                declarations.append(f"$v{i}: JSON!")
+                variables[f"v{i}"] = column_values
+                text = text.replace('$columnValues', f"$v{i}")
+            aliased.append(f"{BatchUpdate.alias(i)}: {text}")
+
+        head = 'mutation'
+        if len(declarations) > 0:
+            head += f" ({', '.join(declarations)})"
+        query = {'query': head + ' { ' + ' '.join(aliased) + ' }'}
+        if len(variables) > 0:
+            query['variables'] = variables
+        return query
+
+    def size(self, first) -> int:
+        """ the number of mutations for the next request, limited by the complexity budget """
+        scheduler = self.parent_board.scheduler
+        if scheduler is None:
+            return self.batch_size
+        if self.item_cost is None:
+            self.item_cost = scheduler.estimate(self.gen_batch([first]))
+        budget = scheduler.budget(self.parent_board.monday_token)
+        allowed = int(budget.get('capacity') * BUDGET_SHARE / max(self.item_cost, 1))
+        return max(1, min(self.batch_size, allowed))
+
+    def learn(self, result: Result, count):
+        """ the complexity of a batch divided by its size is the cost of one mutation """
+        try:
+            complexity = result.data.get('data').get('complexity')
+            if complexity is not None and complexity.get('query') is not None and count > 0:
+                self.item_cost = int(complexity.get('query')) / count
+        except AttributeError:
+            pass
+
+    @staticmethod
+    def alias_errors(result: Result) -> dict:
+        """ error messages by alias, from the path of each graphql error """
+        errors = {}
+        if not isinstance(result.data, dict):
+            return errors
+        for error in result.data.get('errors') or []:
+            if not isinstance(error, dict):
+                continue
+            path = error.get('path') or []
+            if len(path) > 0:
+                errors.setdefault(str(path[0]), error.get('message'))
+        return errors
+
+    def send(self, mutations) -> [()]:
+        """ sends one batch, returns (item, None) or (None, error message) for each mutation """
+        result = self.parent_board.execute(self.gen_batch(mutations))
+        self.requests += 1
+        self.learn(result, len(mutations))
+
+        data = result.data.get('data') if isinstance(result.data, dict) else None
+        errors = self.alias_errors(result)
+        answers = []
+        for index in range(len(mutations)):
+            alias = self.alias(index)
+            item = data.get(alias) if isinstance(data, dict) else None
+            if isinstance(item, dict) and item.get('id') is not None:
+                answers.append((item, None))
+            else:
+                answers.append((None, errors.get(alias, result.message)))
+        return answers
+
+    def run(self, mutations: [()]) -> [()]:
+        """ sends the mutations in batches, the answers are in the same order as the mutations """
+        answers = []
+        start = 0
+        while start < len(mutations):
+            size = self.size(mutations[start])
+            answers.extend(self.send(mutations[start:start + size]))
+            start += size
+        return answers
+
+    @staticmethod
+    def modified_cells(row: Row) -> []:
+        return [cell for cell in row.loaded_cells if cell.modified and cell.value is not None]
+
+    @staticmethod
+    def mark_updated(row: Row):
+        for cell in row.loaded_cells:
+            if cell.modified:
+                cell.modified = False
+
+    def update(self, rows: [Row]) -> Result:
+        # failures are kept as (row, message), new rows do not have a row_id yet
+        outcome = BatchOutcome([], [], [], 0)
+        pending = []
+        for row in rows:
+            if not row.on_monday:
+                result = row.insert()
+                if result.is_ok():
+                    outcome.updated.append(row)
+                else:
+                    outcome.failed.append((row, result.message))
+                continue
+            if len(self.modified_cells(row)) == 0:
+                outcome.skipped.append(row)
+                continue
+            pending.append(row)
+
+        mutations = [self.mutation(row) for row in pending]
+        for row, (item, message) in zip(pending, self.run(mutations)):
+            if item is not None:
+                self.mark_updated(row)
+                outcome.updated.append(row)
+            else:
+                outcome.failed.append((row, message))
+                logging.warning(f"Update {row.row_id} failed: {message}")
+
+        if self.add_missing_labels and len(pending) > 0:
+            self.parent_board.schema_changed()
+        outcome = outcome._replace(requests=self.requests)
+        if len(outcome.failed) > 0:
+            return Result(-1, message=f"{len(outcome.failed)} of {len(rows)} rows were not updated", data=outcome)
+        return Result(0, data=outcome)
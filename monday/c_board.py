@@ -1,21 +1,32 @@
 """
 Board Class
 """
+import asyncio
+import copy
 import json
 import logging
 from datetime import datetime
 
 from conversion.c_format import Format
+from monday.c_batch_update import BatchUpdate, MAX_BATCH_SIZE
 from monday.c_column import Column
+from monday.c_filter import MondayFilter
+from monday.c_query_params import QueryParams
+from monday.c_complexity_scheduler import Priority
 from monday.c_required import RequiredElements
+from monday.c_response_cache import ResponseCache
+from monday.c_schema_cache import SchemaCache
 from monday.c_select import MondaySelect
+from monday.c_subitem_loader import SubItemLoader
+from monday.c_title import Title
+from monday.c_unit_of_work import UnitOfWork
 from monday.c_verify import VerifyBoard
 from result.c_result import Result
 
 from monday.c_cell import Cell
 from monday.c_functions import MondayFunctions
 from monday.c_row import Row
-from std_utility.c_datetime import DateTime
+from std_utility.c_datetime import DateTime, DateCache
 
 """
  Args:
@@ -26,6 +37,11 @@ from std_utility.c_datetime import DateTime
      monday_timeout_seconds: amount of time before we retry a request to monday. large monday boards may take up 
      to 60 seconds or more to load
      monday_account: If a monday token is not passed in, this account will be used to lookup access to a board
+     scheduler: optional ComplexityScheduler, queries wait for complexity budget before they are sent
+     priority: Priority.webhook, Priority.interactive or Priority.batch, used by the scheduler
+     schema_cache: optional SchemaCache, the columns and groups are read from disk instead of monday when cached
+     response_cache: optional ResponseCache, repeated reads within a few seconds are answered from memory
+     refresh_schema: read the columns and groups from monday even when the schema cache has them
 
  Raises:
      Unique Key Violation: Unable to load monday board
@@ -34,11 +50,28 @@ from std_utility.c_datetime import DateTime
 
 class Board(MondayFunctions):
     def __init__(self, board_id, monday_token, monday_timeout_seconds=5, monday_account=None, fields=None,
-                 verify_columns: [Column] = None, alert_to: [] = None):
+                 verify_columns: [Column] = None, alert_to: [] = None, scheduler=None, priority=Priority.interactive,
+                 schema_cache: SchemaCache = None, response_cache: ResponseCache = None, date_cache: DateCache = None,
+                 refresh_schema=False):
         assert board_id is not None, "Board ID is required to initialize a board"
 
         super().__init__(board_id, monday_token, monday_account, monday_timeout_seconds, fields)
 
+        # optional ComplexityScheduler shared by every board in the process, see MondayFactory
+        self.scheduler = scheduler
+        self.priority = priority
+
+        # optional on disk copy of the columns and groups, MONDAY_SCHEMA_CACHE_DIR turns it on for every board
+        self.schema_cache = schema_cache if schema_cache is not None else SchemaCache.from_environment()
+        if refresh_schema:
+            self.schema_changed()
+
+        # optional read-through cache for queries, mutations and webhooks remove the entries they change
+        self.response_cache = response_cache
+
+        # optional parsed dates shared by the date cells of the board, see DateCache
+        self.date_cache = date_cache
+
         self.was_altered = False
         self.missing_columns = []
         self.missing_labels = []
@@ -93,6 +126,7 @@ class Board(MondayFunctions):
                 load_subitems=False)
             new_row = new_rows[0]
             self.rows.append(new_row)
+            self.indexes.add(new_row)
             result.data = new_row
         return result
 
@@ -154,6 +188,90 @@ class Board(MondayFunctions):
 
         return response
 
+    def update_rows(self, rows: [Row] = None, batch_size=MAX_BATCH_SIZE, add_missing_labels=False) -> Result:
+        """
+        update many rows with one request per batch_size rows instead of one request per row.
+        the modified cells of each row are sent as one aliased mutation, cells are only marked as updated for the
+        rows monday updated, rows that are not on monday yet are inserted.  batches are made smaller when the
+        complexity budget can not pay for batch_size mutations.
+        returns a result with a BatchOutcome (updated rows, failed [(row, message)], skipped rows, requests)
+            Example: board.update_rows([row for row in board.rows if row.get('Status').modified])
+        """
+        if rows is None:
+            rows = self.rows
+        return BatchUpdate(self, batch_size, add_missing_labels).update(rows)
+
+    def clone(self) -> 'Board':
+        """
+        a new board for one request that shares the schema of this board, used instead of copy.deepcopy.
+        the columns, column and group maps and the board json are shared and must not be changed, the maps that
+        grow while rows are loaded are copied, rows, keys and pending changes start empty.
+            Example: board = MondayFactory().board(board_id).clone()
+        """
+        the_clone = copy.copy(self)
+        the_clone.indexes = self.indexes.empty_copy(the_clone)
+        the_clone.rows = []
+        the_clone._temp_rows = []
+        the_clone.row_multimap = {}
+        the_clone.row_key_map = {}
+        the_clone.row_titles = Title()
+        the_clone.monday_board_json = {}
+        the_clone.unit_of_work = None
+        the_clone.was_altered = False
+        the_clone.missing_columns = []
+        the_clone.missing_labels = []
+        the_clone.fields = list(self.fields or [])
+        the_clone.column_info_map = dict(self.column_info_map)
+        the_clone.column_info_sub_map = dict(self.column_info_sub_map)
+        the_clone.user_map = dict(self.user_map)
+        the_clone.email_map = dict(self.email_map)
+        the_clone.user_id_map = dict(self.user_id_map)
+        the_clone.set_col_map(the_clone.column_info_map)
+        return the_clone
+
+    def create_index(self, columns, unique=False, ordered=False) -> Result:
+        """
+        indexes the rows of the board on a column or on a list of columns, see BoardIndex.
+        unique=True returns an error when two rows have the same key, ordered=True makes a sorted index on a date or
+        number column for find_range.
+            Example: board.create_index(Key.unique(group_name=True, field_names=['Email']), unique=True)
+        """
+        return self.indexes.create(columns, unique=unique, ordered=ordered)
+
+    def find(self, column=None, value=None) -> [Row]:
+        """
+        the rows where the column has the value, a list of columns takes a list of values.  the column is indexed
+        the first time, after that a find is one lookup.
+            Example: rows = board.find(column='Email', value='someone@example.com')
+        """
+        return self.indexes.find(column, value)
+
+    def find_range(self, column, low=None, high=None) -> [Row]:
+        """ the rows with a date or number from low to high (both included) in order, None leaves a side open """
+        return self.indexes.find_range(column, low, high)
+
+    def find_row(self, row_id) -> Row:
+        """ the row with the item id or None """
+        return self.indexes.row(row_id)
+
+    def begin(self, batch_size=MAX_BATCH_SIZE, add_missing_labels=False) -> UnitOfWork:
+        """
+        start recording changes, from now on every row with a modified cell is written by flush().
+        returns the unit of work, use it to add new rows, subitems and deletes.
+        """
+        if self.unit_of_work is None:
+            self.unit_of_work = UnitOfWork(self, batch_size, add_missing_labels)
+        return self.unit_of_work
+
+    def flush(self) -> Result:
+        """
+        write the changes recorded since begin() with as few requests as possible, parents before subitems.
+        returns a result with a FlushOutcome (row, action, ok, message) for every change
+        """
+        if self.unit_of_work is None:
+            return Result(0, data=[])
+        return self.unit_of_work.flush()
+
     def update_column_in_group(self, group=None, column_name=None, column_values: [] = None, update_value: str = None):
         """
         update column in group
@@ -184,7 +302,13 @@ class Board(MondayFunctions):
                group=None,
                limit=100,
                update_rows=True,
-               q_filter=None) -> Result:
+               q_filter=None,
+               parallel=False,
+               max_workers=None,
+               where: MondayFilter = None,
+               server_filter=False,
+               with_subitems=False,
+               lazy=False) -> Result:
         """
         v4 select uses the new rate limiting model for monday.com to return and filter rows.
         groups may be passed as a single group name or an array of group names. If no group then all groups are processed.
@@ -192,21 +316,26 @@ class Board(MondayFunctions):
         col_name, and col_vals are used for filtering. if operator is specified, then it is used to compare each row
         against a row value and one of the comparison columns.  If any condition matches, the row is added to result
         set, if no operator then the row value in col_name must match one of the col_vals.
+        parallel reads the pages of each group on worker threads, max_workers groups at a time (default 4),
+        the rows are returned in the same order as a serial select.
+        where is an optional MondayFilter applied after the select, filters may be combined with & and |
+            Example: board.select(where=MondayFilter('Status', 'in', ['Done']) & MondayFilter('Numbers', '>', 5))
+        server_filter sends the col_name filter and the where filter to monday as query_params when monday can run
+        them, so rows we would throw away are never downloaded, anything monday can not run is filtered here.
+        with_subitems loads the subitems of the selected rows, one request for every 100 rows, see SubItemLoader.
+        lazy returns LazyRow rows, the cell for a column is created the first time the row is asked for it, use it
+        when only a few of the columns of each row are read or changed.
         """
         result = Result(-1, message="N/A")
 
-        if col_values is None and values is not None:
-            col_values = values
-
-        if groups is None and group is not None:
-            groups = group
-
-        if isinstance(groups, str):
-            groups = [groups]
+        if server_filter:
+            col_name, operator, col_values, q_filter, where = \
+                self._server_filter(col_name, operator, col_values if col_values is not None else values,
+                                    q_filter, where)
+            values = None
 
+        groups, col_values = self._select_args(groups, group, col_name, operator, col_values, values)
         select_rows = []
-        if groups is None and (operator is not None or col_name is None):
-            groups = MondaySelect.get_group_ids(self, groups)
 
         # ok we need to do this because the API does not allow selections and groups in the same query
         # if there is no group but there is a selection let monday do the work.
@@ -220,11 +349,28 @@ class Board(MondayFunctions):
                                         operator=operator,
                                         col_values=col_values,
                                         limit=limit,
-                                        q_filter=q_filter)
+                                        q_filter=q_filter,
+                                        lazy=lazy)
 
             if result.is_ok():
                 select_rows = result.data
 
+        elif parallel:
+            results = MondaySelect.groups_parallel(self,
+                                                   self.board_id,
+                                                   groups,
+                                                   fields=fields,
+                                                   col_name=col_name,
+                                                   operator=operator,
+                                                   col_values=col_values,
+                                                   limit=limit,
+                                                   q_filter=q_filter,
+                                                   lazy=lazy,
+                                                   max_workers=max_workers)
+            for result in results:
+                if result.is_ok():
+                    select_rows.extend(result.data)
+
         else:
             for group_id in groups:
                 result = MondaySelect.group(self,
@@ -235,7 +381,177 @@ class Board(MondayFunctions):
                                             operator=operator,
                                             col_values=col_values,
                                             limit=limit,
-                                            q_filter=q_filter)
+                                            q_filter=q_filter,
+                                            lazy=lazy)
+                if result.is_ok():
+                    select_rows.extend(result.data)
+
+        if where is not None:
+            select_rows = where.bind(self).apply(select_rows)
+
+        if with_subitems:
+            SubItemLoader(self).load(select_rows)
+
+        result.data = select_rows
+
+        if update_rows:
+            self.rows = select_rows
+
+        return result
+
+    def iter_select(self,
+                    groups=None,
+                    fields=None,
+                    col_name=None,
+                    operator=None,
+                    col_values=None,
+                    values=None,
+                    group=None,
+                    limit=100,
+                    q_filter=None,
+                    where: MondayFilter = None,
+                    server_filter=False,
+                    lazy=False):
+        """
+        same arguments as select, but returns a generator that yields the rows a page at a time as the cursors advance.
+        The rows are not stored in self.rows, use this for large boards so the whole board is never held in memory.
+            Example: for row in board.iter_select(groups='RTG', limit=500):
+                        ...
+        If monday returns an error the error is logged and an Exception is raised, the rows of the other groups are
+        not read.
+        lazy yields LazyRow rows, see select.
+        """
+        if server_filter:
+            col_name, operator, col_values, q_filter, where = \
+                self._server_filter(col_name, operator, col_values if col_values is not None else values,
+                                    q_filter, where)
+            values = None
+
+        groups, col_values = self._select_args(groups, group, col_name, operator, col_values, values)
+
+        if groups is None:
+            groups = [None]
+
+        for group_id in groups:
+            rows = MondaySelect.iter_group(self,
+                                           self.board_id,
+                                           groups=group_id,
+                                           fields=fields,
+                                           col_name=col_name,
+                                           operator=operator,
+                                           col_values=col_values,
+                                           limit=limit,
+                                           q_filter=q_filter,
+                                           lazy=lazy)
+            if where is not None:
+                rows = filter(where.bind(self).matches, rows)
+            yield from rows
+
+    def select_frame(self,
+                     groups=None,
+                     fields=None,
+                     group=None,
+                     limit=100,
+                     q_filter=None,
+                     parallel=False,
+                     max_workers=None,
+                     where: MondayFilter = None,
+                     server_filter=False) -> Result:
+        """
+        read only columnar load, returns a pandas DataFrame in result.data instead of rows, see BoardFrame.
+        No Row or Cell objects are created and self.rows is not changed, use it for reporting and analytics.
+            Example: frame = board.select_frame(fields=['Status', 'Date']).data
+        where is an optional MondayFilter, it is applied to the frame with a vectorised mask, with server_filter
+        the parts of where that monday can run are sent as query_params.
+        """
+        from monday.c_frame import BoardFrame
+
+        if server_filter:
+            _, _, _, q_filter, where = self._server_filter(q_filter=q_filter, where=where)
+
+        groups, _ = self._select_args(groups, group)
+        plans = [MondaySelect.plan(self, groups=group_id, fields=fields) for group_id in groups]
+        if parallel:
+            results = MondaySelect.fetch_parallel(self, self.board_id, plans, limit=limit, q_filter=q_filter,
+                                                  max_workers=max_workers)
+        else:
+            results = [MondaySelect.fetch(self, self.board_id, plan, limit=limit, q_filter=q_filter) for plan in plans]
+
+        items = []
+        for result in results:
+            if result.is_error():
+                return result
+            items.extend(result.data)
+
+        frame = BoardFrame.from_items(self, items, fields)
+        if where is not None:
+            frame = frame[where.bind(self).mask(frame)].reset_index(drop=True)
+        return Result(0, data=frame)
+
+    def _select_args(self, groups=None, group=None, col_name=None, operator=None, col_values=None, values=None):
+        """ accept both spellings of groups and values, returns the groups to loop through and the values """
+        if col_values is None and values is not None:
+            col_values = values
+
+        if groups is None and group is not None:
+            groups = group
+
+        if isinstance(groups, str):
+            groups = [groups]
+
+        if groups is None and (operator is not None or col_name is None):
+            groups = MondaySelect.get_group_ids(self, groups)
+
+        return groups, col_values
+
+    async def select_async(self,
+                           groups=None,
+                           fields=None,
+                           col_name=None,
+                           operator=None,
+                           col_values=None,
+                           values=None,
+                           group=None,
+                           limit=100,
+                           update_rows=True,
+                           q_filter=None,
+                           lazy=False) -> Result:
+        """
+        same as select, but the groups are read at the same time using execute_async, the rows are returned in
+        group order so the result matches select.  lazy returns LazyRow rows, see select.
+        """
+        result = Result(-1, message="N/A")
+
+        groups, col_values = self._select_args(groups, group, col_name, operator, col_values, values)
+        select_rows = []
+
+        if groups is None:
+            result = await MondaySelect.group_async(self,
+                                                    self.board_id,
+                                                    groups=None,
+                                                    fields=fields,
+                                                    col_name=col_name,
+                                                    operator=operator,
+                                                    col_values=col_values,
+                                                    limit=limit,
+                                                    q_filter=q_filter,
+                                                    lazy=lazy)
+            if result.is_ok():
+                select_rows = result.data
+
+        else:
+            results = await asyncio.gather(*[MondaySelect.group_async(self,
+                                                                      self.board_id,
+                                                                      groups=group_id,
+                                                                      fields=fields,
+                                                                      col_name=col_name,
+                                                                      operator=operator,
+                                                                      col_values=col_values,
+                                                                      limit=limit,
+                                                                      q_filter=q_filter,
+                                                                      lazy=lazy)
+                                             for group_id in groups])
+            for result in results:
                 if result.is_ok():
                     select_rows.extend(result.data)
 
@@ -246,29 +562,34 @@ class Board(MondayFunctions):
 
         return result
 
+    def _server_filter(self, col_name=None, operator=None, col_values=None, q_filter=None, where=None):
+        """ moves the filters monday can run into query_params, returns what is left for the client side filter.
+            a q_filter passed in by the caller is used as it is. """
+        if q_filter:
+            return col_name, operator, col_values, q_filter, where
+
+        params = QueryParams(self)
+        if col_name is not None and col_values is not None and params.add(col_name, operator, col_values):
+            col_name, operator, col_values = None, None, None
+        where = params.add_filter(where)
+        if col_name is not None and operator is None and len(params) > 0:
+            # query_params only work when we select by group, keep the col_name filter on the client
+            operator = 'in'
+        return col_name, operator, col_values, params.compile(), where
+
     def gen_filter(self, filters):
+        """ creates query_params for a list of (column name, values) filters, see QueryParams
+            Example: board.select(q_filter=board.gen_filter([('Status', ['Done', 'Stuck'])]))
+        """
+        params = QueryParams(self)
         if filters:
             if not isinstance(filters, list):
                 filters = [filters]
             for f in filters:
-                filter_col = f[0]
-                if filter_col not in self.col_map:
-                    continue
-                col_id = self.col_map[filter_col].id
-                label_map = self.col_map[filter_col].label_map
-                filter_values = f[1]
-                if not isinstance(filter_values, list):
-                    filter_values = [filter_values]
-                values = []
-                for f1 in filter_values:
-                    values.append(label_map[f1])
-
-            f_query = f', query_params: {{rules: [{{column_id: "{col_id}", compare_value: {values} }}]}}'
-        else:
-            f_query = ''
+                if not params.add(f[0], None, f[1]):
+                    logging.warning(f"Unable to filter on [{f[0]}] with {f[1]} using query_params")
 
-        print(f_query)
-        return f_query
+        return params.compile()
 
     def select_all_matching_callback(self, m_row, *args):
         col_name = args[0]
@@ -0,0 +1,329 @@
+"""
+BoardIndex: in memory indexes on the rows of a loaded board, so a lookup does not walk every row.
+
+    row_id      every board has a hash index on the item id, board.find_row(item_id) and delete() use it
+    hash        rows by the value of a column, or by the values of several columns ('Group Name' and 'Row Name' can
+                be used, the same names as Key.unique), unique=True does not allow two rows with the same key, a
+                row whose new value is the key of another row keeps its old key and a warning is logged
+    sorted      rows ordered by a date or number column for range lookups, dates are compared as timestamps and
+                numbers as floats, the same as MondayFilter
+
+The indexes are built the first time they are used after the rows of the board are replaced (select, load).  After
+that they are kept up to date: a row is indexed again when the value of one of its cells changes, rows added by
+add_row or a UnitOfWork are added and delete() removes its row.  Hash indexes compare the values as text.
+
+    Example: board.create_index('Email')
+             rows = board.find('Email', 'someone@example.com')
+             board.create_index(Key.unique(group_name=True, field_names=['Email']), unique=True)
+             rows = board.find(['Group Name', 'Email'], ['West', 'someone@example.com'])
+             board.create_index('Date', ordered=True)
+             rows = board.find_range('Date', '2024-01-01', '2024-01-31')
+"""
+import bisect
+import logging
+
+from monday.c_filter import DATE_TYPES, MondayFilter
+from result.c_result import Result
+from std_utility.c_datetime import DateTime
+
+GROUP_NAME = 'Group Name'
+ROW_NAME = 'Row Name'
+
+
+def column_value(row, column):
+    if column == GROUP_NAME:
+        return row.group_name
+    if column == ROW_NAME:
+        return row.row_name
+    cell = row.find_cell(column)
+    return None if cell is None else cell.value
+
+
+def remove_row(rows: list, row):
+    """ removes the row itself, rows do not compare by value """
+    for i in range(len(rows)):
+        if rows[i] is row:
+            del rows[i]
+            return True
+    return False
+
+
+class HashIndex:
+    def __init__(self, columns, unique=False):
+        self.columns = tuple(columns)
+        self.unique = unique
+        self._rows = {}         # key -> rows with the key
+        self._keys = {}         # id(row) -> key of the row
+
+    @staticmethod
+    def text(value):
+        if value is None:
+            return None
+        if isinstance(value, DateTime):
+            return value.to_str()
+        return str(value)
+
+    def lookup_key(self, value):
+        if len(self.columns) == 1:
+            return self.text(value)
+        assert isinstance(value, (list, tuple)) and len(value) == len(self.columns), \
+            f"A value is needed for each of {list(self.columns)}"
+        return tuple(self.text(v) for v in value)
+
+    def key(self, row):
+        if len(self.columns) == 1:
+            return self.text(column_value(row, self.columns[0]))
+        key = tuple(self.text(column_value(row, column)) for column in self.columns)
+        return None if None in key else key
+
+    def add(self, row) -> Result:
+        key = self.key(row)
+        if key is None:
+            return Result(0)
+        rows = self._rows.get(key)
+        if rows is None:
+            self._rows[key] = [row]
+        elif self.unique:
+            return Result(-1, message=f"Duplicate key {key} for {list(self.columns)} in row [{row.row_name}]")
+        else:
+            rows.append(row)
+        self._keys[id(row)] = key
+        return Result(0)
+
+    def remove(self, row):
+        key = self._keys.pop(id(row), None)
+        if key is None:
+            return
+        rows = self._rows.get(key)
+        remove_row(rows, row)
+        if len(rows) == 0:
+            self._rows.pop(key)
+
+    def update(self, row) -> Result:
+        """ a unique index keeps the row under its old key when another row has the new key """
+        old_key = self._keys.get(id(row))
+        key = self.key(row)
+        if old_key == key:
+            return Result(0)
+        if self.unique and key is not None and key in self._rows:
+            return Result(-1, message=f"Duplicate key {key} for {list(self.columns)} in row [{row.row_name}], "
+                                      f"the row is still indexed as {old_key}")
+        self.remove(row)
+        return self.add(row)
+
+    def get(self, value) -> list:
+        return list(self._rows.get(self.lookup_key(value), ()))
+
+    def clear(self):
+        self._rows = {}
+        self._keys = {}
+
+
+class SortedIndex:
+    def __init__(self, column, is_date=False):
+        self.columns = (column,)
+        self.unique = False
+        self.is_date = is_date
+        self._sort_keys = []    # sorted keys, _sorted_rows[i] has _sort_keys[i]
+        self._sorted_rows = []
+        self._keys = {}         # id(row) -> key of the row
+
+    def sort_key(self, value):
+        """ the key for a cell value or for a bound of a range """
+        if value is None or value == '':
+            return None
+        if self.is_date or isinstance(value, DateTime):
+            try:
+                return (value if isinstance(value, DateTime) else DateTime(value)).as_timestamp
+            except AttributeError:
+                # DateTime could not parse the text
+                return None
+        return MondayFilter.to_number(value)
+
+    def key(self, row):
+        return self.sort_key(column_value(row, self.columns[0]))
+
+    def add(self, row) -> Result:
+        key = self.key(row)
+        if key is None:
+            return Result(0)
+        position = bisect.bisect_right(self._sort_keys, key)
+        self._sort_keys.insert(position, key)
+        self._sorted_rows.insert(position, row)
+        self._keys[id(row)] = key
+        return Result(0)
+
+    def build(self, rows):
+        """ adds many rows with one sort instead of one insert each """
+        keyed = [(key, row) for key, row in ((self.key(row), row) for row in rows) if key is not None]
+        keyed.sort(key=lambda pair: pair[0])
+        self._sort_keys = [key for key, _ in keyed]
+        self._sorted_rows = [row for _, row in keyed]
+        self._keys = {id(row): key for key, row in keyed}
+
+    def remove(self, row):
+        key = self._keys.pop(id(row), None)
+        if key is None:
+            return
+        start = bisect.bisect_left(self._sort_keys, key)
+        end = bisect.bisect_right(self._sort_keys, key)
+        for i in range(start, end):
+            if self._sorted_rows[i] is row:
+                del self._sort_keys[i]
+                del self._sorted_rows[i]
+                return
+
+    def update(self, row) -> Result:
+        if self._keys.get(id(row)) == self.key(row):
+            return Result(0)
+        self.remove(row)
+        return self.add(row)
+
+    def range(self, low=None, high=None) -> list:
+        """ the rows from low to high, both included, in order """
+        start = 0 if low is None else bisect.bisect_left(self._sort_keys, self.sort_key(low))
+        end = len(self._sort_keys) if high is None else bisect.bisect_right(self._sort_keys, self.sort_key(high))
+        return self._sorted_rows[start:end]
+
+    def clear(self):
+        self._sort_keys = []
+        self._sorted_rows = []
+        self._keys = {}
+
+
+class BoardIndex:
+    def __init__(self, board):
+        self.board = board
+        self.indexes = {}       # (kind, columns) -> HashIndex or SortedIndex
+        self._row_ids = {}      # str(row_id) -> row
+        self._members = {}      # id(row) -> the rows in the indexes
+        self._stale = True
+
+    def empty_copy(self, board) -> 'BoardIndex':
+        """ the same indexes for another board, without rows """
+        copy = BoardIndex(board)
+        for name, index in self.indexes.items():
+            copy.indexes[name] = HashIndex(index.columns, index.unique) if isinstance(index, HashIndex) \
+                else SortedIndex(index.columns[0], index.is_date)
+        return copy
+
+    @staticmethod
+    def columns(columns) -> tuple:
+        return (columns,) if isinstance(columns, str) else tuple(columns)
+
+    def check_columns(self, columns):
+        for column in columns:
+            assert column in (GROUP_NAME, ROW_NAME) or column in self.board.column_info_map, \
+                f"Unable to index column [{column}], it is not on board {self.board.board_id}"
+
+    def reset(self):
+        """ the rows of the board were replaced, the indexes are built again when they are next used """
+        self._stale = True
+
+    def ensure(self):
+        if self._stale or len(self._members) != len(self.board.rows):
+            self.rebuild()
+
+    def rebuild(self):
+        self._stale = False
+        self._row_ids = {}
+        self._members = {}
+        for index in self.indexes.values():
+            index.clear()
+        for row in self.board.rows:
+            self._track(row)
+        for index in self.indexes.values():
+            for error in self._fill(index):
+                logging.warning(error.message)
+
+    def _fill(self, index) -> [Result]:
+        if isinstance(index, SortedIndex):
+            index.build(self._members.values())
+            return []
+        return [result for result in (index.add(row) for row in self._members.values()) if result.is_error()]
+
+    def _track(self, row):
+        self._members[id(row)] = row
+        if row.row_id is not None:
+            self._row_ids[str(row.row_id)] = row
+
+    def create(self, columns, unique=False, ordered=False) -> Result:
+        """ adds an index, a unique index is not added when two rows have the same key """
+        columns = self.columns(columns)
+        self.check_columns(columns)
+        if ordered:
+            assert len(columns) == 1, "A sorted index has one column"
+            column = self.board.column_info_map.get(columns[0])
+            index = SortedIndex(columns[0], is_date=column is not None and column.type in DATE_TYPES)
+        else:
+            index = HashIndex(columns, unique)
+        name = ('sorted' if ordered else 'hash', columns)
+        if name in self.indexes and self.indexes[name].unique == index.unique:
+            return Result(0, data=self.indexes[name])
+
+        self.ensure()
+        errors = self._fill(index)
+        if len(errors) > 0:
+            return Result(-1, message=f"Unable to create a unique index on {list(columns)}: {errors[0].message}",
+                          data=[error.message for error in errors])
+        self.indexes[name] = index
+        return Result(0, data=index)
+
+    def drop(self, columns, ordered=False):
+        self.indexes.pop(('sorted' if ordered else 'hash', self.columns(columns)), None)
+
+    def index(self, columns, ordered=False):
+        """ the index on the columns, a non unique one is created when there is none """
+        columns = self.columns(columns)
+        index = self.indexes.get(('sorted' if ordered else 'hash', columns))
+        if index is None:
+            index = self.create(columns, ordered=ordered).data
+        else:
+            self.ensure()
+        return index
+
+    def find(self, columns, value) -> list:
+        return self.index(columns).get(value)
+
+    def find_range(self, column, low=None, high=None) -> list:
+        return self.index(column, ordered=True).range(low, high)
+
+    def row(self, row_id):
+        self.ensure()
+        return self._row_ids.get(str(row_id))
+
+    def add(self, row) -> Result:
+        """ a row was added to board.rows """
+        if self._stale:
+            return Result(0)
+        self._track(row)
+        return self._each(row, 'add')
+
+    def update(self, row) -> Result:
+        """ a value of a row in board.rows changed """
+        if self._stale or id(row) not in self._members:
+            return Result(0)
+        if row.row_id is not None:
+            self._row_ids[str(row.row_id)] = row
+        return self._each(row, 'update')
+
+    def remove(self, row):
+        """ a row was removed from board.rows """
+        if self._members.pop(id(row), None) is None:
+            return
+        if row.row_id is not None and self._row_ids.get(str(row.row_id)) is row:
+            self._row_ids.pop(str(row.row_id))
+        for index in self.indexes.values():
+            index.remove(row)
+
+    def _each(self, row, action) -> Result:
+        result = Result(0)
+        for index in self.indexes.values():
+            index_result = getattr(index, action)(row)
+            if index_result.is_error():
+                logging.warning(index_result.message)
+                result = index_result
+        return result
+
+    def stats(self) -> dict:
+        return {'rows': len(self._members), 'indexes': [(kind, list(columns)) for kind, columns in self.indexes]}
@@ -1,10 +1,12 @@
 """
 MondayCallbacks optimization of Monday Calls
 """
+import asyncio
 import logging
 
 from monday.c_query import MondayQuery
 from monday.c_query_helper import QueryHelper
+from monday.c_query_templates import QueryTemplates
 from result.c_result import Result
 
 
@@ -16,37 +18,40 @@ class MondayCallBacks(MondayQuery):
         """
         read a row
             Note: this will only return the data from the fields list if supplied.
+        """
+        query = self.rows_query(row_id, fields=fields)
+        return self.execute(query)
+
+    async def load_rows_from_monday_async(self, row_id, fields=None) -> Result:
+        query = self.rows_query(row_id, fields=fields)
+        return await self.execute_async(query)
+
+    def rows_query(self, row_id, fields=None) -> dict:
+        """
+        create the query to read a row
+            Note: this will only return the data from the fields list if supplied.
         Args:
             row_id:
             fields: can be a str for a single field name or a list of field names
 
         Returns:
-            Result:
+            dict: the query
 
         """
         if isinstance(row_id, list):
             assert len(row_id) < 101, "As of 10/3/2022 Monday limits us to 100 item ids being returned."
 
-        view = QueryHelper.gen_view(fields)
-        item_ids = QueryHelper.monday_format_list(row_id)
+        if isinstance(row_id, str):
+            row_id = [i.strip() for i in row_id.split(',') if i.strip()]
+        elif not isinstance(row_id, list):
+            row_id = [row_id]
+        if fields is None and self.has_fields:
+            fields = self.field_ids
+        elif isinstance(fields, str):
+            fields = [fields]
         logging.debug(f"Loading board [{self.board_id}] getting a row [{row_id}] ")
 
-        cmd = """
-                  query 
-                  {
-                        items (ids: [ITEM_IDS ] limit: 100) { name id assets {public_url file_extension name}
-                        VIEW {id column {title} text }
-                        group {id title} }
-                   }
-              """\
-            .replace('BOARD_ID', str(self.board_id))\
-            .replace("ITEM_IDS", str(item_ids))\
-            .replace('VIEW', view)
-
-        cmd = self.add_fields_to_query(query=cmd)
-        query = self.gen_query(cmd)
-        result = self.execute(query)
-        return result
+        return QueryTemplates.query('rows', ids=row_id, fields=fields)
 
     def _load_rows(self, ids: [], fields=None) -> []:
         logging.debug(f"loading [{len(ids)}] Monday rows")
@@ -81,6 +86,33 @@ class MondayCallBacks(MondayQuery):
 
         return n_rows
 
+    async def _load_rows_async(self, ids: [], fields=None) -> []:
+        ids_str = str(ids).replace('[', '').replace(']', '').replace("'", "")
+        result = await self.load_rows_from_monday_async(ids_str, fields=fields)
+        if result.is_error():
+            raise Exception(f"Unable to load monday board error = {result.status.message}")
+        return self.create_rows_from_json(result.data)
+
+    async def load_rows_async(self, ids: [], fields=None) -> []:
+        """
+        same as load_rows, but every block of 100 ids is requested at the same time.
+        the rows are returned in the same order as load_rows.
+        """
+        blocks = [ids[i:i + 100] for i in range(0, len(ids), 100)]
+        logging.debug(f"loading [{len(ids)}] Monday rows in [{len(blocks)}] async requests")
+        results = await asyncio.gather(*[self._load_rows_async(block, fields=fields) for block in blocks])
+        n_rows = []
+        for rows in results:
+            n_rows.extend(rows)
+        return n_rows
+
+    async def load_row_async(self, row_id, fields=None) -> []:
+        fields = QueryHelper.get_field_ids(self, fields=fields)
+        result = await self.load_rows_from_monday_async(row_id, fields=fields)
+        if result.is_error():
+            raise Exception(f"Unable to load monday board error = {result.status.message}")
+        return self.create_rows_from_json(result.data)
+
     def load_row(self, row_id, fields=None) -> []:
         fields = QueryHelper.get_field_ids(self, fields=fields)
         result = self.load_rows_from_monday(row_id, fields=fields)
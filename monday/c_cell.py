@@ -22,16 +22,21 @@ T = TypeVar("T")
 
 
 class Cell:
-    def __init__(self, row):
+    # a board has a cell for every row and column, slots keep them small.  type, labels, has_labels and index
+    # are read from the shared column unless they are set on the cell.
+    __slots__ = ('row', 'column', 'row_id', 'id', '_index', '_type', 'value2', '_has_labels', '_labels',
+                 'previous_value', 'db_name', '_value', '_modified', '_name', 'source', 'parent_row')
+
+    def __init__(self, row=None, column: Column = None):
         self.row = row
-        self.board = row.board
+        self.column = column
         self.row_id = None
         self.id = None
-        self.index = None
+        self._index = None
         self._type = None
         self.value2 = None
-        self.has_labels = False
-        self.labels = []
+        self._has_labels = None
+        self._labels = None
         self.previous_value = None
         self.db_name = None
         self._value: T = None
@@ -40,6 +45,40 @@ class Cell:
         self.source = None
         self.parent_row = None
 
+    @property
+    def board(self):
+        return None if self.row is None else self.row.board
+
+    @property
+    def index(self):
+        if self._index is None and self.column is not None:
+            return self.column.index
+        return self._index
+
+    @index.setter
+    def index(self, x):
+        self._index = x
+
+    @property
+    def labels(self):
+        if self._labels is None:
+            return [] if self.column is None else self.column.labels
+        return self._labels
+
+    @labels.setter
+    def labels(self, x):
+        self._labels = x
+
+    @property
+    def has_labels(self):
+        if self._has_labels is None:
+            return False if self.column is None else self.column.has_labels
+        return self._has_labels
+
+    @has_labels.setter
+    def has_labels(self, x):
+        self._has_labels = x
+
     def init(self, row_id: str = '', c_value: object = None, column_info: Column = Column()):
         self.row_id = row_id
         self.id = column_info.id
@@ -63,6 +102,23 @@ class Cell:
         self.previous_value = None
         return self
 
+    @staticmethod
+    def from_json(row, column: Column, column_info: Column, cell_json: dict):
+        """ a cell for one of the column_values of an item, the names come from the column instead of being
+            converted again for every cell """
+        new_cell = Cell(row, column_info)
+        new_cell.source = cell_json
+        new_cell.row_id = row.row_id
+        new_cell.id = cell_json.get('id')
+        new_cell._name = column.name
+        new_cell.db_name = column.db_name
+        new_cell.parent_row = row
+        if column_info.type == 'date' or column_info.type == 'datetime':
+            new_cell._value = DateTime.from_text(cell_json.get('text', '1970-01-01 00:00:00'), row.board.date_cache)
+        else:
+            new_cell._value = cell_json.get('text')
+        return new_cell
+
     @property
     def name(self):
         """ The cell name = column name shown on the Monday board."""
@@ -77,6 +133,8 @@ class Cell:
     @property
     def type(self):
         """ Get the cell type, can be text, number, people, date, _datetime, status or dropdown."""
+        if self._type is None and self.column is not None:
+            return self.column.type
         return self._type
 
     @type.setter
@@ -97,6 +155,11 @@ class Cell:
     @modified.setter
     def modified(self, x: bool = False):
         """Set the modified flag (True or False)"""
+        if x and not self._modified and self.row is not None:
+            # the board records the row when it has a unit of work, see Board.begin
+            unit_of_work = getattr(self.row.board, 'unit_of_work', None)
+            if unit_of_work is not None:
+                unit_of_work.track(self.row)
         self._modified: bool = x
 
     @property
@@ -109,7 +172,7 @@ class Cell:
         """Set the cell value, also copies the current value to the modified value, if different modified flag set."""
 
         # store the date time parts if datetime
-        if self._type == 'date' or self._type == 'datetime':
+        if self.type == 'date' or self.type == 'datetime':
             if not isinstance(new_value, DateTime):
                 new_value: DateTime = DateTime(new_value)
             if self._value is not None:
@@ -122,13 +185,13 @@ class Cell:
                 else:
                     self._type = 'date'
 
-        if self._type == 'boolean' and isinstance(self._value, str):
+        if self.type == 'boolean' and isinstance(self._value, str):
             if self._value == 'v':
                 self._value = True
             else:
                 self._value = False
 
-        if self._type != 'dropdown' and self.has_labels and self._value is not None:
+        if self.type != 'dropdown' and self.has_labels and self._value is not None:
             if new_value not in self.labels and new_value != '':
                 logging.warning(f"Cell Skipped, {self.name} [{new_value}] can not be found in [{self.labels}]")
                 return
@@ -136,6 +199,10 @@ class Cell:
         self._value = new_value
         if str(self.previous_value) != str(self._value):
             self.modified = True
+            # the board's indexes follow the value, see BoardIndex
+            reindex = getattr(self.row, 'reindex', None)
+            if reindex is not None:
+                reindex()
 
         self.previous_value = self._value
 
@@ -180,7 +247,7 @@ class Cell:
         """
 
         try:
-            if self._type != 'file':
+            if self.type != 'file':
                 msg = "Only cells of type 'file' can be downloaded"
                 return Result(-1, message=msg, data=[])
 
@@ -248,7 +315,7 @@ class Cell:
                    }
         """
 
-        if self._type != 'file':
+        if self.type != 'file':
             logging.info("Only cells of type 'file' can be downloaded")
             return []
 
@@ -283,7 +350,7 @@ class Cell:
         return self.board.monday_delete_files(self.board.board_id, self.row_id, self.id)
 
     def upload_file(self, file_path, is_buffered=False, data=None) -> Result:
-        if self._type != 'file':
+        if self.type != 'file':
             return Result(-1, message="Only cells of type 'file' can be uploaded to")
         return self.board.upload_file(self.parent_row.row_id, self.id, file_path,
                                       is_buffered=is_buffered, data=data)
@@ -7,11 +7,16 @@
 import json
 
 import logging
+from conversion.c_format import Format
 from std_utility.c_utility import Utility
 
 
 class Column:
+    __slots__ = ('label_map', 'settings', 'index', 'id', 'name', 'type', 'labels', 'big_name', '_names')
+
     def __init__(self, c_index=None, c_id=None, c_name=None, c_type=None, c_labels=None):
+        self.big_name = None
+        self._names = None
         self.label_map = None
         self.settings = None
         if c_labels is None:
@@ -27,6 +32,24 @@ class Column:
         """True if the cell has labels."""
         return len(self.labels) > 0
 
+    @property
+    def db_name(self):
+        """ the snake case name, the same as Cell.db_name for the cells of this column """
+        return self._cached_names()[1]
+
+    @property
+    def field_name(self):
+        """ the attribute name used for the column in row.readonly and row.title """
+        return self._cached_names()[2]
+
+    def _cached_names(self):
+        # every row has a cell for the column, the names are made once and again only when the name changes
+        names = self._names
+        if names is None or names[0] != self.name:
+            names = (self.name, Format(self.name).snake_case, Utility.db_name(self.name))
+            self._names = names
+        return names
+
     def init(self, c_index, c_id, c_name, c_type, c_labels):
         """initialize the column
 
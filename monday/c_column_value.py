@@ -0,0 +1,164 @@
+"""
+ColumnValue: builds the column_values payload for monday mutations from cells.
+
+Each modified cell becomes one dict entry, the value is shaped by the column type, and the whole payload is encoded
+with a single json.dumps.  The payload is sent as a GraphQL variable, so values are never pasted into the query
+text and do not need escaping.
+
+    status / color      {"label": "Done"}
+    dropdown            {"labels": ["A", "B"]}  (a string is sent as it is)
+    date                {"date": "2024-01-31"}
+    datetime            {"date": "2024-01-31", "time": "13:45:00"}
+    checkbox / boolean  {"checked": "true"}
+    link                {"url": "https://...", "text": "title"}
+    people              {"personsAndTeams": [{"id": 123, "kind": "person"}]}  (names and emails are looked up on the board)
+    numbers / numeric   "42"
+    everything else     the value as a string
+
+    Example: variables = {'columnValues': ColumnValue.dumps(row.cells)}
+             mutation ($columnValues: JSON!) { change_multiple_column_values (..., column_values: $columnValues) {id} }
+"""
+import json
+import logging
+
+from monday.c_cell import Cell
+from std_utility.c_datetime import DateTime
+
+
+class ColumnValue:
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def date_str(value) -> str:
+        if isinstance(value, DateTime):
+            return value.to_date_str()
+        return str(value)
+
+    @staticmethod
+    def people(value, lookup_user_id=None) -> dict:
+        """ ids, user names or email addresses, lookup_user_id finds the id for a name or an email """
+        if isinstance(value, dict):
+            return value
+        if isinstance(value, str):
+            value = [v.strip() for v in value.split(',') if v.strip()]
+        if not isinstance(value, (list, tuple)):
+            value = [value]
+        persons = []
+        for person in value:
+            if isinstance(person, dict):
+                persons.append(person)
+                continue
+            if isinstance(person, int) or str(person).isdigit():
+                person_id = int(person)
+            else:
+                person_id = None if lookup_user_id is None else lookup_user_id(str(person))
+            if person_id is None:
+                raise ValueError(f"Unable to find the monday user [{person}]")
+            persons.append({'id': person_id, 'kind': 'person'})
+        return {'personsAndTeams': persons}
+
+    @staticmethod
+    def link(cell: Cell):
+        if not isinstance(cell.source, dict):
+            return None
+        text = cell.value2
+        if text is None or len(str(text)) == 0:
+            text = cell.source.get('title')
+        if text is None:
+            return None
+        return {'url': cell.value, 'text': text}
+
+    @staticmethod
+    def datetime(cell: Cell):
+        return {'date': cell.value.to_date_str(), 'time': cell.value.to_time_str()}
+
+    @staticmethod
+    def checkbox(cell: Cell):
+        return {'checked': 'true' if cell.value is True else 'false'}
+
+    @staticmethod
+    def date(cell: Cell):
+        return {'date': ColumnValue.date_str(cell.value)}
+
+    @staticmethod
+    def label(cell: Cell):
+        return {'label': cell.value} if isinstance(cell.value, str) else str(cell.value)
+
+    @staticmethod
+    def dropdown(cell: Cell):
+        if isinstance(cell.value, (list, tuple)):
+            return {'labels': [str(v) for v in cell.value]}
+        return str(cell.value)
+
+    @staticmethod
+    def person(cell: Cell):
+        if cell.value == '':
+            return str(cell.value)
+        return ColumnValue.people(cell.value, getattr(cell.board, 'lookup_user_id', None))
+
+    @staticmethod
+    def number(cell: Cell):
+        if isinstance(cell.value, float) and cell.value.is_integer():
+            return str(int(cell.value))
+        return str(cell.value)
+
+    @staticmethod
+    def cell_value(cell: Cell):
+        """ returns the value monday expects for the cell type, or None when the cell can not be sent """
+        convert = CONVERTERS.get(cell.type)
+        if convert is None:
+            return str(cell.value)
+        return convert(cell)
+
+    @staticmethod
+    def column_values(cells) -> dict:
+        """ the payload for the modified cells, keyed by column id """
+        payload = {}
+        if cells is None:
+            return payload
+        for cell in cells:
+            if not cell.modified or cell.value is None:
+                continue
+            try:
+                value = ColumnValue.cell_value(cell)
+            except Exception as ex:
+                logging.error(f"Unable to convert [{cell.name}] value [{cell.value}]: {ex}")
+                continue
+            if value is not None:
+                payload[cell.id] = value
+        return payload
+
+    @staticmethod
+    def dict_values(q_data: dict) -> dict:
+        """ the payload for a dict of column id / value pairs, values are sent as strings """
+        if q_data is None:
+            return {}
+        return {col_id: value if isinstance(value, dict) else str(value)
+                for col_id, value in q_data.items() if value is not None}
+
+    @staticmethod
+    def payload(q_data) -> dict:
+        """ the payload for a list of cells or a dict of column id / value pairs """
+        if isinstance(q_data, dict):
+            return ColumnValue.dict_values(q_data)
+        return ColumnValue.column_values(q_data)
+
+    @staticmethod
+    def dumps(q_data) -> str:
+        return json.dumps(ColumnValue.payload(q_data))
+
+
+# one lookup per cell, columns without a converter are sent as strings
+CONVERTERS = {'link': ColumnValue.link,
+              'datetime': ColumnValue.datetime,
+              'boolean': ColumnValue.checkbox,
+              'checkbox': ColumnValue.checkbox,
+              'date': ColumnValue.date,
+              'color': ColumnValue.label,
+              'status': ColumnValue.label,
+              'dropdown': ColumnValue.dropdown,
+              'multiple-person': ColumnValue.person,
+              'people': ColumnValue.person,
+              'numeric': ColumnValue.number,
+              'numbers': ColumnValue.number}
@@ -0,0 +1,293 @@
+"""
+  ***********************************************
+    ComplexityScheduler: a process wide scheduler that keeps us inside the Monday.com complexity budget.
+
+    Every query is sent with a complexity { before after query reset_in_x_seconds } field, the scheduler reads
+    it on every response and tracks the remaining budget for each monday token.  Before a query is sent it must
+    be admitted, queries are admitted in priority order (webhooks before interactive work before batch syncs)
+    and only when the token bucket has enough budget for the estimated cost of the query, so we wait before
+    hitting the 4000 error instead of after.
+
+        Example: scheduler = ComplexityScheduler()
+                 ticket = scheduler.acquire(token, query, priority=Priority.webhook)
+                 ... send the query ...
+                 scheduler.release(ticket, result)
+
+    A ticket that is given up before it is admitted must be cancelled, scheduler.cancel(ticket), otherwise the
+    queries behind it wait for it forever.
+
+    Boards created through MondayFactory share the scheduler, MondayConnection.execute calls acquire and release.
+        scheduler.budget(token)   -> {'remaining': 9950000, 'capacity': 10000000, 'reset_in_seconds': 41}
+        scheduler.queue_depth     -> number of queries waiting for budget
+  ***********************************************
+"""
+import heapq
+import itertools
+import logging
+import re
+import threading
+from time import monotonic
+
+from cache.c_singleton import Singleton
+
+DEFAULT_CAPACITY = 10000000        # complexity points per token per window
+DEFAULT_WINDOW_SECONDS = 60        # the budget is fully restored after this many seconds
+DEFAULT_QUERY_COST = 100000        # estimate used until we have seen the real cost of a query
+MAX_WAIT_SECONDS = 1.0             # waiting queries re-check the budget at least this often
+
+COMPLEXITY_FIELD = ' complexity { before after query reset_in_x_seconds } '
+
+
+class Priority:
+    webhook = 0
+    interactive = 1
+    batch = 2
+
+
+class Ticket:
+    def __init__(self, token, cost, priority, key, seq):
+        self.token = token
+        self.cost = cost
+        self.priority = priority
+        self.key = key
+        self.seq = seq
+        self.admitted = False
+
+    def __lt__(self, other):
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class ComplexityBudget:
+    """ token bucket for one monday token, refilled over time and corrected by every response """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, window_seconds=DEFAULT_WINDOW_SECONDS):
+        self.capacity = capacity
+        self.window_seconds = window_seconds
+        self.remaining = float(capacity)
+        self.rate = capacity / window_seconds
+        self.reset_at = None
+        self.held = False       # the server said the budget is used up, nothing comes back before reset_at
+        self.updated = monotonic()
+
+    def refill(self, now=None):
+        if now is None:
+            now = monotonic()
+        if self.reset_at is not None and now >= self.reset_at:
+            self.remaining = float(self.capacity)
+            self.reset_at = None
+            self.held = False
+            self.rate = self.capacity / self.window_seconds
+        elif self.held:
+            self.remaining = 0.0
+        else:
+            self.remaining = min(float(self.capacity), self.remaining + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def observe(self, after, reset_in_seconds=None):
+        """ the server told us what is left, refill so we are full again when the server resets """
+        now = monotonic()
+        self.refill(now)
+        self.remaining = float(after)
+        self.held = False
+        if reset_in_seconds is not None and reset_in_seconds > 0:
+            self.reset_at = now + reset_in_seconds
+            self.rate = max(self.capacity - self.remaining, 0) / reset_in_seconds
+
+    def exhausted(self, reset_in_seconds):
+        """ a 4000 error, the budget stays empty until the server resets it """
+        self.observe(0, reset_in_seconds)
+        self.held = self.reset_at is not None
+
+    def seconds_until(self, cost):
+        """ seconds until the bucket holds cost points """
+        missing = cost - self.remaining
+        if missing <= 0:
+            return 0.0
+        if self.held:
+            return max(self.reset_at - monotonic(), 0.0)
+        if self.rate <= 0:
+            return MAX_WAIT_SECONDS
+        return missing / self.rate
+
+    @property
+    def reset_in_seconds(self):
+        if self.reset_at is None:
+            return 0
+        return max(int(self.reset_at - monotonic()), 0)
+
+
+@Singleton
+class ComplexityScheduler(object):
+    def __init__(self, capacity=DEFAULT_CAPACITY, window_seconds=DEFAULT_WINDOW_SECONDS,
+                 default_cost=DEFAULT_QUERY_COST):
+        self.capacity = capacity
+        self.window_seconds = window_seconds
+        self.default_cost = default_cost
+        self.enabled = True
+        self._condition = threading.Condition()
+        self._budgets = {}
+        self._waiting = {}
+        self._costs = {}
+        self._seq = itertools.count()
+        self.admitted = 0
+        self.delayed = 0
+        self.exhausted_count = 0
+
+    # shared by every board, copies of a board keep using the same scheduler
+    __cache_shared__ = True
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    @staticmethod
+    def with_complexity(query):
+        """ adds the complexity field to a query so the response tells us the budget that is left """
+        if not isinstance(query, dict):
+            return query
+        text = query.get('query')
+        if not isinstance(text, str) or 'complexity' in text:
+            return query
+        end = text.rfind('}')
+        if end < 0:
+            return query
+        query = dict(query)
+        query['query'] = text[:end] + COMPLEXITY_FIELD + text[end:]
+        return query
+
+    @staticmethod
+    def query_key(query) -> str:
+        """ queries that only differ by ids share a cost estimate """
+        text = query.get('query') if isinstance(query, dict) else query
+        return re.sub(r'\d+', '#', str(text)[:400])
+
+    def _budget(self, token) -> ComplexityBudget:
+        budget = self._budgets.get(token)
+        if budget is None:
+            budget = ComplexityBudget(self.capacity, self.window_seconds)
+            self._budgets[token] = budget
+        return budget
+
+    def estimate(self, query) -> int:
+        return self._costs.get(self.query_key(query), self.default_cost)
+
+    def enqueue(self, token, query=None, priority=Priority.interactive, cost=None) -> Ticket:
+        key = self.query_key(query)
+        with self._condition:
+            if cost is None:
+                cost = self._costs.get(key, self.default_cost)
+            # a single query can never cost more than the whole budget
+            cost = min(cost, self.capacity)
+            ticket = Ticket(token, cost, priority, key, next(self._seq))
+            heapq.heappush(self._waiting.setdefault(token, []), ticket)
+            return ticket
+
+    def try_admit(self, ticket: Ticket):
+        """ returns None when the ticket is admitted, otherwise the number of seconds to wait """
+        with self._condition:
+            return self._try_admit(ticket)
+
+    def _try_admit(self, ticket: Ticket):
+        if ticket.admitted:
+            return None
+        waiting = self._waiting.get(ticket.token)
+        budget = self._budget(ticket.token)
+        budget.refill()
+        if not self.enabled or (waiting[0] is ticket and budget.remaining >= ticket.cost):
+            waiting.remove(ticket)
+            heapq.heapify(waiting)
+            budget.remaining -= ticket.cost
+            ticket.admitted = True
+            self.admitted += 1
+            self._condition.notify_all()
+            return None
+        if waiting[0] is ticket:
+            return min(budget.seconds_until(ticket.cost), MAX_WAIT_SECONDS)
+        return MAX_WAIT_SECONDS
+
+    def cancel(self, ticket: Ticket):
+        """ removes a ticket that will not be sent, the queries behind it are no longer waiting for it """
+        if ticket is None:
+            return
+        with self._condition:
+            waiting = self._waiting.get(ticket.token)
+            if not ticket.admitted and waiting is not None and ticket in waiting:
+                waiting.remove(ticket)
+                heapq.heapify(waiting)
+            self._condition.notify_all()
+
+    def acquire(self, token, query=None, priority=Priority.interactive, cost=None) -> Ticket:
+        """ blocks until the query can be sent without running out of budget """
+        ticket = self.enqueue(token, query, priority, cost)
+        try:
+            with self._condition:
+                wait_seconds = self._try_admit(ticket)
+                if wait_seconds is not None:
+                    self.delayed += 1
+                    logging.debug(f"Waiting for complexity budget, cost [{ticket.cost}], priority [{priority}]")
+                while wait_seconds is not None:
+                    self._condition.wait(timeout=wait_seconds)
+                    wait_seconds = self._try_admit(ticket)
+        except BaseException:
+            self.cancel(ticket)
+            raise
+        return ticket
+
+    def release(self, ticket: Ticket, result):
+        """ reads the complexity field (or the 4000 error) from the result and corrects the budget """
+        if ticket is None:
+            return
+        with self._condition:
+            budget = self._budget(ticket.token)
+            try:
+                # errors can come with data as well, a partly applied mutation is still charged
+                complexity = None
+                if isinstance(result.data, dict) and isinstance(result.data.get('data'), dict):
+                    complexity = result.data.get('data').get('complexity')
+                if complexity is not None:
+                    budget.observe(complexity.get('after'), complexity.get('reset_in_x_seconds'))
+                    if complexity.get('query') is not None:
+                        self._costs[ticket.key] = int(complexity.get('query'))
+                elif result.is_ok():
+                    pass
+                elif result.status.code == 4000:
+                    self.exhausted_count += 1
+                    budget.exhausted(int(result.data) + 1)
+                else:
+                    # the query was not charged, give back the estimate
+                    budget.remaining = min(float(budget.capacity), budget.remaining + ticket.cost)
+            except Exception as ex:
+                logging.warning(f"Unable to read complexity from the result: {ex}")
+            self._condition.notify_all()
+
+    def budget(self, token) -> dict:
+        with self._condition:
+            budget = self._budget(token)
+            budget.refill()
+            return {'remaining': int(budget.remaining),
+                    'capacity': budget.capacity,
+                    'reset_in_seconds': budget.reset_in_seconds}
+
+    @property
+    def queue_depth(self) -> int:
+        with self._condition:
+            return sum(len(waiting) for waiting in self._waiting.values())
+
+    @property
+    def stats(self) -> dict:
+        return {'admitted': self.admitted,
+                'delayed': self.delayed,
+                'exhausted': self.exhausted_count,
+                'queue_depth': self.queue_depth,
+                'tokens': len(self._budgets)}
+
+    def reset(self):
+        with self._condition:
+            self._budgets = {}
+            self._costs = {}
+            self.admitted = 0
+            self.delayed = 0
+            self.exhausted_count = 0
+            self._condition.notify_all()
@@ -3,12 +3,19 @@
 """
 from time import sleep, time
 
+from monday.c_complexity_scheduler import Priority
+from monday.c_response_cache import ResponseCache
 from networking.c_requests import Network
 from result.c_result import Result
 from status.c_status import Status
 from std_errors.c_ecode import Ecode
 import logging
 
+MAX_RETRIES = 5
+WAIT_SECONDS_FOR_RETRY = 2.5
+COMPLEXITY_ERROR_CODE = 'ComplexityException'
+DEFAULT_RESET_SECONDS = '60'
+
 
 class MondayConnection(object):
     def __init__(self, board_id, monday_token, monday_account, monday_timeout_seconds=5):
@@ -18,47 +25,127 @@ class MondayConnection(object):
         self.headers = {"Authorization": self.monday_token, "API-Version": "2023-10"}
         self.col_map = None
         self.monday_timeout_seconds = monday_timeout_seconds
+        self.scheduler = None
+        self.priority = Priority.interactive
+        self.response_cache = None
 
     # execute any query and get a response from monday returns a result and status
     def execute(self, query, files=None) -> Result:
         logging.debug(f"ready to execute query = [{query}]")
-        if files is not None:
-            api_endpoint = 'https://api.monday.com/v2/file'
-        else:
-            api_endpoint = 'https://api.monday.com/v2/'
+        cached = self.cached_response(query, files)
+        if cached is not None:
+            return cached
+
+        request = query
+        api_endpoint = self.api_endpoint(files)
+        query = self.scheduled_query(query, files)
 
         result = Result()
         try:
-            wait_seconds_for_retry = 2.5
             retry_count = 0
             try_again = True
-            while retry_count < 5 and try_again:
-                r = None
-                template = 'time()# {:0.2f}, clock()# {:0.2f}'
+            while retry_count < MAX_RETRIES and try_again:
+                ticket = None
+                if self.scheduler is not None:
+                    ticket = self.scheduler.acquire(self.monday_token, query, priority=self.priority)
                 start = time()
-                r = Network.post(api_endpoint, data=query, headers=self.headers,
-                                 timeout=self.monday_timeout_seconds, files=files)
+                try:
+                    r = Network.post(api_endpoint, headers=self.headers, timeout=self.monday_timeout_seconds,
+                                     files=files, **self.request_body(query))
+                    result = MondayConnection.check_response(r)
+                finally:
+                    self.release(ticket, result)
                 end = time()
                 logging.debug(f'Completed Monday.com request in {round(end - start, 3)} seconds')
-                result = MondayConnection.check_response(r)
-                if result.status.is_error():
-                    if result.status.code == 4000:
-                        logging.info(f"Complexity budget exhausted, Sleeping for {int(result.data)} seconds")
-                        sleep(int(result.data) + 1)
-                        retry_count += 1
-                        try_again = True
-                    else:
-                        retry_count += 1
-                        try_again = True
-                        logging.error(f"retry count = [{retry_count}], {result.status.message}")
-                        sleep(wait_seconds_for_retry)
-                else:
-                    try_again = False
+                wait_seconds = self.retry_wait_seconds(result, retry_count)
+                try_again = wait_seconds is not None
+                if try_again:
+                    retry_count += 1
+                    sleep(self.scheduled_wait_seconds(result, wait_seconds))
 
         except Exception as ex:
             logging.error(ex)
             result.status = Status(2003, ex)
 
+        return self.cache_response(request, self.check_result(result), files)
+
+    async def execute_async(self, query, files=None) -> Result:
+        """ same as execute, but does not block the event loop, see AsyncMondayConnection """
+        from monday.c_async_connection import AsyncMondayConnection
+        return await AsyncMondayConnection(self).execute(query, files=files)
+
+    def scheduled_query(self, query, files=None):
+        """ adds the complexity field the scheduler reads, file uploads are sent as they are """
+        if self.scheduler is None or files is not None:
+            return query
+        return self.scheduler.with_complexity(query)
+
+    def cached_response(self, query, files=None):
+        """ the cached result of a read, None when there is no cache or the query has to be sent """
+        if self.response_cache is None or files is not None:
+            return None
+        return self.response_cache.get(self.monday_token, query)
+
+    def cache_response(self, query, result: Result, files=None) -> Result:
+        """ reads are added to the cache, a mutation removes what it may have changed """
+        if self.response_cache is None:
+            return result
+        if ResponseCache.is_mutation(query):
+            self.response_cache.invalidate_query(query, board_id=self.board_id)
+        elif files is None:
+            self.response_cache.put(self.monday_token, query, result, board_id=self.board_id)
+        return result
+
+    def release(self, ticket, result: Result):
+        if self.scheduler is not None and ticket is not None:
+            self.scheduler.release(ticket, result)
+
+    def scheduled_wait_seconds(self, result: Result, wait_seconds):
+        """ with a scheduler the next acquire waits for the budget to reset, no need to sleep here as well """
+        if self.scheduler is not None and result.status.code == 4000:
+            return 0
+        return wait_seconds
+
+    @staticmethod
+    def request_body(query) -> dict:
+        """ queries with graphql variables are sent as json, everything else is sent as form data """
+        if isinstance(query, dict) and query.get('variables') is not None:
+            return {'json': query}
+        return {'data': query}
+
+    @staticmethod
+    def api_endpoint(files=None) -> str:
+        if files is not None:
+            return 'https://api.monday.com/v2/file'
+        return 'https://api.monday.com/v2/'
+
+    @staticmethod
+    def retry_wait_seconds(result: Result, retry_count=0):
+        """ returns the number of seconds to wait before trying again or None if we are done. """
+        if not result.status.is_error():
+            return None
+
+        if result.status.code == 4000:
+            logging.info(f"Complexity budget exhausted, Sleeping for {int(result.data)} seconds")
+            return int(result.data) + 1
+
+        if MondayConnection.partial_data(result):
+            logging.error(f"Request was partly applied, not trying again: {result.status.message}")
+            return None
+
+        logging.error(f"retry count = [{retry_count + 1}], {result.status.message}")
+        return WAIT_SECONDS_FOR_RETRY
+
+    @staticmethod
+    def partial_data(result: Result) -> bool:
+        """ True when monday answered with errors and data, some of the request was applied.  The complexity field
+            the scheduler asks for is not part of the request """
+        if not isinstance(result.data, dict) or not isinstance(result.data.get('data'), dict):
+            return False
+        return any(key != 'complexity' for key in result.data.get('data'))
+
+    def check_result(self, result: Result) -> Result:
+        """ checks a completed request for access to the board and logs the complexity used """
         if result.is_ok():
             try:
                 # check for access, no boards means no access
@@ -82,8 +169,34 @@ class MondayConnection(object):
 
         return result
 
-        # check response and return results, status
+    @staticmethod
+    def connection_stats() -> dict:
+        """ counters for pooled connections, new vs reused, shared by every board in this process """
+        return Network.stats()
 
+    @staticmethod
+    def complexity_reset_seconds(error_json: dict):
+        """ the seconds until the budget resets when monday reports a complexity error, otherwise None.
+            Only the errors are read, every scheduled query asks for the complexity field so the body always has
+            the word in it """
+        timeout = None
+        errors = error_json.get('errors')
+        for error in errors if isinstance(errors, list) else []:
+            message = error.get('message') if isinstance(error, dict) else error
+            extensions = error.get('extensions') if isinstance(error, dict) else None
+            code = extensions.get('code') if isinstance(extensions, dict) else None
+            if code != COMPLEXITY_ERROR_CODE and 'complexity budget exhausted' not in str(message).lower():
+                continue
+            timeout = DEFAULT_RESET_SECONDS
+            if 'reset in' in str(message):
+                x = str(message).split()
+                timeout = x[len(x) - 2]
+                break
+        if timeout is None and error_json.get('error_code') == COMPLEXITY_ERROR_CODE:
+            timeout = DEFAULT_RESET_SECONDS
+        return timeout
+
+    # check response and return results, status
     @staticmethod
     def check_response(r):
         error = None
@@ -110,21 +223,13 @@ class MondayConnection(object):
             logging.exception(ex, exc_info=True)
 
         if isinstance(error_text, dict):
-            error_messages = error_text.get('errors')
-            if 'complexity' in r.text.lower():
-                error_code = 4000
-                error_txt = ''
-                timeout = 60
-                for m in error_messages:
-                    error_txt += f"{m}\n"
-                    the_message = m
-                    if the_message is not None and 'reset in' in the_message:
-                        break_on_next = False
-                        x = the_message.split()
-                        timeout = x[len(x) - 2]
-                        retval = Result(error_code, message=error_txt, log=True, data=timeout)
+            timeout = MondayConnection.complexity_reset_seconds(error_text)
+            if timeout is not None and not MondayConnection.partial_data(Result(data=error_text)):
+                error_txt = ''.join(f"{m}\n" for m in error_text.get('errors') or [])
+                retval = Result(4000, message=error_txt, log=True, data=timeout)
             else:
-                retval = Result(4001, message=r.text, log=True)
+                # keep the json, mutations sent as aliases return data for the aliases that worked
+                retval = Result(4001, message=r.text, log=True, data=error_text)
 
         else:
             retval = Result(code=r.status_code, message=str(r.json()), log=True)
@@ -2,6 +2,7 @@
 MondayCore  Class that holds core data structures for use.
 """
 from conversion.c_format import Format
+from monday.c_board_index import BoardIndex
 from monday.c_connection import MondayConnection
 import logging
 from std_utility.c_datetime import DateTime
@@ -11,6 +12,8 @@ from std_utility.c_utility import Utility
 from monday.c_cell import Cell
 from monday.c_column import Column
 from monday.c_row import Row
+from monday.c_subitem_loader import SubItemLoader
+from monday.c_title import Title
 
 
 class MondayCore(MondayConnection):
@@ -19,6 +22,7 @@ class MondayCore(MondayConnection):
 
         self.name = None
         self.permissions = None
+        self.indexes = BoardIndex(self)
         self.rows = []
 
         self.board_info_json = {}
@@ -30,12 +34,27 @@ class MondayCore(MondayConnection):
         self.row_key_map = {}
         self.user_map = {}
         self.email_map = {}
+        self.user_id_map = {}
         self.row_multimap = {}
+        self.row_titles = Title()
+        self.schema_cache = None
+        self.date_cache = None
+        self.unit_of_work = None
         if fields is None:
             self.fields = []
         else:
             self.fields = fields
 
+    @property
+    def rows(self):
+        return self._rows
+
+    @rows.setter
+    def rows(self, rows):
+        """ the indexes are built again the next time they are used """
+        self._rows = rows
+        self.indexes.reset()
+
     @property
     def field_ids(self):
         ids = []
@@ -142,11 +161,11 @@ class MondayCore(MondayConnection):
                 new_cell.id = 'name'
                 new_cell.name = self.column_id_map.get(new_cell.id).name
                 new_cell.labels = self.column_id_map.get(new_cell.id).labels
-                new_cell.value = new_row.row_name
+                # set directly, the value setter marks the cell modified and a unit of work would track the row
+                new_cell._value = new_row.row_name
                 new_cell.type = 'text'
                 new_cell.index = len(columns_json) + 1
                 new_cell.parent_row = new_row
-                new_cell.modified = False
                 new_cell.previous_value = new_cell.value
                 new_row.cells.append(new_cell)
                 new_row.cell_map[new_cell.name] = new_cell
@@ -173,13 +192,12 @@ class MondayCore(MondayConnection):
                     # Utility.clean_name(this_cell.get('title'))
 
                     column_info: Column = self.column_info_map.get(new_cell.name)
-                    new_cell.type = column_info.type
-                    new_cell.labels = column_info.labels
-                    new_cell.index = column_info.index
+                    # type, labels, has_labels and index are read from the shared column
+                    new_cell.column = column_info
                     new_cell.parent_row = new_row
-                    new_cell.has_labels = column_info.has_labels
                     if column_info.type == 'date' or column_info.type == 'datetime':
-                        new_cell._value = DateTime(this_cell.get('text', '1970-01-01 00:00:00'))
+                        new_cell._value = DateTime.from_text(this_cell.get('text', '1970-01-01 00:00:00'),
+                                                             self.date_cache)
                     else:
                         new_cell._value = this_cell.get('text')
                     new_cell._modified = False
@@ -192,9 +210,6 @@ class MondayCore(MondayConnection):
 
                     if new_cell.id == 'subitems' or new_cell.id == 'subitems2':
                         new_row.has_subitems = True
-                        sub_id = new_cell.id
-                        if load_subitems:
-                            new_row.load_sub_items(sub_id)
 
                 new_row.cell_db_map = new_row.update_cell_db_map()
 
@@ -203,6 +218,10 @@ class MondayCore(MondayConnection):
         except KeyError as ex:
             logging.error(ex)
 
+        # one request for the subitems of every 100 rows instead of two requests per row
+        if load_subitems:
+            SubItemLoader(self).load(rows)
+
         return rows
 
     # def process_rows(self, items):
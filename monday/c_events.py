@@ -112,6 +112,7 @@ class NewItem:
 class MondayEvent:
     def __init__(self, data: dict = None):
         self.type = data.get('type')
+        self.data = None
 
         if self.type == EVENT_UPDATE_COLUMN_VALUE:
             self.data = UpdateColumnValue(data)
@@ -0,0 +1,252 @@
+"""
+MondayFilter: compiled client side filters for rows and frames.
+
+The operator and the values are prepared once when the filter is created: date values are parsed to timestamps,
+numbers are converted for numeric columns and 'in' lists become sets, so each row only costs a lookup and a compare.
+Filters can be combined with & (and) and | (or).
+
+    operators: None or 'in' (value is one of the values), 'not in', '=', '!=', '>', '<', '>=', '<=' (true when the
+               compare matches any of the values) and 'between' (values are [low, high], both included)
+
+    Example: f = MondayFilter('Status', 'in', ['Done', 'Stuck']) & MondayFilter('Date', 'between', ['2024-01-01', '2024-02-01'])
+             rows = f.apply(board.rows)
+             frame = frame[f.mask(frame)]
+"""
+import copy
+import logging
+import operator as op
+
+from std_utility.c_datetime import DateTime
+
+DATE_TYPES = ('date', 'datetime')
+NUMERIC_TYPES = ('numeric', 'numbers')
+
+COMPARE = {'=': op.eq, '!=': op.ne, '>': op.gt, '<': op.lt, '>=': op.ge, '<=': op.le}
+OPERATORS = ('in', 'not in', 'between') + tuple(COMPARE.keys())
+
+
+class MondayFilter:
+    def __init__(self, col_name=None, operator=None, col_values=None, col_type=None):
+        if operator is None:
+            operator = 'in'
+        operator = operator.strip().lower()
+        assert operator in OPERATORS, f"Unsupported filter operator [{operator}]"
+
+        if col_values is None:
+            col_values = []
+        if not isinstance(col_values, (list, tuple, set)):
+            col_values = [col_values]
+        if operator == 'between':
+            assert len(col_values) == 2, "between needs a low and a high value"
+
+        self.col_name = col_name
+        self.operator = operator
+        self.col_values = list(col_values)
+        self.col_type = col_type
+        self._compare = COMPARE.get(operator)
+        self._compile()
+
+    def _compile(self):
+        self._values = [self._prepare(v) for v in self.col_values]
+        self._value_set = None
+        self._text_set = None
+        if self.operator in ('in', 'not in'):
+            try:
+                self._value_set = set(self.col_values)
+            except TypeError:
+                self._value_set = None
+        if self.operator in ('=', '!='):
+            self._text_set = {str(v) for v in self._values}
+
+    def bind(self, parent_board):
+        """ returns a copy with the column type from the board when the type was not given, the filter itself is
+            not changed so it can be used with boards that have other column types """
+        if self.col_type is None and parent_board is not None:
+            column = parent_board.column_info_map.get(self.col_name)
+            if column is not None and column.type is not None:
+                bound = copy.copy(self)
+                bound.col_type = column.type
+                bound._compile()
+                return bound
+        return self
+
+    def __and__(self, other):
+        return FilterGroup('and', [self, other])
+
+    def __or__(self, other):
+        return FilterGroup('or', [self, other])
+
+    @property
+    def col_names(self):
+        return {self.col_name}
+
+    @property
+    def is_date(self):
+        return self.col_type in DATE_TYPES
+
+    @property
+    def is_numeric(self):
+        return self.col_type in NUMERIC_TYPES
+
+    def _prepare(self, value):
+        """ converts a value from the filter to the type we compare with, this is done once per filter """
+        if self.operator in ('in', 'not in'):
+            return value
+        if self.is_date or isinstance(value, DateTime):
+            if isinstance(value, DateTime):
+                return value.as_timestamp
+            return DateTime(value).as_timestamp
+        if self.is_numeric and self.operator not in ('=', '!='):
+            return MondayFilter.to_number(value)
+        return value
+
+    def _item(self, value):
+        """ converts a row value to the type we compare with """
+        if isinstance(value, DateTime):
+            return value.as_timestamp
+        if self.is_numeric and self.operator not in ('in', 'not in', '=', '!='):
+            return MondayFilter.to_number(value)
+        return value
+
+    @staticmethod
+    def to_number(value):
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+    def test(self, value) -> bool:
+        """ True if a single value passes the filter """
+        if self.operator == 'in':
+            return self._contains(value)
+        if self.operator == 'not in':
+            return not self._contains(value)
+        if self.operator == '=':
+            return str(self._item(value)) in self._text_set
+        if self.operator == '!=':
+            return str(self._item(value)) not in self._text_set
+
+        item = self._item(value)
+        if item is None:
+            return False
+        try:
+            if self.operator == 'between':
+                return self._values[0] <= item <= self._values[1]
+            for val in self._values:
+                if val is not None and self._compare(item, val):
+                    return True
+        except TypeError as ex:
+            logging.warning(f"Unable to compare [{item}] {self.operator} {self._values}: {ex}")
+        return False
+
+    def _contains(self, value):
+        if self._value_set is not None:
+            try:
+                return value in self._value_set
+            except TypeError:
+                pass
+        return value in self.col_values
+
+    def matches(self, row) -> bool:
+        return self.test(MondayFilter.row_value(row, self.col_name))
+
+    @staticmethod
+    def row_value(row, col_name):
+        cell = row.find_cell(col_name)
+        if cell is None:
+            cell = row.get(col_name)
+        return cell.value
+
+    def apply(self, rows) -> []:
+        """ returns the rows that pass the filter, in the same order """
+        if rows is None:
+            return []
+        col_name = self.col_name
+        test = self.test
+        result = []
+        for row in rows:
+            cell = row.find_cell(col_name)
+            if cell is None:
+                cell = row.get(col_name)
+            if test(cell.value):
+                result.append(row)
+        return result
+
+    def mask(self, frame):
+        """ returns a boolean Series for a DataFrame from Board.select_frame """
+        import pandas as pd
+
+        column = frame[self.col_name]
+        if self.operator in ('in', 'not in'):
+            result = column.isin(self.col_values)
+            return ~result if self.operator == 'not in' else result
+
+        values = self._values
+        is_datetime = pd.api.types.is_datetime64_any_dtype(column)
+        if is_datetime:
+            values = [None if v is None else pd.Timestamp(v, unit='ms') for v in values]
+        elif self.is_numeric and self.operator not in ('=', '!='):
+            column = pd.to_numeric(column, errors='coerce')
+
+        if self.operator in ('=', '!='):
+            result = column.isin(values) if is_datetime else column.astype(str).isin(self._text_set)
+            return ~result if self.operator == '!=' else result
+
+        if self.operator == 'between':
+            return column.between(values[0], values[1])
+
+        result = pd.Series(False, index=frame.index)
+        for val in values:
+            if val is not None:
+                result |= self._compare(column, val).fillna(False).astype(bool)
+        return result
+
+    @staticmethod
+    def for_board(parent_board, col_name, operator=None, col_values=None):
+        """ creates a filter using the column type from the board """
+        return MondayFilter(col_name, operator, col_values).bind(parent_board)
+
+
+class FilterGroup(MondayFilter):
+    """ filters combined with and / or """
+
+    def __init__(self, join='and', filters=None):
+        self.join = join
+        self.filters = []
+        for f in filters or []:
+            if isinstance(f, FilterGroup) and f.join == join:
+                self.filters.extend(f.filters)
+            else:
+                self.filters.append(f)
+
+    def bind(self, parent_board):
+        return FilterGroup(self.join, [f.bind(parent_board) for f in self.filters])
+
+    @property
+    def col_names(self):
+        names = set()
+        for f in self.filters:
+            names |= f.col_names
+        return names
+
+    def apply(self, rows) -> []:
+        if rows is None:
+            return []
+        return [row for row in rows if self.matches(row)]
+
+    def matches(self, row) -> bool:
+        if self.join == 'and':
+            return all(f.matches(row) for f in self.filters)
+        return any(f.matches(row) for f in self.filters)
+
+    def mask(self, frame):
+        result = None
+        for f in self.filters:
+            m = f.mask(frame)
+            if result is None:
+                result = m
+            elif self.join == 'and':
+                result = result & m
+            else:
+                result = result | m
+        return result
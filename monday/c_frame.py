@@ -0,0 +1,73 @@
+"""
+BoardFrame: read only columnar snapshot of a board.
+
+The items_page json goes straight into one list per column and then into a pandas DataFrame, no Row or Cell objects
+are created.  Date columns are parsed once per column and numbers are converted to floats, so filtering and
+aggregation can use pandas.  The frame has the columns row_id, group_id and group_name followed by the board
+columns using the same names as row.get(), missing values are None, NaN or NaT.
+
+    Example: frame = board.select_frame(groups='RTG').data
+             frame[frame['Status'] == 'Done'].groupby('group_name').size()
+"""
+from conversion.c_format import Format
+from monday.c_column import Column
+
+META_COLUMNS = ['row_id', 'group_id', 'group_name']
+DATE_TYPES = ('date', 'datetime')
+NUMERIC_TYPES = ('numeric', 'numbers')
+
+
+class BoardFrame:
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def frame_columns(parent_board, fields=None) -> [Column]:
+        """ the board columns in board order, limited to fields (names or ids) when fields are given """
+        columns = list(parent_board.column_id_map.values())
+        if fields:
+            if isinstance(fields, str):
+                fields = [fields]
+            wanted = set(fields)
+            columns = [c for c in columns if c.id == 'name' or c.id in wanted or c.name in wanted]
+        return columns
+
+    @staticmethod
+    def from_items(parent_board, items, fields=None):
+        """ creates a DataFrame from items_page json items """
+        import pandas as pd
+
+        columns = BoardFrame.frame_columns(parent_board, fields)
+        data = {name: [] for name in META_COLUMNS}
+        by_id = {}
+        for column in columns:
+            data[column.name] = []
+            by_id[column.id] = data[column.name]
+        name_values = by_id.pop('name', None)
+
+        for item in items:
+            group = item.get('group', {})
+            data['row_id'].append(item.get('id'))
+            data['group_id'].append(group.get('id'))
+            data['group_name'].append(Format(group.get('title')).name)
+            if name_values is not None:
+                name_values.append(Format.as_ascii(item.get('name')))
+
+            count = len(data['row_id'])
+            for value in item.get('column_values', []):
+                values = by_id.get(value.get('id'))
+                if values is not None:
+                    values.append(value.get('text'))
+            # keep every column the same length when monday leaves a value out
+            for values in by_id.values():
+                if len(values) < count:
+                    values.append(None)
+
+        frame = pd.DataFrame(data)
+        for column in columns:
+            if column.type in DATE_TYPES:
+                frame[column.name] = pd.to_datetime(frame[column.name].replace('', None),
+                                                    format='ISO8601', errors='coerce')
+            elif column.type in NUMERIC_TYPES:
+                frame[column.name] = pd.to_numeric(frame[column.name].replace('', None), errors='coerce')
+        return frame
@@ -48,7 +48,7 @@ class MondayFunctions(MondayCallBacks):
         and allow for easy lookup from display column name to internal cryptic id (ids are needed for everything)
         """
         # load columns and group info
-        result = self.load_column_and_group_info_as_json()
+        result = self.load_schema()
         if result.is_ok():
             #     return result
             #     raise Exception(f"Unable to load monday board error = {result.status.message}")
@@ -77,6 +77,19 @@ class MondayFunctions(MondayCallBacks):
 
         return result
 
+    def load_schema(self) -> Result:
+        """ gets the column and group json from the schema cache if there is one, otherwise from monday """
+        if self.schema_cache is not None:
+            board_info_json = self.schema_cache.get_schema(self.board_id, self.monday_token)
+            if board_info_json is not None:
+                logging.debug(f"Loaded the schema for board {self.board_id} from the schema cache")
+                return Result(0, data=board_info_json)
+
+        result = self.load_column_and_group_info_as_json()
+        if result.is_ok() and self.schema_cache is not None:
+            self.schema_cache.put_schema(self.board_id, self.monday_token, result.data)
+        return result
+
     def sub_item_add_row(self, parent_row=None, sub_row_dict: dict = None):
         assert parent_row is not None, "Parent Row is required to add a sub item row"
         assert sub_row_dict is not None or not isinstance(sub_row_dict, dict), "Missing data for the sub item row"
@@ -142,8 +155,17 @@ class MondayFunctions(MondayCallBacks):
             for u in result.data:
                 self.user_map[u.get('name')] = u.get('email')
                 self.email_map[u.get('email')] = u.get('name')
+                if u.get('id') is not None:
+                    self.user_id_map[u.get('name')] = int(u.get('id'))
+                    self.user_id_map[u.get('email')] = int(u.get('id'))
         return result
 
+    def lookup_user_id(self, name):
+        """ the monday user id for a user name or email address, None when there is no such user """
+        if len(self.user_id_map) == 0:
+            self.load_all_users()
+        return self.user_id_map.get(name)
+
     def update_single_column(self, row_id=None, column_name: str = '', column_value: str = '') -> Result:
         """ Note if you call this function with no column value the column will be emptied.
                   Function is used to update a single column value for a row, such as a status or a dropdown.
@@ -86,23 +86,28 @@ class Key:
                 _key = Key.assemble_key_part(_key, "Row Name", str(a_row.row_name))
                 key_column_names.remove('Row Name')
 
+            # the key columns by lower case name, each cell is matched with one lookup
+            wanted = {}
+            for _key_column_name in key_column_names:
+                wanted.setdefault(str(_key_column_name).lower(), []).append(_key_column_name)
+
             for _cell in a_row.cells:
-                column_name = _cell.name.lower()
+                if len(wanted) == 0:
+                    break
 
                 # a cell with no value can not have a key part
                 if _cell.value is None:
                     continue
 
-                # for each key column name see if there is a match
-                for _key_column_name in key_column_names:
-                    the_key_part = str(_key_column_name).lower()
-                    if the_key_part == column_name:
-                        key_count += 1
-                        # get the key column value ready for use
-                        key_column_value = str(_cell.value).lower()
-                        _key = Key.assemble_key_part(_key, _key_column_name, key_column_value)
-                        key_column_names.remove(_key_column_name)
-                        break
+                names = wanted.get(_cell.name.lower())
+                if names is not None:
+                    _key_column_name = names.pop(0)
+                    if len(names) == 0:
+                        wanted.pop(_cell.name.lower())
+                    key_count += 1
+                    # get the key column value ready for use
+                    key_column_value = str(_cell.value).lower()
+                    _key = Key.assemble_key_part(_key, _key_column_name, key_column_value)
         except Exception as ex:
             logging.warning(ex)
             pass
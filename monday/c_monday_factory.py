@@ -1,31 +1,52 @@
 """
 MondayFactory class
 """
-import copy
+import asyncio
+import functools
 from collections import namedtuple
 from time import sleep
 
 from cache.c_cached_resource import CachedResource
+from cache.c_single_flight import SingleFlight
 from cache.c_singleton import Singleton
 from conversion.c_conversion import Conversion
 from monday._monday_token import MONDAY_TOKEN
 from monday.c_board import Board
 from monday.c_column import Column
+from monday.c_complexity_scheduler import ComplexityScheduler, Priority
+from monday.c_response_cache import ResponseCache
+from networking.c_requests import Network
 import logging
 
 MondayCache = namedtuple('MondayCache', 'board_id timestamp monday')
 
+FACTORY_MAX_ENTRIES = 500       # boards and tokens kept by the factory, the least recently used is dropped first
+LOAD_RETRIES = 5
+LOAD_RETRY_SECONDS = 20
+
 
 @Singleton
 class MondayFactory(CachedResource):
-    def __init__(self, enable_cache=True, cache_expire_seconds=14400):
-        super().__init__(enable_cache=enable_cache, expire_seconds=cache_expire_seconds)
+    def __init__(self, enable_cache=True, cache_expire_seconds=14400, cache_max_entries=FACTORY_MAX_ENTRIES,
+                 cache_max_bytes=None):
+        # bounded so a long running worker that touches many boards keeps a steady memory footprint
+        super().__init__(enable_cache=enable_cache, expire_seconds=cache_expire_seconds,
+                         max_entries=cache_max_entries, max_bytes=cache_max_bytes)
 
         self.expire_seconds = cache_expire_seconds
 
+        # every board from the factory shares one complexity budget per token
+        self.scheduler = ComplexityScheduler()
+
+        # optional, shared by every board from the factory, MONDAY_RESPONSE_CACHE_SIZE turns it on
+        self.response_cache = ResponseCache.from_environment()
+
+        # threads that ask for a board that is not cached wait for one load instead of each loading it
+        self.loads = SingleFlight()
+
     def board(self, board_id, make_copy=False, fields: [] = None,
               monday_token=None, monday_timeout_seconds=5, monday_account=None,
-              verify_columns: [Column] = None, alert_to: [] = None, clear_cache=False) -> Board:
+              verify_columns: [Column] = None, alert_to: [] = None, clear_cache=False, priority=None) -> Board:
 
         """ gets a monday board with the board_id,
             if copy is set to true, return a copy of the board.  This is useful if you need to have multiple operations
@@ -34,6 +55,8 @@ class MondayFactory(CachedResource):
             If the cache timeout has not expired for this board, it will be obtained from the cache.
             if the request is new or the cache timeout has expired, then we will get it from Monday.com
             note: timestamps are the number of seconds from 1970-01-01
+            priority is used by the complexity scheduler, it is applied to copies, cached boards keep their own.
+            threads that ask for the same board while it is loading wait for that load, see SingleFlight.
         """
         # safety check to ensure that the board id is always the correct format
         if isinstance(board_id, str):
@@ -47,6 +70,31 @@ class MondayFactory(CachedResource):
 
         cached_board = self.get_cache_item(board_id)
         if cached_board is None:
+            cached_board = self.loads.do(board_id, self.load_board, board_id, fields=fields,
+                                         monday_token=monday_token, monday_timeout_seconds=monday_timeout_seconds,
+                                         monday_account=monday_account, verify_columns=verify_columns,
+                                         alert_to=alert_to, priority=priority, refresh_schema=clear_cache)
+
+        if make_copy:
+            the_board = cached_board.clone()
+            if priority is not None:
+                the_board.priority = priority
+        else:
+            the_board = cached_board
+
+        return the_board
+
+    def load_board(self, board_id, fields: [] = None, monday_token=None, monday_timeout_seconds=5,
+                   monday_account=None, verify_columns: [Column] = None, alert_to: [] = None, priority=None,
+                   refresh_schema=False) -> Board:
+        """ loads the board from monday and caches it, only one thread loads a board at a time, see board().
+            refresh_schema skips the schema cache, the columns and groups are read from monday """
+        # a thread that waited on the lock finds the board another thread loaded
+        with self.board_lock(board_id):
+            cached_board = self.get_cache_item(board_id)
+            if cached_board is not None:
+                return cached_board
+
             # get the token
             if monday_token is None:
                 monday_token = self.get_monday_token(board_id, monday_account)
@@ -54,7 +102,7 @@ class MondayFactory(CachedResource):
             # we are here because either the cache has expired or the board was not in the cache
             new_board: object = None
             try_again = 0
-            while try_again < 5:
+            while try_again < LOAD_RETRIES:
                 try:
                     new_board: Board = Board(board_id,
                                              fields=fields,
@@ -62,13 +110,19 @@ class MondayFactory(CachedResource):
                                              monday_timeout_seconds=monday_timeout_seconds,
                                              monday_account=monday_account,
                                              verify_columns=verify_columns,
-                                             alert_to=alert_to)
+                                             alert_to=alert_to,
+                                             scheduler=self.scheduler,
+                                             response_cache=self.response_cache,
+                                             priority=Priority.interactive if priority is None else priority,
+                                             refresh_schema=refresh_schema)
                     break
                 except Exception as ex:
                     try_again += 1
-                    sleep(20)
-                    logging.warning(
-                        f"Sleeping for 20 seconds and will retrying Monday Board [{try_again}] error -> {ex}")
+                    if try_again >= LOAD_RETRIES:
+                        break
+                    logging.warning(f"Sleeping for {LOAD_RETRY_SECONDS} seconds and will retrying Monday Board "
+                                    f"[{try_again}] error -> {ex}")
+                    sleep(LOAD_RETRY_SECONDS)
 
             assert new_board is not None, f"Giving up on the board {board_id}"
 
@@ -77,14 +131,39 @@ class MondayFactory(CachedResource):
             # update the cache
             cache_key = CachedResource.cache_key(board_id)
             self.update_cache_item(obj=new_board, key=cache_key, expire_seconds=self.expire_seconds)
-            cached_board = new_board
+            return new_board
 
-        if make_copy:
-            the_board = copy.deepcopy(cached_board)
-        else:
-            the_board = cached_board
+    def board_lock(self, board_id):
+        """ the lock for one board, held while the board is loaded or refreshed """
+        if isinstance(board_id, str):
+            board_id = Conversion.to_int(board_id)
+        return self.loads.lock(board_id)
 
-        return the_board
+    def refresh(self, board_id, **kwargs) -> Board:
+        """ loads the board from monday again, callers that refresh the same board at the same time share one load """
+        if isinstance(board_id, str):
+            board_id = Conversion.to_int(board_id)
+        return self.loads.do(board_id, self.reload_board, board_id, **kwargs)
+
+    def reload_board(self, board_id, **kwargs) -> Board:
+        with self.board_lock(board_id):
+            self.remove(board_id)
+            return self.load_board(board_id, refresh_schema=True, **kwargs)
+
+    async def board_async(self, board_id, make_copy=False, fields: [] = None,
+                          monday_token=None, monday_timeout_seconds=5, monday_account=None,
+                          verify_columns: [Column] = None, alert_to: [] = None, clear_cache=False,
+                          priority=None) -> Board:
+        """ same as board, the board is loaded in a worker thread so many boards can be warmed at once.
+
+            Example: boards = await asyncio.gather(*[factory.board_async(b) for b in board_ids])
+        """
+        loop = asyncio.get_running_loop()
+        call = functools.partial(self.board, board_id, make_copy=make_copy, fields=fields,
+                                 monday_token=monday_token, monday_timeout_seconds=monday_timeout_seconds,
+                                 monday_account=monday_account, verify_columns=verify_columns,
+                                 alert_to=alert_to, clear_cache=clear_cache, priority=priority)
+        return await loop.run_in_executor(Network.executor(), call)
 
     def get_monday_token(self, board_id, monday_account):
         cache_key = CachedResource.cache_key(monday_account, board_id)
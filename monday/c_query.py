@@ -8,8 +8,10 @@ from datetime import datetime
 from urllib import request
 
 from monday.c_cell import Cell
+from monday.c_column_value import ColumnValue
 from monday.c_connection import MondayConnection
 from monday.c_core import MondayCore
+from monday.c_query_templates import QueryTemplates
 from networking.c_requests import Network
 from result.c_result import Result
 from std_errors.c_ecode import Ecode
@@ -33,6 +35,11 @@ class MondayQuery(MondayCore):
     def set_col_map(self, col_map):
         self.col_map = col_map
 
+    def schema_changed(self):
+        """ the columns, labels or groups of the board were changed on monday, the schema on disk is out of date """
+        if self.schema_cache is not None:
+            self.schema_cache.remove_schema(self.board_id, self.monday_token)
+
     @staticmethod
     def extract_item_count(result):
         count = 0
@@ -51,17 +58,7 @@ class MondayQuery(MondayCore):
 
         logging.debug(f"Getting Item Count [{self.board_id}]")
 
-        cmd = """
-                         query 
-                         {
-                             boards (ids: BOARD_ID) 
-                             { 
-                                items_count 
-                              }
-                          }
-                     """.replace('BOARD_ID', str(self.board_id))
-
-        query = self.gen_query(cmd)
+        query = QueryTemplates.query('item_count', boardId=[self.board_id])
         result = self.execute(query)
         return self.extract_item_count(result)
 
@@ -104,6 +101,7 @@ class MondayQuery(MondayCore):
         cmd = cmd.replace('\n', '')
         return {'query': cmd}
 
+
     def get_sub_item_ids(self, item_id, sub_id):
         cmd = """query { items (ids: ITEM_ID) {column_values (ids:["SUB_ID"]) {value} } }""". \
             replace("ITEM_ID", str(item_id)).replace("SUB_ID", sub_id)
@@ -124,13 +122,9 @@ class MondayQuery(MondayCore):
         return result
 
     def get_sub_rows(self, linked_pulse_ids):
-        cmd = """ query { items(ids: VALUE_RETURNED) {
-                          name 
-                          id 
-                          assets {public_url file_extension name}
-                          column_values {id column{title} value text type } } }""". \
-            replace("VALUE_RETURNED", str(linked_pulse_ids))
-        query = self.gen_query(cmd)
+        if not isinstance(linked_pulse_ids, list):
+            linked_pulse_ids = [linked_pulse_ids]
+        query = QueryTemplates.query('sub_rows', ids=linked_pulse_ids)
         result = self.execute(query)
 
         return result
@@ -180,19 +174,8 @@ class MondayQuery(MondayCore):
 
     # updates one or more columns in a row, uses list[Cell] or dict field name / value pairs returns result, status
     def sub_item_update(self, sub_board_id, row_id, q_data) -> Result:
-        if isinstance(q_data, dict):
-            data = self._generate_update_query(q_data)
-        else:
-            data = self._generate_update_query_v2(q_data)
-
-        update_command = r'mutation ' \
-                         r'{change_multiple_column_values ' \
-                         f'(item_id: ITEM_ID, board_id: BOARD_ID, column_values: "{data}" )' \
-                         r'{id} }' \
-            .replace('BOARD_ID', str(sub_board_id)) \
-            .replace("ITEM_ID", row_id)
-
-        update_query = self.gen_query(update_command)
+        update_query = QueryTemplates.query('update_columns', boardId=sub_board_id, itemId=row_id,
+                                            columnValues=ColumnValue.dumps(q_data))
 
         result = self.execute(update_query)
 
@@ -204,20 +187,8 @@ class MondayQuery(MondayCore):
         """ Updates a single column value for a row on a board using a simple string value"""
         if row_id is None or len(column_id) == 0:
             return Result(-1, message="Unable to update a column with no row id or column id")
-        update_command = """
-              mutation {
-                  change_simple_column_value(
-                       item_id: ITEM_ID, 
-                       board_id: BOARD_ID, 
-                       column_id: "COLUMN_ID", 
-                       value: "COLUMN_VALUE") { id }
-              }
-          """.replace('BOARD_ID', str(self.board_id)) \
-            .replace("ITEM_ID", str(row_id)) \
-            .replace("COLUMN_ID", column_id) \
-            .replace("COLUMN_VALUE", column_value)
-
-        update_query = {'query': update_command}
+        update_query = QueryTemplates.query('update_simple_column', boardId=self.board_id, itemId=row_id,
+                                            columnId=column_id, value=column_value)
 
         result = self.execute(update_query)
 
@@ -227,59 +198,21 @@ class MondayQuery(MondayCore):
 
     # updates one or more columns in a row, uses list[Cell] or dict field name / value pairs returns result, status
     def monday_update(self, row_id, q_data, add_missing_labels=False) -> Result:
-        if isinstance(q_data, dict):
-            data = self._generate_update_query(q_data)
-        else:
-            data = self._generate_update_query_v2(q_data)
-
-        if add_missing_labels:
-            update_command = r'mutation ' \
-                             r'{change_multiple_column_values ' \
-                             f'(item_id: ITEM_ID, board_id: BOARD_ID, column_values: "{data}", ' \
-                             f'create_labels_if_missing: true)' \
-                             r'{id} }' \
-                .replace('BOARD_ID', str(self.board_id)) \
-                .replace("ITEM_ID", row_id)
-        else:
-            update_command = r'mutation ' \
-                             r'{change_multiple_column_values ' \
-                             f'(item_id: ITEM_ID, board_id: BOARD_ID, column_values: "{data}" ) ' \
-                             r'{id} }' \
-                .replace('BOARD_ID', str(self.board_id)) \
-                .replace("ITEM_ID", row_id)
-
-        update_query = {'query': update_command}
+        update_query = QueryTemplates.query('update_columns', boardId=self.board_id, itemId=row_id,
+                                            columnValues=ColumnValue.dumps(q_data),
+                                            createLabels=True if add_missing_labels else None)
 
         result = self.execute(update_query)
+        if add_missing_labels:
+            self.schema_changed()
 
         logging.debug(f"Update query = {update_query}")
         logging.debug(f"Update {row_id} was {result.status.message}")
         return result
 
     def insert_subitem(self, parent_row_id, subitem_name, q_data=None):
-        if q_data is None:
-            q_data = []
-        if isinstance(q_data, dict):
-            data = self._generate_update_query_v3_dict(q_data)
-        else:
-            data = self._generate_update_query_v3(q_data)
-
-        mutation = """
-        mutation  
-        {
-            create_subitem ( parent_item_id: PARENT_ROW_ID, item_name: "ROW_NAME", column_values: COL_VALUES)
-            {
-                id 
-                board {id}
-                name 
-                assets {public_url file_extension name}
-                column_values {id column{title} value text type }
-            } 
-        }
-        """.replace("PARENT_ROW_ID", str(str(parent_row_id)))\
-            .replace("ROW_NAME", subitem_name).replace("COL_VALUES", json.dumps(data))
-
-        query = self.gen_query(mutation)
+        query = QueryTemplates.query('insert_subitem', parentId=parent_row_id, itemName=subitem_name,
+                                     columnValues=ColumnValue.dumps(q_data))
         logging.debug(query)
 
         result = self.execute(query)
@@ -308,105 +241,36 @@ class MondayQuery(MondayCore):
         return result
 
     def get_board_name(self):
-        query = """
-        query {
-  boards (ids: BOARD_OD) {
-    name }}
-        """.replace('BOARD_ID', str(self.board_id))
-        data = {"query": query}
-        result = self.execute(data)
+        result = self.execute(QueryTemplates.query('board_name', boardId=[self.board_id]))
         return result
 
     def add_column(self, title, description='', c_type='text'):
-        query = """
-        mutation{
-          create_column(board_id: BOARD_ID, title:"TITLE", 
-                description: "DESC", column_type:TYPE) {
-            id
-            title
-            description
-          }
-        }
-        """.replace('BOARD_ID', str(self.board_id)) \
-            .replace('TITLE', str(title)) \
-            .replace('DESC', str(description)) \
-            .replace('TYPE', str(c_type))
-
-        data = {"query": query}
-        result = self.execute(data)
+        query = QueryTemplates.query('add_column', boardId=self.board_id, title=str(title),
+                                     description=str(description), columnType=str(c_type))
+        result = self.execute(query)
+        self.schema_changed()
         return result
 
     def update_link_column(self, row_id, column_name, url, text):
         column_id = self.col_map.get(column_name).id
         assert column_id is not None, "Unable to locate Column ID"
-        query = """
-        mutation {
-          change_multiple_column_values(item_id:ROW_ID, 
-            board_id:BOARD_ID, 
-            column_values: "{\"COL_ID\" : {\"url\" : \"URL", \"text\":\"URL_TEXT\"}}") {
-            id
-          }
-        }
-        """.replace('BOARD_ID', str(self.board_id))\
-            .replace("ROW_ID", row_id)\
-            .replace('COL_ID', column_id)\
-            .replace('URL', str(url))\
-            .replace('URL_TEXT', text)
-
-        data = {"query": query}
-        result = self.execute(data)
+        query = QueryTemplates.query('update_columns', boardId=self.board_id, itemId=row_id,
+                                     columnValues=json.dumps({column_id: {'url': str(url), 'text': text}}))
+        result = self.execute(query)
         return result
 
     def rename_column(self, column_name, title):
         column_id = self.col_map.get(column_name).id
         assert column_id is not None, "Unable to locate Column ID"
-        query = """
-        mutation {
-            change_column_title (board_id: BOARD_ID, column_id: "COL_ID", title: "TITLE") {
-                id
-            }
-        }
-        """.replace('BOARD_ID', str(self.board_id)) \
-            .replace('TITLE', str(title)) \
-            .replace('COL_ID', str(column_id))
-
-        data = {"query": query}
-        result = self.execute(data)
+        query = QueryTemplates.query('rename_column', boardId=self.board_id, columnId=str(column_id), title=str(title))
+        result = self.execute(query)
+        self.schema_changed()
         return result
 
     # needs testing, but I think this is the way to go.
     def insert(self, group_id='topics', row_name='delete me', q_data=None) -> Result:
-        # data = self.format_data_for_query(q_data)
-
-        if isinstance(q_data, dict):
-            data = self._generate_update_query_v3_dict(q_data)
-        else:
-            data = self._generate_update_query_v3(q_data)
-        # r' create_labels_if_missing: true ' \
-
-        mutation = """
-            mutation 
-            {
-                create_item 
-                (
-                    board_id: BOARD_ID, 
-                    group_id: "GROUP_ID", 
-                    item_name: "ROW_NAME",
-                    column_values: COL_VALUES
-                )
-                {
-                    id
-                    name 
-                    assets {public_url file_extension name}
-                    column_values {id column {title} value text type }
-                } 
-            }
-        """.replace("BOARD_ID", str(self.board_id)) \
-            .replace("GROUP_ID", str(group_id))\
-            .replace("ROW_NAME", row_name)\
-            .replace("COL_VALUES", json.dumps(data))
-
-        query = self.gen_query(mutation)
+        query = QueryTemplates.query('insert_item', boardId=self.board_id, groupId=str(group_id), itemName=row_name,
+                                     columnValues=ColumnValue.dumps(q_data))
         logging.debug(query)
 
         result = self.execute(query)
@@ -418,22 +282,12 @@ class MondayQuery(MondayCore):
     # needs testing, but I think this is the way to go. uses a row_id or item_id
     def delete(self, item_id) -> Result:
 
-        query = r' mutation {' \
-                r' delete_item (' \
-                r' item_id: ITEM_ID ) {id}}' \
-            .replace("ITEM_ID", item_id)
-
-        data = {"query": query}
-        result = self.execute(data)
-        # result = self.execute(query)
+        result = self.execute(QueryTemplates.query('delete_item', itemId=item_id))
         if result.is_ok():
-            try:
-                for i in range(len(self.rows) - 1, -1, -1):
-                    if self.rows[i].row_id == item_id:
-                        del self.rows[i]
-                        break
-            except Exception as e:
-                logging.debug(e)
+            row = self.indexes.row(item_id)
+            if row is not None:
+                self.indexes.remove(row)
+                self.rows.remove(row)
 
         logging.debug(f"Delete {item_id} was {result.status.message}")
         return result
@@ -464,6 +318,7 @@ class MondayQuery(MondayCore):
 
         cmd = """ query {
                       users {
+                      id
                       name 
                       created_at
                       email
@@ -750,18 +605,7 @@ class MondayQuery(MondayCore):
 
         logging.debug(f"Loading board [{self.board_id}] getting a row [{row_id}] ")
 
-        cmd = """
-                           query 
-                  {
-                     
-                       items (ids: [ROW_ID, ]) { name id assets {public_url file_extension name}
-                       column_values {id column {title} text }
-                       group {id title} }
-                      
-                   }
-           """.replace('BOARD_ID', str(self.board_id)).replace("ROW_ID", str(row_id))
-
-        query = self.gen_query(cmd)
+        query = QueryTemplates.query('assets', ids=[row_id])
         result = self.execute(query)
         return result
 
@@ -888,22 +732,7 @@ class MondayQuery(MondayCore):
         """
         logging.debug(f"getting columns list from Monday.com board {self.board_id}")
 
-        cmd = """
-              query 
-              {
-                   boards (ids: BOARD_ID) 
-                   {
-                      id name permissions tags { id name } 
-                      groups { id title} 
-                      items_page (limit: 1) {
-                        items { name id column_values {id column { title } text } }
-                      }
-                      columns { id title type settings_str }
-                    }
-              } 
-              """.replace('BOARD_ID', str(self.board_id))
-
-        query = self.gen_query(cmd)
+        query = QueryTemplates.query('board_schema', boardId=[self.board_id])
         result = self.execute(query)
 
         logging.debug(f"Load one record from Monday Board was {result.status.message}")
@@ -967,162 +796,30 @@ class MondayQuery(MondayCore):
 
         # converts the field names to the column id and creates a query
 
+    # the builders below are kept for callers that paste column values into the query text, new code should send
+    # ColumnValue.dumps(q_data) as a variable (see QueryTemplates)
     @staticmethod
     def _generate_update_query_v3_dict(q_data: dict) -> str:
-        if q_data is None:
-            return '{}'
-        data = '{'
-        for _col_name, _col_value in q_data.items():
-            if _col_value is None:
-                continue
-            if data != '{':
-                data += ','
-            data += '\"' + _col_name + '\": \"' + str(_col_value) + '\"'
-        retval = data + '}'
-        logging.debug(retval)
-        return retval
+        return ColumnValue.dumps(q_data)
 
     @staticmethod
     def _generate_update_query_v3(q_data) -> str:
-        if q_data is None:
-            return '{}'
-        data = '{'
-        for _cel in q_data:
-            _cell: Cell = _cel
-            if not _cell.modified:
-                continue
-            if _cell.value is None:
-                continue
-
-            if data != '{':
-                data += ','
-            try:
-                if _cell.type == 'datetime':
-                    _c: DateTime = _cell.value
-                    dd: str = _c.to_date_str()
-                    dt: str = _c.to_time_str()
-                    data += ' "' + _cell.id + '" : {"date" : "' + dd + '", "time" : "' + dt + '" } '
-                    continue
-
-                if _cell.modified and _cell.type == 'boolean':
-                    a_value = 'false'
-                    if _cell.value is True:
-                        a_value = 'true'
-
-                    data += """ "ID": {"checked": "VALUE" } """ \
-                        .replace('ID', _cell.id) \
-                        .replace('VALUE', a_value)
-                    continue
-
-                the_value = str(_cell.value)
-
-                if _cell.type == 'date':
-                    if isinstance(_cell.value, DateTime):
-                        _c: DateTime = _cell.value
-                        the_value = _c.to_date_str()
-                    if isinstance(_cell.value, str):
-                        the_value = _cell.value
-
-                if _cell.modified and _cell.value is not None:
-                    data += """ "ID": "VALUE" """ \
-                        .replace('ID', _cell.id) \
-                        .replace('VALUE', the_value)
-                    # data += '\\"' + _cell.id + '\\' + '\":' + '\\' + '\"' + the_value + '\\' + '\"'
-            except Exception as ex:
-                logging.error(ex)
-
-        retval = data + '}'
+        return ColumnValue.dumps(q_data)
 
-        logging.debug(retval)
-        return retval
-
-    # converts the field names to the column id and creates a query
+    # converts the field names to the column id and creates a query, escaped to be used inside a query string
     @staticmethod
     def _generate_update_query(q_data: dict) -> str:
-        if q_data is None:
-            return '{}'
-        data = '{'
-        for _col_name, _col_value in q_data.items():
-            if _col_value is None:
-                continue
-            if data != '{':
-                data += ','
-            data += '\\"' + _col_name + '\\' + '\":' + '\\' + '\"' + str(_col_value) + '\\' + '\"'
-        retval = data + '}'
-        logging.debug(retval)
-        return retval
+        return json.dumps(ColumnValue.dumps(q_data))[1:-1]
 
     @staticmethod
     def _generate_update_query_v2(q_data) -> str:
-        data = '{'
-        for _cel in q_data:
-            _cell: Cell = _cel
-            if not _cell.modified:
-                continue
-            if _cell.value is None:
-                continue
-
-            if data != '{':
-                data += ','
-            try:
-                if _cell.type == 'link':
-                    if _cell.source is None or not isinstance(_cell.source, dict):
-                        continue
-                    text = _cell.value2
-                    if text is None or len(str(text)) == 0:
-                        text = _cell.source.get('title')
-                    url = _cell.value
-                    if text is None or url is None:
-                        continue
-                    data += ' \\"' + _cell.id + '\\" : {\\"url\\" : \\"' + url + '\\", \\"text\\":\\"' + text + '\\" } '
-                    continue
-
-                if _cell.type == 'datetime':
-                    _c: DateTime = _cell.value
-                    dd: str = _c.to_date_str()
-                    dt: str = _c.to_time_str()
-                    data += ' \\"' + _cell.id + '\\" : {\\"date\\" : \\"' + dd + '\\", \\"time\\" : \\"' + dt + '\\" } '
-                    continue
-
-                if _cell.modified and _cell.type == 'boolean':
-                    a_value = 'false'
-                    if _cell.value is True:
-                        a_value = 'true'
-
-                    data += """ \\"ID\\": {\\"checked\\": \\"VALUE\\" } """ \
-                        .replace('ID', _cell.id) \
-                        .replace('VALUE', a_value)
-                    continue
-
-                the_value = str(_cell.value)
-
-                if _cell.type == 'date':
-                    _c: DateTime = _cell.value
-                    the_value = _c.to_date_str()
-
-                if _cell.modified and _cell.value is not None:
-                    data += """ \\"ID\\": \\"VALUE\\" """ \
-                        .replace('ID', _cell.id) \
-                        .replace('VALUE', the_value)
-                    # data += '\\"' + _cell.id + '\\' + '\":' + '\\' + '\"' + the_value + '\\' + '\"'
-            except Exception as ex:
-                logging.error(ex)
-
-        retval = data + '}'
-
-        logging.debug(retval)
-        return retval
+        return json.dumps(ColumnValue.dumps(q_data))[1:-1]
 
     # create a group
     def create_group(self, group_name):
-        command = r'mutation ' \
-                  r'{ create_group ' \
-                  r'(board_id: "BOARD_ID", ' \
-                  r'group_name: "GROUP_NAME") { id }}' \
-            .replace("BOARD_ID", str(self.board_id)) \
-            .replace("GROUP_NAME", group_name)
-
-        return self.execute({'query': command})
+        result = self.execute(QueryTemplates.query('create_group', boardId=self.board_id, groupName=group_name))
+        self.schema_changed()
+        return result
 
     @staticmethod
     def _convert_cell_to_dict(_data: [Cell]) -> dict:
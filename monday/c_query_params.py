@@ -0,0 +1,165 @@
+"""
+QueryParams: builds the items_page query_params so Monday.com filters the rows before they are sent to us.
+
+Rules use our select operators and column names, they are converted to monday column ids, monday operators and
+compare values: status and dropdown labels become label ids from Column.label_map and dates are sent as
+["EXACT", "2024-01-31"].  add() returns False for a rule monday can not run (the name column, a label that does
+not exist, several values with > or <, a date with a time), the caller keeps that rule as a client side filter.
+
+    Example: params = QueryParams(board)
+             params.add('Status', 'in', ['Done', 'Stuck'])
+             params.add('Date', '>=', '2024-01-01')
+             board.select(q_filter=params.compile())
+
+        , query_params: {rules: [{column_id: "status", compare_value: [1, 2], operator: any_of},
+                                 {column_id: "date4", compare_value: ["EXACT", "2024-01-01"], operator: greater_than_or_equals}],
+                         operator: and}
+"""
+import json
+
+from monday.c_column import Column
+from monday.c_filter import MondayFilter, FilterGroup
+from std_utility.c_datetime import DateTime
+
+MONDAY_OPERATORS = {'in': 'any_of',
+                    '=': 'any_of',
+                    'not in': 'not_any_of',
+                    '!=': 'not_any_of',
+                    '>': 'greater_than',
+                    '>=': 'greater_than_or_equals',
+                    '<': 'lower_than',
+                    '<=': 'lower_than_or_equal',
+                    'between': 'between'}
+
+COMPARE_OPERATORS = ('>', '>=', '<', '<=')
+LABEL_TYPES = ('color', 'status', 'dropdown')
+DATE_TYPES = ('date', 'datetime')
+NUMERIC_TYPES = ('numeric', 'numbers')
+TEXT_TYPES = ('text', 'long_text', 'long-text', 'email', 'phone', 'link')
+
+
+class QueryParams:
+    def __init__(self, parent_board, operator='and'):
+        self.parent_board = parent_board
+        self.operator = operator
+        self.rules = []
+
+    def __len__(self):
+        return len(self.rules)
+
+    def add(self, col_name, operator=None, col_values=None) -> bool:
+        """ adds a rule, returns False when monday can not run it """
+        rule = self.rule(col_name, operator, col_values)
+        if rule is None:
+            return False
+        self.rules.append(rule)
+        return True
+
+    def rule(self, col_name, operator=None, col_values=None):
+        """ returns the rule as a dict or None when monday can not run it """
+        operator = 'in' if operator is None else operator.strip().lower()
+        column: Column = self.parent_board.column_info_map.get(col_name)
+        monday_operator = MONDAY_OPERATORS.get(operator)
+        if column is None or monday_operator is None or column.id == 'name':
+            return None
+
+        if col_values is None:
+            return None
+        if not isinstance(col_values, (list, tuple, set)):
+            col_values = [col_values]
+        col_values = list(col_values)
+        if len(col_values) == 0:
+            return None
+        if operator in COMPARE_OPERATORS and len(col_values) != 1:
+            return None
+        if operator == 'between' and len(col_values) != 2:
+            return None
+
+        compare_value = None
+        if column.type in LABEL_TYPES:
+            if operator not in ('in', '=', 'not in', '!=') or column.label_map is None:
+                return None
+            compare_value = []
+            for value in col_values:
+                if value not in column.label_map:
+                    return None
+                compare_value.append(column.label_map.get(value))
+
+        elif column.type in DATE_TYPES:
+            dates = [QueryParams.date_value(v) for v in col_values]
+            if None in dates:
+                return None
+            if operator == 'between':
+                compare_value = dates
+            elif len(dates) == 1:
+                compare_value = ['EXACT', dates[0]]
+            else:
+                return None
+
+        elif column.type in NUMERIC_TYPES:
+            if operator in ('in', '=', 'not in', '!='):
+                return None
+            numbers = [MondayFilter.to_number(v) for v in col_values]
+            if None in numbers:
+                return None
+            compare_value = [int(n) if n.is_integer() else n for n in numbers]
+
+        elif column.type in TEXT_TYPES:
+            if operator not in ('in', '=', 'not in', '!='):
+                return None
+            compare_value = [str(v) for v in col_values]
+
+        if compare_value is None:
+            return None
+        return {'column_id': column.id, 'compare_value': compare_value, 'operator': monday_operator}
+
+    @staticmethod
+    def date_value(value):
+        """ the date to send, None for a value with a time, monday compares dates only so the rule stays on the
+            client """
+        if isinstance(value, str) and len(value) >= 8 and ':' not in value:
+            value = DateTime(value)
+        if not isinstance(value, DateTime) or value.to_time_str() != '00:00:00':
+            return None
+        return str(value.date)
+
+    def add_filter(self, where: MondayFilter):
+        """ adds the parts of a MondayFilter that monday can run, returns the filter that is left (or None) """
+        if where is None:
+            return None
+
+        if isinstance(where, FilterGroup):
+            if where.join == 'or':
+                # an or can only be sent when it is the whole query
+                if len(self.rules) > 0:
+                    return where
+                rules = [self.rule(f.col_name, f.operator, f.col_values) if not isinstance(f, FilterGroup) else None
+                         for f in where.filters]
+                if None in rules:
+                    return where
+                self.rules.extend(rules)
+                self.operator = 'or'
+                return None
+
+            # nested or groups stay on the client, the rules we send are joined with and
+            remaining = [f for f in where.filters if isinstance(f, FilterGroup) or self.add_filter(f) is not None]
+            if len(remaining) == 0:
+                return None
+            if len(remaining) == 1:
+                return remaining[0]
+            return FilterGroup('and', remaining)
+
+        if self.operator != 'and' or not self.add(where.col_name, where.operator, where.col_values):
+            return where
+        return None
+
+    def compile(self) -> str:
+        """ returns the query_params to insert into items_page, an empty string when there are no rules """
+        if len(self.rules) == 0:
+            return ''
+        rules = []
+        for rule in self.rules:
+            rules.append(f'{{column_id: "{rule.get("column_id")}", '
+                         f'compare_value: {json.dumps(rule.get("compare_value"))}, '
+                         f'operator: {rule.get("operator")}}}')
+        return f', query_params: {{rules: [{", ".join(rules)}], operator: {self.operator}}}'
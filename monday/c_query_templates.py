@@ -0,0 +1,208 @@
+"""
+QueryTemplates: named GraphQL operations, minified once when this module is imported and sent with variables.
+
+The query text of an operation never changes, the values go in the variables, so nothing is pasted into the text
+and a value can not break the query.  The same operation with the same variables always gives the same request
+body, cache_key() turns it into a string that can be used to dedupe or cache requests.
+
+    Example: query = QueryTemplates.query('item_count', boardId=[board_id])
+             -> {'query': 'query item_count ($boardId: [ID!]) { boards (ids: $boardId) { items_count } }',
+                 'variables': {'boardId': [1234]}}
+             result = board.execute(query)
+
+A template may have a fragment that can not be a variable (the query_params text of a select), fragments are
+replaced in the minified text: QueryTemplates.query('select_groups', fragments={'QUERY_PARAMS': q_filter}, ...)
+"""
+import json
+
+
+class QueryTemplate:
+    __slots__ = ('name', 'text')
+
+    def __init__(self, name, text):
+        self.name = name
+        self.text = QueryTemplate.minify(text)
+
+    @staticmethod
+    def minify(text) -> str:
+        return ' '.join(text.split())
+
+    def query(self, fragments: dict = None, **variables) -> dict:
+        text = self.text
+        if fragments:
+            for marker, fragment in fragments.items():
+                text = text.replace(marker, fragment or '')
+        return {'query': text, 'variables': variables}
+
+
+class QueryTemplates:
+    templates = {}
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def register(name, text) -> QueryTemplate:
+        assert name not in QueryTemplates.templates, f"Query template [{name}] is already registered"
+        template = QueryTemplate(name, text)
+        QueryTemplates.templates[name] = template
+        return template
+
+    @staticmethod
+    def get(name) -> QueryTemplate:
+        template = QueryTemplates.templates.get(name)
+        assert template is not None, f"Unknown query template [{name}]"
+        return template
+
+    @staticmethod
+    def query(name, fragments: dict = None, **variables) -> dict:
+        return QueryTemplates.get(name).query(fragments, **variables)
+
+    @staticmethod
+    def cache_key(query) -> str:
+        """ a stable string for a request body, equal bodies give equal keys """
+        return json.dumps(query, sort_keys=True, separators=(',', ':'), default=str)
+
+
+QueryTemplates.register('item_count', """
+    query item_count ($boardId: [ID!]) {
+        boards (ids: $boardId) { items_count }
+    }
+""")
+
+QueryTemplates.register('board_name', """
+    query board_name ($boardId: [ID!]) {
+        boards (ids: $boardId) { name }
+    }
+""")
+
+QueryTemplates.register('board_schema', """
+    query board_schema ($boardId: [ID!]) {
+        boards (ids: $boardId) {
+            id name permissions tags { id name }
+            groups { id title }
+            items_page (limit: 1) {
+                items { name id column_values {id column { title } text } }
+            }
+            columns { id title type settings_str }
+        }
+    }
+""")
+
+QueryTemplates.register('rows', """
+    query rows ($ids: [ID!], $fields: [String!]) {
+        items (ids: $ids, limit: 100) {
+            name id assets {public_url file_extension name}
+            column_values (ids: $fields) {id column {title} text }
+            group {id title}
+        }
+    }
+""")
+
+QueryTemplates.register('sub_rows', """
+    query sub_rows ($ids: [ID!]) {
+        items (ids: $ids) {
+            name id assets {public_url file_extension name}
+            column_values {id column{title} value text type }
+        }
+    }
+""")
+
+# the subitems of up to 100 parent items, see SubItemLoader
+QueryTemplates.register('subitems', """
+    query subitems ($ids: [ID!]) {
+        items (ids: $ids, limit: 100) {
+            id
+            subitems {
+                id name board {id}
+                assets {public_url file_extension name}
+                column_values {id column{title} value text type }
+            }
+        }
+    }
+""")
+
+QueryTemplates.register('assets', """
+    query assets ($ids: [ID!]) {
+        items (ids: $ids) {
+            name id assets {public_url file_extension name}
+            column_values {id column {title} text }
+            group {id title}
+        }
+    }
+""")
+
+# QUERY_PARAMS is the query_params text from QueryParams.compile(), monday does not allow it with a cursor
+QueryTemplates.register('select_groups', """
+    query select_groups ($boardId: [ID!], $groups: [String], $limit: Int, $cursor: String, $fields: [String!]) {
+        boards (ids: $boardId) {
+            groups (ids: $groups) {
+                id title
+                items_page (cursor: $cursor, limit: $limit QUERY_PARAMS) {
+                    cursor
+                    items { id name column_values (ids: $fields) {id column {title} text }
+                            assets {public_url file_extension name} }
+                }
+            }
+        }
+    }
+""")
+
+QueryTemplates.register('update_columns', """
+    mutation update_columns ($boardId: ID!, $itemId: ID!, $columnValues: JSON!, $createLabels: Boolean) {
+        change_multiple_column_values (board_id: $boardId, item_id: $itemId, column_values: $columnValues,
+                                       create_labels_if_missing: $createLabels) { id }
+    }
+""")
+
+QueryTemplates.register('update_simple_column', """
+    mutation update_simple_column ($boardId: ID!, $itemId: ID!, $columnId: String!, $value: String) {
+        change_simple_column_value (board_id: $boardId, item_id: $itemId, column_id: $columnId, value: $value) { id }
+    }
+""")
+
+QueryTemplates.register('insert_item', """
+    mutation insert_item ($boardId: ID!, $groupId: String, $itemName: String!, $columnValues: JSON) {
+        create_item (board_id: $boardId, group_id: $groupId, item_name: $itemName, column_values: $columnValues) {
+            id name
+            assets {public_url file_extension name}
+            column_values {id column {title} value text type }
+        }
+    }
+""")
+
+QueryTemplates.register('insert_subitem', """
+    mutation insert_subitem ($parentId: ID!, $itemName: String!, $columnValues: JSON) {
+        create_subitem (parent_item_id: $parentId, item_name: $itemName, column_values: $columnValues) {
+            id board {id} name
+            assets {public_url file_extension name}
+            column_values {id column{title} value text type }
+        }
+    }
+""")
+
+QueryTemplates.register('delete_item', """
+    mutation delete_item ($itemId: ID!) {
+        delete_item (item_id: $itemId) { id }
+    }
+""")
+
+QueryTemplates.register('create_group', """
+    mutation create_group ($boardId: ID!, $groupName: String!) {
+        create_group (board_id: $boardId, group_name: $groupName) { id }
+    }
+""")
+
+QueryTemplates.register('add_column', """
+    mutation add_column ($boardId: ID!, $title: String!, $description: String, $columnType: ColumnType!) {
+        create_column (board_id: $boardId, title: $title, description: $description, column_type: $columnType) {
+            id title description
+        }
+    }
+""")
+
+QueryTemplates.register('rename_column', """
+    mutation rename_column ($boardId: ID!, $columnId: String!, $title: String!) {
+        change_column_title (board_id: $boardId, column_id: $columnId, title: $title) { id }
+    }
+""")
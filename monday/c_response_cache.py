@@ -0,0 +1,217 @@
+"""
+ResponseCache: an opt-in read-through cache in front of MondayConnection.execute.
+
+Several webhooks for the same item often arrive within seconds of each other and each one reads the same row, item
+count, users or assets from Monday.com.  With a response cache the first read goes to monday and the next ones are
+answered from memory until the entry expires.
+
+    key         the token scope, the minified query text and the variables, see QueryTemplates.cache_key
+    ttl         seconds an entry lives, set per operation (the name of a template or the first field of the query)
+    size        the least recently used entry is dropped when there are more than max_entries
+    tags        every entry is tagged with its board id and the item ids in the query, invalidate() uses the tags
+
+Only successful queries are cached, mutations and file uploads are always sent.  A mutation sent through a
+connection with a cache removes the entries for its board and items, WebHook.process_request does the same for the
+board and item of each event, so a change made by someone else is not answered from the cache.
+
+Set MONDAY_RESPONSE_CACHE_SIZE to give every board from MondayFactory one shared cache.
+    Example: board = Board(board_id, token, response_cache=ResponseCache(max_entries=500, ttls={'rows': 2}))
+             board.response_cache.invalidate(board_id=board_id, item_id=item_id)
+"""
+import copy
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict, namedtuple
+from time import monotonic
+
+from monday.c_query_templates import QueryTemplates
+from result.c_result import Result
+
+RESPONSE_CACHE_SIZE_ENV = 'MONDAY_RESPONSE_CACHE_SIZE'
+MAX_ENTRIES = 1000
+DEFAULT_TTL_SECONDS = 10
+
+# operations that change rarely live longer, rows and counts change with every webhook
+DEFAULT_TTLS = {'users': 300,
+                'board_name': 300,
+                'assets': 30,
+                'item_count': 5,
+                'rows': 5,
+                'sub_rows': 5,
+                'items': 5}
+
+CacheEntry = namedtuple('CacheEntry', 'expires result tags')
+
+ITEM_ID_VARIABLES = ('ids', 'itemId', 'parentId')
+ITEM_ID_TEXT = re.compile(r'(?:items \(ids: \[|item_id: |parent_item_id: )([\d, ]+)')
+
+
+class ResponseCache(object):
+    def __init__(self, max_entries=MAX_ENTRIES, default_ttl=DEFAULT_TTL_SECONDS, ttls: dict = None):
+        assert max_entries > 0, "max_entries must be 1 or more"
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls is not None:
+            self.ttls.update(ttls)
+        self._entries = OrderedDict()
+        self._tags = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    # shared by every copy of a board, webhooks invalidate the one cache
+    __cache_shared__ = True
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    @staticmethod
+    def text(query) -> str:
+        return query.get('query') if isinstance(query, dict) else str(query)
+
+    @staticmethod
+    def is_mutation(query) -> bool:
+        return ResponseCache.text(query).lstrip().startswith('mutation')
+
+    @staticmethod
+    def operation(query) -> str:
+        """ the template name of a query, or the first field for queries that are not templates """
+        text = ResponseCache.text(query)
+        match = re.match(r'\s*query\s+(\w+)', text)
+        if match is None:
+            match = re.search(r'\{\s*(\w+)', text)
+        return match.group(1) if match is not None else ''
+
+    @staticmethod
+    def key(monday_token, query) -> str:
+        scope = hashlib.sha256(str(monday_token).encode('utf-8')).hexdigest()[:16]
+        if not isinstance(query, dict):
+            query = {'query': ' '.join(str(query).split())}
+        return f"{scope}:{QueryTemplates.cache_key(query)}"
+
+    @staticmethod
+    def item_ids(query) -> set:
+        """ the item ids a query reads or changes, from the variables of a template or from the query text """
+        ids = set()
+        variables = query.get('variables') if isinstance(query, dict) else None
+        for name in ITEM_ID_VARIABLES:
+            value = (variables or {}).get(name)
+            if value is None:
+                continue
+            ids.update(str(v) for v in (value if isinstance(value, (list, tuple)) else [value]))
+        for match in ITEM_ID_TEXT.findall(ResponseCache.text(query)):
+            ids.update(i.strip() for i in match.split(',') if i.strip())
+        return ids
+
+    @staticmethod
+    def tags(query, board_id=None) -> set:
+        tags = {('item', i) for i in ResponseCache.item_ids(query)}
+        if board_id is not None:
+            tags.add(('board', str(board_id)))
+        return tags
+
+    def ttl(self, query):
+        return self.ttls.get(self.operation(query), self.default_ttl)
+
+    def get(self, monday_token, query):
+        """ a copy of the cached result or None, expired entries are removed """
+        if self.is_mutation(query):
+            return None
+        key = self.key(monday_token, query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            result = entry.result
+        # callers change the json they are given, every hit gets its own copy
+        return Result(result.status.code, message=result.status.message, data=copy.deepcopy(result.data))
+
+    def put(self, monday_token, query, result: Result, board_id=None):
+        if self.is_mutation(query) or not result.is_ok():
+            return
+        ttl = self.ttl(query)
+        if ttl is None or ttl <= 0:
+            return
+        key = self.key(monday_token, query)
+        entry = CacheEntry(monotonic() + ttl, Result(result.status.code, message=result.status.message,
+                                                     data=copy.deepcopy(result.data)), self.tags(query, board_id))
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = entry
+            for tag in entry.tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if len(keys) == 0:
+                    self._tags.pop(tag)
+
+    def invalidate(self, board_id=None, item_id=None) -> int:
+        """ removes the entries for the board and for the item, returns the number of entries removed """
+        tags = []
+        if board_id is not None:
+            tags.append(('board', str(board_id)))
+        if item_id is not None:
+            tags.append(('item', str(item_id)))
+        removed = 0
+        with self._lock:
+            for tag in tags:
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+                    removed += 1
+            self.invalidations += removed
+        return removed
+
+    def invalidate_query(self, query, board_id=None) -> int:
+        """ removes the entries a mutation may have changed, its board and every item in it """
+        removed = self.invalidate(board_id=board_id)
+        variables = query.get('variables') if isinstance(query, dict) else None
+        if (variables or {}).get('boardId') is not None and str(variables.get('boardId')) != str(board_id):
+            removed += self.invalidate(board_id=variables.get('boardId'))
+        for item_id in self.item_ids(query):
+            removed += self.invalidate(item_id=item_id)
+        return removed
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+
+    @property
+    def size(self):
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        return {'size': self.size, 'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'invalidations': self.invalidations}
+
+    @staticmethod
+    def from_environment():
+        """ a cache when MONDAY_RESPONSE_CACHE_SIZE is set, else None """
+        size = os.environ.get(RESPONSE_CACHE_SIZE_ENV)
+        if size is None or len(size.strip()) == 0:
+            return None
+        return ResponseCache(max_entries=int(size))
@@ -32,6 +32,9 @@ from monday.c_subitem import SubItem
 
 
 class Row:
+    __slots__ = ('on_monday', 'group_id', 'board', 'group_name', 'row_id', 'row_name', 'sub_items', 'sub_multimap',
+                 'assets', 'cells', 'cell_map', 'cell_db_map', 'key', 'has_subitems', 'readonly')
+
     def __init__(self, board):
         self.on_monday = False
         self.group_id = None
@@ -46,12 +49,17 @@ class Row:
         self.cell_map = {}
         self.cell_db_map = {}
         self.key = None
+        self.has_subitems = False
 
         # if the different types of boards have different default group names and id's we can fix that here
         self._set_default_group()
 
         self.readonly = FieldValue()
-        self.title = Title()
+
+    @property
+    def title(self) -> Title:
+        """ column names by db name, they are the same for every row so the board keeps one copy """
+        return self.board.row_titles
 
     @staticmethod
     def get_asset_from_json(d) -> []:
@@ -151,6 +159,16 @@ class Row:
 
                 self.load_sub_rows(sub_ids)
 
+    @property
+    def loaded_cells(self):
+        """ the cells that have been created, a cell that was never created can not have been modified.
+            every cell unless the row is a LazyRow """
+        return self.cells
+
+    def find_cell(self, name):
+        """ the cell with the name or None, without a warning """
+        return self.cell_map.get(name) if self.cell_map is not None else None
+
     @property
     def cell_count(self):
         """Get the cell count for this row"""
@@ -256,7 +274,7 @@ class Row:
         assert isinstance(cells, list), "Update Columns Requires a list of 1 or more cells"
         result = Result(-1, message="No Cells to Update")
         if cells is not None:
-            result = self.board.monday_update(self.row_id, self.cells, add_missing_labels)
+            result = self.board.monday_update(self.row_id, self.loaded_cells, add_missing_labels)
             if result.is_ok():
                 for cell in cells:
                     if cell.modified:
@@ -268,7 +286,7 @@ class Row:
     def warn_if_column_has_been_modified(self, names):
         if isinstance(names, str):
             names = [names, ]
-        for c in self.cells:
+        for c in self.loaded_cells:
             if c.modified and c.name not in names:
                 logging.warning(f"Field [{c.name}] has been modified but is not going to be updated")
 
@@ -316,10 +334,10 @@ class Row:
                     except Exception as ex:
                         logging.warning(f"Not able to set col [{column_name}] to value [{value}]: Err -> {ex} ")
 
-                result = self.board.monday_update(self.row_id, self.cells, add_missing_labels)
+                result = self.board.monday_update(self.row_id, self.loaded_cells, add_missing_labels)
                 if result.is_ok():
                     # mark the cells as updated if successful
-                    for cell in self.cell_map.values():
+                    for cell in self.loaded_cells:
                         if cell.modified:
                             cell.modified = False
 
@@ -329,6 +347,11 @@ class Row:
 
         return result
 
+    def reindex(self):
+        """ updates the board's indexes after a value of this row changed, see BoardIndex """
+        if self.board is not None:
+            self.board.indexes.update(self)
+
     def get_value(self, name, default=None):
         return self.get(name, default)
 
@@ -566,3 +589,128 @@ class Row:
                 value = c.value
             retval[Format(c.name).snake_case] = value
         return retval
+
+
+# the slots of Row, LazyRow replaces the attributes with properties that read and write the same slots
+_CELLS = Row.cells
+_CELL_MAP = Row.cell_map
+_CELL_DB_MAP = Row.cell_db_map
+_READONLY = Row.readonly
+
+
+class LazyRow(Row):
+    """
+    a row from select(lazy=True), it keeps the column_values json of the item and creates the cell for a column the
+    first time get, cell or set asks for it.  cells, cell_map, cell_db_map and readonly create the cells that are
+    left, in the same order as a Row, so code that walks every cell sees the same row.
+        Example: for row in board.select(lazy=True).data:
+                    if row.get_value('Status') == 'Done':      # creates the name cell and the Status cell only
+    """
+    __slots__ = ('_columns_json',)
+
+    def __init__(self, board, columns_json=None):
+        self._columns_json = None
+        super().__init__(board)
+        self._columns_json = columns_json
+
+    def defer(self, columns_json):
+        """ the column_values json the cells are created from """
+        self._columns_json = columns_json
+
+    @property
+    def is_loaded(self):
+        """ True when every cell has been created """
+        return self._columns_json is None
+
+    @property
+    def cells(self):
+        self.load_cells()
+        return _CELLS.__get__(self)
+
+    @cells.setter
+    def cells(self, x):
+        # the cells are replaced, the json is not used any more
+        self._columns_json = None
+        _CELLS.__set__(self, x)
+
+    @property
+    def cell_map(self):
+        self.load_cells()
+        return _CELL_MAP.__get__(self)
+
+    @cell_map.setter
+    def cell_map(self, x):
+        _CELL_MAP.__set__(self, x)
+
+    @property
+    def cell_db_map(self):
+        self.load_cells()
+        return _CELL_DB_MAP.__get__(self)
+
+    @cell_db_map.setter
+    def cell_db_map(self, x):
+        _CELL_DB_MAP.__set__(self, x)
+
+    @property
+    def readonly(self):
+        self.load_cells()
+        return _READONLY.__get__(self)
+
+    @readonly.setter
+    def readonly(self, x):
+        _READONLY.__set__(self, x)
+
+    @property
+    def loaded_cells(self):
+        return _CELLS.__get__(self)
+
+    def find_cell(self, name):
+        cell_object = _CELL_MAP.__get__(self).get(name)
+        if cell_object is None and self._columns_json is not None:
+            column: Column = self.board.column_info_map.get(name)
+            if column is None:
+                return None
+            for cell_json in self._columns_json:
+                if cell_json.get('id') == column.id:
+                    cell_object = self._create_cell(cell_json)
+                    if cell_object is not None:
+                        _CELLS.__get__(self).append(cell_object)
+                    break
+        return cell_object
+
+    def cell(self, name) -> Cell:
+        """lookup a cell by name and return it, the cell is created the first time"""
+        cell_object = self.find_cell(name)
+        if cell_object is None:
+            logging.warning(f"row.cell -> Unable to locate field with the name [{name}]")
+            return Cell(self)
+        return cell_object
+
+    def _create_cell(self, cell_json):
+        column: Column = self.board.column_id_map.get(cell_json.get('id'))
+        if column is None:
+            return None
+        new_cell = Cell.from_json(self, column, self.board.column_info_map.get(column.name), cell_json)
+        _CELL_MAP.__get__(self)[new_cell.name] = new_cell
+        cell_db_map = _CELL_DB_MAP.__get__(self)
+        if new_cell.db_name not in cell_db_map:
+            cell_db_map[new_cell.db_name] = new_cell
+        setattr(_READONLY.__get__(self), column.field_name, new_cell.value)
+        return new_cell
+
+    def load_cells(self):
+        """ creates the cells that have not been used yet, the cells end up in the order of a Row """
+        columns_json = self._columns_json
+        if columns_json is None:
+            return
+        self._columns_json = None
+        cells = _CELLS.__get__(self)
+        created = {c.id: c for c in cells}
+        ordered = [c for c in cells if c.source is None]
+        for cell_json in columns_json:
+            cell_object = created.get(cell_json.get('id'))
+            if cell_object is None:
+                cell_object = self._create_cell(cell_json)
+            if cell_object is not None:
+                ordered.append(cell_object)
+        _CELLS.__set__(self, ordered)
@@ -0,0 +1,68 @@
+"""
+SchemaCache: keeps the board schema (columns, label settings, groups, permissions) on disk.
+
+A new Board normally asks Monday.com for its columns and groups, with a schema cache a worker process that starts
+up, or a webhook that needs a board, builds the Board from the file instead.  Entries are keyed by the board id and
+a hash of the monday token (the token itself is never written), they expire after expire_seconds and are checked
+before they are used.  Adding or renaming a column, creating a group or creating labels removes the entry, and
+MondayFactory.refresh or board(clear_cache=True) read the schema from monday again.
+
+Set MONDAY_SCHEMA_CACHE_DIR to use the cache for every board, MONDAY_SCHEMA_CACHE_SECONDS changes the expire time.
+    Example: board = Board(board_id, token, schema_cache=SchemaCache('/var/cache/monday'))
+"""
+import hashlib
+import os
+
+from cache.c_disk_cache import DiskCache
+
+SCHEMA_CACHE_DIR_ENV = 'MONDAY_SCHEMA_CACHE_DIR'
+SCHEMA_CACHE_SECONDS_ENV = 'MONDAY_SCHEMA_CACHE_SECONDS'
+SCHEMA_CACHE_VERSION = 1
+SCHEMA_EXPIRE_SECONDS = 3600
+
+
+class SchemaCache(DiskCache):
+    # shared by the boards, not part of their size in a CachedResource
+    __cache_shared__ = True
+
+    def __init__(self, directory, expire_seconds=SCHEMA_EXPIRE_SECONDS):
+        super().__init__(directory, expire_seconds=expire_seconds, version=SCHEMA_CACHE_VERSION)
+
+    @staticmethod
+    def token_scope(monday_token) -> str:
+        return hashlib.sha256(str(monday_token).encode('utf-8')).hexdigest()[:16]
+
+    @staticmethod
+    def is_valid(board_info_json) -> bool:
+        """ True if the json has a board with columns and groups """
+        try:
+            board = board_info_json.get('data').get('boards')[0]
+            return isinstance(board.get('columns'), list) and len(board.get('columns')) > 0 \
+                and isinstance(board.get('groups'), list)
+        except (AttributeError, IndexError, TypeError):
+            return False
+
+    def get_schema(self, board_id, monday_token):
+        board_info_json = self.get_cache_item(board_id, self.token_scope(monday_token), 'schema')
+        if board_info_json is None:
+            return None
+        if not self.is_valid(board_info_json):
+            self.remove_schema(board_id, monday_token)
+            return None
+        return board_info_json
+
+    def put_schema(self, board_id, monday_token, board_info_json):
+        if self.is_valid(board_info_json):
+            self.update_cache(board_info_json, board_id, self.token_scope(monday_token), 'schema')
+
+    def remove_schema(self, board_id, monday_token):
+        self.remove(board_id, self.token_scope(monday_token), 'schema')
+
+    @staticmethod
+    def from_environment():
+        """ the schema cache set up by MONDAY_SCHEMA_CACHE_DIR or None """
+        directory = os.environ.get(SCHEMA_CACHE_DIR_ENV)
+        if not directory:
+            return None
+        expire_seconds = int(os.environ.get(SCHEMA_CACHE_SECONDS_ENV, SCHEMA_EXPIRE_SECONDS))
+        return SchemaCache(directory, expire_seconds=expire_seconds)
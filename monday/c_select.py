@@ -1,16 +1,25 @@
 """
 Class Select
 """
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
 from conversion.c_format import Format
 from monday.c_cell import Cell
 from monday.c_column import Column
+from monday.c_filter import MondayFilter
 from monday.c_query_helper import QueryHelper
-from monday.c_row import Row
+from monday.c_query_templates import QueryTemplates
+from monday.c_row import Row, LazyRow
 from result.c_result import Result
 import logging
-from std_utility.c_datetime import DateTime
 from std_utility.c_maps import Maps
-from std_utility.c_utility import Utility
+
+SelectPlan = namedtuple('SelectPlan', 'column_id fields groups select_by_group lazy', defaults=(False,))
+
+SUBITEM_COLUMN_IDS = ('subitems', 'subitems2')
+
+MAX_SELECT_WORKERS = 4
 
 
 class MondaySelect(QueryHelper):
@@ -99,6 +108,18 @@ class MondaySelect(QueryHelper):
 
         return MondaySelect.clean_query(cmd)
 
+    @staticmethod
+    def groups_page_query(board_id, groups=None, fields=None, limit=100, cursor=None, q_filter=None) -> dict:
+        """ the select_groups template, the text is the same for every page so only the variables change """
+        if cursor is not None:
+            q_filter = None                     # note can not have a cursor and a qfilter
+        if isinstance(groups, str):
+            groups = [groups]
+        if isinstance(fields, str):
+            fields = [fields]
+        return QueryTemplates.query('select_groups', fragments={'QUERY_PARAMS': q_filter},
+                                    boardId=[board_id], groups=groups, limit=limit, cursor=cursor, fields=fields)
+
     @staticmethod
     def get_rows_from_select(full_json_response, select_by_group=True):
         cursor = None
@@ -130,66 +151,213 @@ class MondaySelect(QueryHelper):
         assert parent_board is not None, "Parent Board is Required for group select"
         assert board_id is not None, "Board_id is Required for group select"
 
+    @staticmethod
+    def plan(parent_board, groups=None, fields=None, col_name=None, operator=None, lazy=False) -> SelectPlan:
+        """ converts names to monday ids and decides if we select by group or by column values, lazy makes
+            LazyRow rows """
+        if isinstance(groups, str):
+            groups = [groups]
+
+        column_id = MondaySelect.get_field_id(parent_board=parent_board, column_name=col_name)
+        fields = MondaySelect.get_field_ids(parent_board=parent_board, fields=fields)
+        groups = MondaySelect.get_group_ids(parent_board=parent_board, groups=groups)
+        select_by_group = MondaySelect.is_by_group(groups, column_id, operator)
+        return SelectPlan(column_id=column_id, fields=fields, groups=groups, select_by_group=select_by_group,
+                          lazy=lazy)
+
+    @staticmethod
+    def page_query(parent_board, board_id, plan: SelectPlan, col_values=None, limit=1000, page=0,
+                   cursor=None, q_filter=None) -> dict:
+        """ creates the query for one page of a select """
+        if plan.select_by_group:
+            return MondaySelect.groups_page_query(board_id=board_id,
+                                                  groups=plan.groups,
+                                                  fields=plan.fields,
+                                                  limit=limit,
+                                                  cursor=cursor,
+                                                  q_filter=q_filter)
+        else:
+            cmd = MondaySelect.monday_query_by_col_values(board_id=board_id,
+                                                          column_id=plan.column_id,
+                                                          col_values=col_values,
+                                                          fields=plan.fields,
+                                                          limit=limit,
+                                                          page=page,
+                                                          cursor=cursor,
+                                                          q_filter=q_filter)
+        return parent_board.gen_query(cmd)
+
+    @staticmethod
+    def read_page(result, plan: SelectPlan):
+        """ returns the items in a page and the cursor for the next page (None when there are no more pages) """
+        items_cursor = MondaySelect.get_cursor(result)
+        items, cursor = MondaySelect.get_rows_from_select(result.data, select_by_group=plan.select_by_group)
+        return items, items_cursor
+
+    @staticmethod
+    def finish(parent_board, items, plan: SelectPlan, col_name=None, operator=None, col_values=None,
+               track=True) -> Result:
+        """ creates the rows from the items and applies our own filter """
+        rows = MondaySelect.process_rows(parent_board=parent_board, items=items, track=track, lazy=plan.lazy)
+
+        # do our own filtering here.
+        if plan.select_by_group:
+            if plan.column_id == 'name' and operator is None:
+                operator = '='
+            rows = MondaySelect.filter(col_name, operator, col_values, rows, parent_board=parent_board)
+        return Result(0, data=rows)
+
+    @staticmethod
+    def fetch(parent_board, board_id, plan: SelectPlan, col_values=None, limit=1000, q_filter=None) -> Result:
+        """ follows the cursor chain for a plan and returns the items as json, the board is not changed so
+            fetch can run on a worker thread """
+        result_items = []
+        finished = False
+        page = 0
+        items_cursor = None
+        while not finished:
+            cmd = MondaySelect.page_query(parent_board, board_id, plan, col_values=col_values, limit=limit,
+                                          page=page, cursor=items_cursor, q_filter=q_filter)
+            result = parent_board.execute(cmd)
+            if result.is_ok():
+                items, items_cursor = MondaySelect.read_page(result, plan)
+                finished = items_cursor is None
+                result_items.extend(items)
+                logging.debug(f"Processed Select Page {page}, and item count = {len(result_items)}")
+                page = page + 1
+            else:
+                return result
+
+        logging.debug(f"{len(result_items)} items using {page - 1} pages")
+        return Result(0, data=result_items)
+
     @staticmethod
     def group(parent_board, board_id, groups=None, fields=None,
               col_name=None,
               operator=None,
               col_values=None,
               limit=1000,
-              q_filter=None):
+              q_filter=None,
+              lazy=False):
 
         MondaySelect.check_group_inputs(parent_board, board_id)
 
-        if isinstance(groups, str):
-            groups = [groups]
+        plan = MondaySelect.plan(parent_board, groups=groups, fields=fields, col_name=col_name, operator=operator,
+                                 lazy=lazy)
+        result = MondaySelect.fetch(parent_board, board_id, plan, col_values=col_values, limit=limit,
+                                    q_filter=q_filter)
+        if result.is_error():
+            return result
 
-        result_items = []
+        return MondaySelect.finish(parent_board, result.data, plan, col_name, operator, col_values)
+
+    @staticmethod
+    def iter_group(parent_board, board_id, groups=None, fields=None,
+                   col_name=None,
+                   operator=None,
+                   col_values=None,
+                   limit=1000,
+                   q_filter=None,
+                   lazy=False):
+        """ same as group, but yields the rows one page at a time, the json for a page is released once its rows
+            are created and the rows are not kept in the board's row_multimap, so memory stays flat.
+            raises an Exception when monday returns an error """
+
+        MondaySelect.check_group_inputs(parent_board, board_id)
+
+        plan = MondaySelect.plan(parent_board, groups=groups, fields=fields, col_name=col_name, operator=operator,
+                                 lazy=lazy)
         finished = False
-        column_id = MondaySelect.get_field_id(parent_board=parent_board, column_name=col_name)
-        fields = MondaySelect.get_field_ids(parent_board=parent_board, fields=fields)
-        groups = MondaySelect.get_group_ids(parent_board=parent_board, groups=groups)
-        select_by_group = MondaySelect.is_by_group(groups, column_id, operator)
         page = 0
         items_cursor = None
         while not finished:
-            if select_by_group:
-                cmd = MondaySelect.monday_query_by_groups(board_id=board_id,
-                                                          groups=groups,
-                                                          fields=fields,
-                                                          limit=limit,
-                                                          page=page,
-                                                          cursor=items_cursor,
-                                                          q_filter=q_filter)
-            else:
-                cmd = MondaySelect.monday_query_by_col_values(board_id=board_id,
-                                                              column_id=column_id,
-                                                              col_values=col_values,
-                                                              fields=fields,
-                                                              limit=limit,
-                                                              page=page,
-                                                              cursor=items_cursor,
-                                                              q_filter=q_filter)
-            cmd = parent_board.gen_query(cmd)
+            cmd = MondaySelect.page_query(parent_board, board_id, plan, col_values=col_values, limit=limit,
+                                          page=page, cursor=items_cursor, q_filter=q_filter)
             result = parent_board.execute(cmd)
+            if result.is_error():
+                # the rows already yielded are only part of the result, the caller has to know
+                logging.error(f"Select stopped at page {page}: {result.message}")
+                raise Exception(f"iter_select -> Select stopped at page {page}: {result.message}")
+
+            items, items_cursor = MondaySelect.read_page(result, plan)
+            finished = items_cursor is None
+            result = None
+            rows = MondaySelect.finish(parent_board, items, plan, col_name, operator, col_values, track=False).data
+            items = None
+            logging.debug(f"Streamed Select Page {page}, and row count = {len(rows)}")
+            page = page + 1
+            yield from rows
+
+    @staticmethod
+    def fetch_parallel(parent_board, board_id, plans: [SelectPlan], col_values=None, limit=1000, q_filter=None,
+                       max_workers=MAX_SELECT_WORKERS) -> [Result]:
+        """ runs fetch for each plan on worker threads, at most max_workers at a time, results are in plan order """
+        workers = max(1, min(max_workers or MAX_SELECT_WORKERS, len(plans)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='monday-select') as executor:
+            futures = [executor.submit(MondaySelect.fetch, parent_board, board_id, plan, col_values, limit, q_filter)
+                       for plan in plans]
+            return [future.result() for future in futures]
+
+    @staticmethod
+    def groups_parallel(parent_board, board_id, groups, fields=None,
+                        col_name=None,
+                        operator=None,
+                        col_values=None,
+                        limit=1000,
+                        q_filter=None,
+                        lazy=False,
+                        max_workers=MAX_SELECT_WORKERS) -> [Result]:
+        """ reads each group's cursor chain on its own worker thread, at most max_workers at a time.
+            The rows are created afterwards on this thread, in group order, so the results match group(). """
+
+        MondaySelect.check_group_inputs(parent_board, board_id)
+
+        plans = [MondaySelect.plan(parent_board, groups=group_id, fields=fields, col_name=col_name, operator=operator,
+                                   lazy=lazy)
+                 for group_id in groups]
+        fetched = MondaySelect.fetch_parallel(parent_board, board_id, plans, col_values=col_values, limit=limit,
+                                              q_filter=q_filter, max_workers=max_workers)
+
+        results = []
+        for plan, result in zip(plans, fetched):
+            if result.is_ok():
+                result = MondaySelect.finish(parent_board, result.data, plan, col_name, operator, col_values)
+            results.append(result)
+        return results
+
+    @staticmethod
+    async def group_async(parent_board, board_id, groups=None, fields=None,
+                          col_name=None,
+                          operator=None,
+                          col_values=None,
+                          limit=1000,
+                          q_filter=None,
+                          lazy=False):
+        """ same as group, the pages are read using execute_async so other selects can run at the same time """
+
+        MondaySelect.check_group_inputs(parent_board, board_id)
+
+        result_items = []
+        finished = False
+        plan = MondaySelect.plan(parent_board, groups=groups, fields=fields, col_name=col_name, operator=operator,
+                                 lazy=lazy)
+        page = 0
+        items_cursor = None
+        while not finished:
+            cmd = MondaySelect.page_query(parent_board, board_id, plan, col_values=col_values, limit=limit,
+                                          page=page, cursor=items_cursor, q_filter=q_filter)
+            result = await parent_board.execute_async(cmd)
             if result.is_ok():
-                items_cursor = MondaySelect.get_cursor(result)
-                items, cursor = MondaySelect.get_rows_from_select(result.data, select_by_group=select_by_group)
+                items, items_cursor = MondaySelect.read_page(result, plan)
                 finished = items_cursor is None
                 result_items.extend(items)
-                logging.debug(f"Processed Select Page {page}, and item count = {len(result_items)}")
+                logging.debug(f"Processed async Select Page {page}, and item count = {len(result_items)}")
                 page = page + 1
             else:
                 return result
 
         logging.debug(f"{len(result_items)} items using {page - 1} pages")
-        rows = MondaySelect.process_rows(parent_board=parent_board, items=result_items)
-
-        # do our own filtering here.
-        if select_by_group:
-            if column_id == 'name' and operator is None:
-                operator = '='
-            rows = MondaySelect.filter(col_name, operator, col_values, rows)
-        return Result(0, data=rows)
+        return MondaySelect.finish(parent_board, result_items, plan, col_name, operator, col_values)
 
     @staticmethod
     def get_cursor(result):
@@ -213,14 +381,18 @@ class MondaySelect(QueryHelper):
         return items_cursor
 
     @staticmethod
-    def process_rows(parent_board, items):
+    def process_rows(parent_board, items, track=True, lazy=False):
+        """ creates rows from the items, track=False leaves the rows out of the board's row_multimap.
+            lazy=True creates LazyRow rows, a cell is only created the first time it is used """
         rows = []
         try:
             # remove any rows that do not match our filters (only if there is a filter)
             load_subitems = False
+            name_column: Column = parent_board.column_id_map.get('name')
+            has_subitems = None
             # now process the rows that remain
             for this_row in items:
-                new_row = Row(parent_board)
+                new_row = LazyRow(parent_board) if lazy else Row(parent_board)
 
                 new_row.on_monday = True
                 new_row.group_id = this_row.get('group', {}).get('id')
@@ -229,64 +401,37 @@ class MondaySelect(QueryHelper):
                 new_row.row_name = Format.as_ascii(this_row.get('name'))
                 new_row.assets = this_row.get('assets')
                 columns_json = this_row.get('column_values')
-                Maps.add_to_map_array(parent_board.row_multimap, new_row.row_name, new_row)
+                if track:
+                    Maps.add_to_map_array(parent_board.row_multimap, new_row.row_name, new_row)
 
                 # add the item to the cells and update maps
-                new_cell = Cell(new_row)
-
-                new_cell.row_id = new_row.row_id
-                new_cell.id = 'name'
-                new_cell.name = parent_board.column_id_map.get(new_cell.id).name
-                new_cell.labels = parent_board.column_id_map.get(new_cell.id).labels
-                new_cell.value = new_row.row_name
-                new_cell.type = 'text'
-                new_cell.index = len(columns_json) + 1
-                new_cell.parent_row = new_row
-                new_cell.parent_row = new_row
-                new_cell._modified = False
-                new_row.cells.append(new_cell)
-                new_row.cell_map[new_cell.name] = new_cell
-                new_row.cell_db_map[new_cell.id] = new_cell
-                setattr(new_row.readonly, Utility.db_name(new_cell.name), new_cell.value)
-                setattr(new_row.title, Utility.db_name(new_cell.name), new_cell.name)
-
-                # add the column info, need to do it here because it does not exist when we read the columns
-                new_column_info = Column(new_cell.index, new_cell.id, new_cell.name, new_cell.type)
-                parent_board.column_info_map[new_cell.name] = new_column_info
+                MondaySelect.add_name_cell(parent_board, new_row, name_column, len(columns_json) + 1)
+
+                # the items of a page have the same columns, the titles are set once from the first item
+                if has_subitems is None:
+                    has_subitems = MondaySelect.set_titles(parent_board, columns_json)
+
+                if lazy:
+                    new_row.has_subitems = has_subitems
+                    new_row.defer(columns_json)
+                    rows.append(new_row)
+                    continue
 
                 # now get the cells from the json columns (from monday), create cells and stor them in a row
                 for this_cell in columns_json:
-                    new_cell = Cell(new_row)
-                    new_cell.source = this_cell
-                    new_cell.row_id = new_row.row_id
-                    new_cell.id = this_cell.get('id')
                     # since monday renames the first field, and it could conflict with other names, we need to get the
                     # updated name from the column info map that handles duplicate names.
-                    column: Column = parent_board.column_id_map.get(new_cell.id)
+                    column: Column = parent_board.column_id_map.get(this_cell.get('id'))
                     if column is None:
                         continue
-                    new_cell.name = column.name
-                    # Utility.clean_name(this_cell.get('title'))
-
-                    column_info: Column = parent_board.column_info_map.get(new_cell.name)
-                    new_cell.type = column_info.type
-                    new_cell.labels = column_info.labels
-                    new_cell.index = column_info.index
-                    new_cell.parent_row = new_row
-                    new_cell.has_labels = column_info.has_labels
-                    if column_info.type == 'date' or column_info.type == 'datetime':
-                        new_cell._value = DateTime(this_cell.get('text', '1970-01-01 00:00:00'))
-                    else:
-                        new_cell._value = this_cell.get('text')
-                    new_cell._modified = False
-                    # needs lookup to ensure new cell is saved with the correct name
+                    # type, labels, has_labels and index are read from the shared column
+                    new_cell = Cell.from_json(new_row, column, parent_board.column_info_map.get(column.name), this_cell)
 
                     new_row.cell_map[new_cell.name] = new_cell
                     new_row.cells.append(new_cell)
-                    setattr(new_row.readonly, Utility.db_name(new_cell.name), new_cell.value)
-                    setattr(new_row.title, Utility.db_name(new_cell.name), new_cell.name)
+                    setattr(new_row.readonly, column.field_name, new_cell.value)
 
-                    if new_cell.id == 'subitems' or new_cell.id == 'subitems2':
+                    if new_cell.id in SUBITEM_COLUMN_IDS:
                         new_row.has_subitems = True
                         sub_id = new_cell.id
                         if load_subitems:
@@ -302,40 +447,52 @@ class MondaySelect(QueryHelper):
         return rows
 
     @staticmethod
-    def filter(col_name=None, operator=None, col_values=None, rows=None):
-        result_list = []
+    def add_name_cell(parent_board, new_row: Row, name_column: Column, index):
+        """ the item name is the first cell of every row """
+        new_cell = Cell(new_row)
+        new_cell.row_id = new_row.row_id
+        new_cell.id = 'name'
+        new_cell._name = name_column.name
+        new_cell.db_name = name_column.db_name
+        new_cell.labels = name_column.labels
+        # set directly, the value setter marks the cell modified and a unit of work would track the loaded row
+        new_cell._value = new_row.row_name
+        new_cell.previous_value = new_row.row_name
+        new_cell.type = 'text'
+        new_cell.index = index
+        new_cell.parent_row = new_row
+        new_row.cells.append(new_cell)
+        new_row.cell_map[new_cell.name] = new_cell
+        new_row.cell_db_map[new_cell.db_name] = new_cell
+        setattr(new_row.readonly, name_column.field_name, new_cell.value)
+
+        # add the column info, need to do it here because it does not exist when we read the columns
+        column_info: Column = parent_board.column_info_map.get(new_cell.name)
+        if column_info is None or column_info.id != new_cell.id or column_info.index != index:
+            parent_board.column_info_map[new_cell.name] = Column(index, new_cell.id, new_cell.name, new_cell.type)
+
+    @staticmethod
+    def set_titles(parent_board, columns_json) -> bool:
+        """ sets the column names on the board's row titles, True if the item has a subitems column """
+        name_column: Column = parent_board.column_id_map.get('name')
+        setattr(parent_board.row_titles, name_column.field_name, name_column.name)
+        has_subitems = False
+        for this_cell in columns_json:
+            column: Column = parent_board.column_id_map.get(this_cell.get('id'))
+            if column is None:
+                continue
+            setattr(parent_board.row_titles, column.field_name, column.name)
+            has_subitems = has_subitems or column.id in SUBITEM_COLUMN_IDS
+        return has_subitems
+
+    @staticmethod
+    def filter(col_name=None, operator=None, col_values=None, rows=None, parent_board=None):
+        """ returns the rows that match, see MondayFilter, the values are parsed once for all rows """
         if rows is None:
             rows = []
-        if col_name is None or col_values is None:
+        if col_name is None or col_values is None or len(rows) == 0:
             return rows
 
-        if col_values is None:
-            col_values = []
-
-        for row in rows:
-            item = row.get(col_name).value
-            if operator is None:
-                if item in col_values:
-                    result_list.append(row)
-            else:
-                for val in col_values:
-                    if isinstance(item, DateTime):
-                        item = item.as_timestamp
-                        val = DateTime(val).as_timestamp
-                    if operator == '>':
-                        if item > val:
-                            result_list.append(row)
-                    elif operator == '<':
-                        if item < val:
-                            result_list.append(row)
-                    elif operator == '>=':
-                        if item >= val:
-                            result_list.append(row)
-                    elif operator == '<=':
-                        if item <= val:
-                            result_list.append(row)
-                    elif operator == '=':
-                        if str(item) == str(val):
-                            result_list.append(row)
-
-        return result_list
+        if parent_board is None:
+            parent_board = rows[0].board
+        return MondayFilter.for_board(parent_board, col_name, operator, col_values).apply(rows)
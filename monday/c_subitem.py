@@ -41,6 +41,15 @@ class SubItem(Column):
         """Get the cell count for this row"""
         return len(self.cells)
 
+    @property
+    def loaded_cells(self):
+        """ the cells of the subitem, the same as Row.loaded_cells """
+        return self.cells
+
+    def find_cell(self, name):
+        """ the cell with the name or None, the same as Row.find_cell """
+        return self.cell_map.get(name) if self.cell_map is not None else None
+
     def update_cell_map(self):
         """used to on demand update the cell map"""
         self.cell_map = {}
@@ -232,7 +241,6 @@ class SubItem(Column):
                 new_cell.labels = column_info.labels
                 new_cell.index = column_info.index
                 new_cell.parent_row = self
-                new_cell.connection = self.connection
                 new_cell.has_labels = column_info.has_labels
                 self.cells.append(new_cell)
 
@@ -245,6 +253,9 @@ class SubItem(Column):
             if target is not None and isinstance(target, list) and len(target) > 0:
                 columns_json = target[0].get('column_values')
                 for _col in columns_json:
+                    # column values have the title under column {title}
+                    if _col.get('title') is None and isinstance(_col.get('column'), dict):
+                        _col = dict(_col, title=_col.get('column').get('title'))
                     new_column = Column()
                     new_column.from_json(index, _col)
                     dup_col_idx = 0
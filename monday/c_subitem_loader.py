@@ -0,0 +1,87 @@
+"""
+SubItemLoader: loads the subitems of many rows with one query per 100 rows.
+
+Row.load_sub_items asks monday for the linked pulse ids of one row and then for its subitems, two requests for every
+row.  The loader asks for the subitems of up to batch_size parents at once (items (ids: ...) { subitems { ... } })
+and attaches them to their rows in one pass, a select of 1,000 rows needs 10 requests instead of 2,000.
+
+    Example: rows = board.select(groups='RTG', with_subitems=True).data
+             result = SubItemLoader(board).load(rows)       # result.data is the number of subitems loaded
+"""
+import logging
+
+from monday.c_query_templates import QueryTemplates
+from monday.c_subitem import SubItem
+from result.c_result import Result
+from std_utility.c_maps import Maps
+
+SUBITEM_BATCH_SIZE = 100        # monday returns at most 100 items for a list of ids
+
+
+class SubItemLoader:
+    def __init__(self, parent_board, batch_size=SUBITEM_BATCH_SIZE):
+        assert 0 < batch_size <= SUBITEM_BATCH_SIZE, f"batch_size must be 1 to {SUBITEM_BATCH_SIZE}"
+        self.parent_board = parent_board
+        self.batch_size = batch_size
+        self.requests = 0
+
+    def fetch(self, parent_ids) -> Result:
+        """ returns a result with {parent id: [subitem json]}, the first error stops the load """
+        subitems = {}
+        for start in range(0, len(parent_ids), self.batch_size):
+            batch = parent_ids[start:start + self.batch_size]
+            result = self.parent_board.execute(QueryTemplates.query('subitems', ids=batch))
+            self.requests += 1
+            if result.is_error():
+                return Result(result.status.code, message=result.status.message, data=subitems)
+            try:
+                for item in result.data.get('data').get('items'):
+                    subitems[str(item.get('id'))] = item.get('subitems') or []
+            except (AttributeError, TypeError) as ex:
+                return Result(-1, message=f"Unable to read subitems: {ex}", data=subitems)
+        return Result(0, data=subitems)
+
+    def column_map(self, subitems: dict) -> dict:
+        """ the subitem columns, from the first subitem, kept on the board like Row.load_sub_rows does """
+        for items in subitems.values():
+            if len(items) > 0:
+                col_map = SubItem.create_column_info_map({'data': {'items': items[:1]}})
+                if len(col_map) > 0:
+                    self.parent_board.column_info_sub_map = col_map
+                break
+        return self.parent_board.column_info_sub_map
+
+    def attach(self, row, items, col_map):
+        row.sub_items = []
+        row.sub_multimap = {}
+        for item in items:
+            board = item.get('board')
+            sub_item = SubItem(board=self.parent_board, parent_row=row, row_id=item.get('id'),
+                               row_name=item.get('name'), row_data=item.get('column_values'), col_map=col_map,
+                               assets=item.get('assets'),
+                               sub_board_id=board.get('id') if isinstance(board, dict) else None)
+            sub_item.on_monday = True
+            sub_item.update_cell_db_map()
+            sub_item.update_cell_map()
+            row.sub_items.append(sub_item)
+            Maps.add_to_map_array(row.sub_multimap, sub_item.row_name, sub_item)
+
+    def load(self, rows) -> Result:
+        """ loads the subitems of the rows that are on monday, returns a result with the number of subitems """
+        if not self.parent_board.has_subitems:
+            return Result(0, data=0)
+        by_id = {str(row.row_id): row for row in rows if row.on_monday and row.row_id is not None}
+        result = self.fetch(list(by_id.keys()))
+        if result.is_error():
+            logging.warning(f"Unable to load subitems: {result.message}")
+
+        col_map = self.column_map(result.data)
+        count = 0
+        for parent_id, items in result.data.items():
+            row = by_id.get(parent_id)
+            if row is not None:
+                self.attach(row, items, col_map)
+                count += len(items)
+        if result.is_error():
+            return Result(result.status.code, message=result.status.message, data=count)
+        return Result(0, data=count)
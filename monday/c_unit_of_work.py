@@ -0,0 +1,180 @@
+"""
+UnitOfWork: records the rows that change on a board and writes them to Monday.com with as few requests as possible.
+
+After board.begin() every cell that is marked modified adds its row to the unit of work, new rows, new subitems and
+deletes are added with insert(), add_subitem() and delete().  board.flush() sends everything as aliased mutations
+(see BatchUpdate) in this order, so a parent exists before its subitems are written:
+
+    1. new rows            create_item
+    2. row updates         change_multiple_column_values
+    3. new subitems        create_subitem
+    4. subitem updates     change_multiple_column_values on the subitem board
+    5. deletes             delete_item
+
+The result has a FlushOutcome for every row, a row that failed keeps its modified cells and stays in the unit of
+work, so the next flush tries it again.
+
+    Example: board.begin()
+             for row in board.select(group='RTG').data:
+                 row.set('Status', 'Done')
+             new_row = board.unit_of_work.insert(board.new_row('New item'))
+             board.unit_of_work.add_subitem(new_row, 'Task 1', {'Text': 'first'})
+             result = board.flush()
+"""
+import json
+import logging
+from collections import namedtuple
+
+from monday.c_batch_update import BatchUpdate, MAX_BATCH_SIZE
+from monday.c_column_value import ColumnValue
+from result.c_result import Result
+
+FlushOutcome = namedtuple('FlushOutcome', 'row action ok message')
+PendingSubitem = namedtuple('PendingSubitem', 'parent_row name q_data')
+
+INSERT = 'insert'
+UPDATE = 'update'
+SUBITEM_INSERT = 'subitem insert'
+SUBITEM_UPDATE = 'subitem update'
+DELETE = 'delete'
+
+
+class UnitOfWork:
+    def __init__(self, parent_board, batch_size=MAX_BATCH_SIZE, add_missing_labels=False):
+        self.parent_board = parent_board
+        self.batch_size = batch_size
+        self.add_missing_labels = add_missing_labels
+        # rows by id(row), a dict keeps the order the rows were changed in
+        self.rows = {}
+        self.subitems = []
+        self.deletes = {}
+
+    def __len__(self):
+        return len(self.rows) + len(self.subitems) + len(self.deletes)
+
+    def track(self, row):
+        """ called when a cell of the row is marked modified """
+        key = id(row)
+        if key not in self.rows and key not in self.deletes:
+            self.rows[key] = row
+
+    def insert(self, row):
+        """ adds a new row, it is inserted by the next flush, returns the row """
+        self.track(row)
+        return row
+
+    def add_subitem(self, parent_row, name, q_data=None) -> PendingSubitem:
+        """ adds a new subitem, q_data is a dict of column id / value pairs, the parent may be a new row """
+        subitem = PendingSubitem(parent_row, name, q_data)
+        self.subitems.append(subitem)
+        return subitem
+
+    def delete(self, row):
+        """ deletes the row with the next flush, pending changes for the row are dropped """
+        self.rows.pop(id(row), None)
+        self.subitems = [s for s in self.subitems if s.parent_row is not row]
+        if row.on_monday:
+            self.deletes[id(row)] = row
+
+    def clear(self):
+        self.rows = {}
+        self.subitems = []
+        self.deletes = {}
+
+    @staticmethod
+    def is_subitem(row) -> bool:
+        return getattr(row, 'sub_board_id', None) is not None
+
+    def insert_mutation(self, row) -> ():
+        return f'create_item (board_id: {self.parent_board.board_id}, group_id: "{row.group_id}", ' \
+               f'item_name: {json.dumps(row.row_name)}, column_values: $columnValues) {{id}}', \
+            ColumnValue.dumps(row.loaded_cells)
+
+    @staticmethod
+    def subitem_mutation(subitem: PendingSubitem) -> ():
+        return f'create_subitem (parent_item_id: {subitem.parent_row.row_id}, ' \
+               f'item_name: {json.dumps(subitem.name)}, column_values: $columnValues) ' \
+               f'{{id board {{id}} name assets {{public_url file_extension name}} ' \
+               f'column_values {{id column {{title}} value text type}}}}', ColumnValue.dumps(subitem.q_data)
+
+    @staticmethod
+    def delete_mutation(row) -> ():
+        return f'delete_item (item_id: {row.row_id}) {{id}}', None
+
+    def flush(self) -> Result:
+        """ writes every pending change, returns a result with a list of FlushOutcome """
+        batch = BatchUpdate(self.parent_board, self.batch_size, self.add_missing_labels)
+        report = []
+
+        pending = list(self.rows.values())
+        inserts = [row for row in pending if not row.on_monday and not self.is_subitem(row)]
+        updates = [row for row in pending if row.on_monday and not self.is_subitem(row)
+                   and len(BatchUpdate.modified_cells(row)) > 0]
+        sub_updates = [row for row in pending if row.on_monday and self.is_subitem(row)
+                       and len(BatchUpdate.modified_cells(row)) > 0]
+        done = {id(row) for row in pending if row.on_monday and len(BatchUpdate.modified_cells(row)) == 0}
+        for row in pending:
+            if not row.on_monday and self.is_subitem(row):
+                logging.warning(f"Subitem [{row.row_name}] is not on monday, use add_subitem to create it")
+                done.add(id(row))
+
+        answers = batch.run([self.insert_mutation(row) for row in inserts])
+        for row, (item, message) in zip(inserts, answers):
+            if item is not None:
+                row.row_id = item.get('id')
+                row.on_monday = True
+                BatchUpdate.mark_updated(row)
+                if row.key is not None:
+                    self.parent_board.row_key_map[row.key] = row
+                self.parent_board.rows.append(row)
+                self.parent_board.indexes.add(row)
+                done.add(id(row))
+            report.append(FlushOutcome(row, INSERT, item is not None, message))
+
+        self._updates(batch, updates, UPDATE, report, done)
+
+        # subitems of a parent that could not be inserted wait for the next flush
+        subitems = [s for s in self.subitems if s.parent_row.on_monday]
+        answers = batch.run([self.subitem_mutation(s) for s in subitems])
+        failed_subitems = [s for s in self.subitems if not s.parent_row.on_monday]
+        for subitem, (item, message) in zip(subitems, answers):
+            if item is not None:
+                sub_item = self.parent_board.sub_item_add_row(parent_row=subitem.parent_row, sub_row_dict=item)
+                report.append(FlushOutcome(sub_item, SUBITEM_INSERT, True, None))
+            else:
+                failed_subitems.append(subitem)
+                report.append(FlushOutcome(subitem.parent_row, SUBITEM_INSERT, False, message))
+        self.subitems = failed_subitems
+
+        self._updates(batch, sub_updates, SUBITEM_UPDATE, report, done)
+
+        deletes = list(self.deletes.values())
+        answers = batch.run([self.delete_mutation(row) for row in deletes])
+        deleted = set()
+        for row, (item, message) in zip(deletes, answers):
+            if item is not None:
+                deleted.add(id(row))
+                row.on_monday = False
+                del self.deletes[id(row)]
+            report.append(FlushOutcome(row, DELETE, item is not None, message))
+        if len(deleted) > 0:
+            self.parent_board.rows = [row for row in self.parent_board.rows if id(row) not in deleted]
+
+        for key in done:
+            self.rows.pop(key, None)
+
+        failed = [outcome for outcome in report if not outcome.ok]
+        for outcome in failed:
+            logging.warning(f"Flush {outcome.action} [{outcome.row.row_id}] failed: {outcome.message}")
+        logging.debug(f"Flush sent {len(report)} changes in {batch.requests} requests")
+        if len(failed) > 0:
+            return Result(-1, message=f"{len(failed)} of {len(report)} changes failed", data=report)
+        return Result(0, data=report)
+
+    def _updates(self, batch: BatchUpdate, rows, action, report, done):
+        mutations = [batch.mutation(row) for row in rows]
+        for row, (item, message) in zip(rows, batch.run(mutations)):
+            if item is not None:
+                BatchUpdate.mark_updated(row)
+                done.add(id(row))
+            report.append(FlushOutcome(row, action, item is not None, message))
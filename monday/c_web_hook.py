@@ -1,3 +1,4 @@
+from monday.c_complexity_scheduler import Priority
 from monday.c_events import MondayEvent
 from monday.c_monday_factory import MondayFactory
 from monday.c_row import Row
@@ -31,12 +32,12 @@ class WebHook:
         data = event.data
 
         if WebHook.is_main_item(data):
-            board = monday.board(data.board_id, make_copy=True)
+            board = monday.board(data.board_id, make_copy=True, priority=Priority.webhook)
             board.rows = board.load_row(data.row_id)
             if board.row_count > 0:
                 self.the_row: Row = board.rows[0]
         else:
-            board = monday.board(data.parent_item_board_id, make_copy=True)
+            board = monday.board(data.parent_item_board_id, make_copy=True, priority=Priority.webhook)
             the_parent: [Row] = board.load_row(data.parent_item_id)
             if len(the_parent) > 0:
                 sub_row = the_parent[0].load_sub_row(data.row_id, data.board_id)
@@ -45,23 +46,40 @@ class WebHook:
 
         return self.the_row
 
+    @staticmethod
+    def invalidate(event):
+        """ the board and item of the event changed on monday, cached reads for them are removed """
+        cache = MondayFactory().response_cache
+        data = getattr(event, 'data', None)
+        if cache is None or data is None:
+            return
+        cache.invalidate(board_id=getattr(data, 'board_id', None), item_id=getattr(data, 'row_id', None))
+        cache.invalidate(item_id=getattr(data, 'parent_item_id', None))
+
+    def process_event(self, call_back, event: MondayEvent) -> Result:
+        """ loads the row the event is about and calls call_back(row) """
+        WebHook.invalidate(event)
+        try:
+            the_row = self.get_focused_row(event)
+            if the_row is not None:
+                # merged events from WebHookPipeline also pass the changed columns
+                changes = getattr(event, 'changes', None)
+                if changes is not None:
+                    return call_back(the_row, changes)
+                return call_back(the_row)
+
+        except Exception as ex:
+            logging.exception(ex)
+
+        return Result(-1, 'No Data to Process')
+
     @staticmethod
     def process_request(call_back, args):
-        if args is None or args is None:
+        if args is None:
             return Result(-1, 'Process request args are missing')
 
         data = args.get('event')
         if data is not None:
-            event = MondayEvent(data)
-
-            try:
-                the_row = WebHook.get_focused_row(event)
-                if the_row is not None:
-                    p_result = call_back(the_row)
-                    return p_result
-
-            except Exception as ex:
-                log_traceback(ex)
-                logging.error(ex)
+            return WebHook().process_event(call_back, MondayEvent(data))
 
         return Result(-1, 'No Data to Process')
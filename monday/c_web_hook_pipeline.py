@@ -0,0 +1,264 @@
+"""
+WebHookPipeline: processes monday webhooks on a pool of worker threads instead of on the web server thread.
+
+submit() only checks the event and queues it, the web server can answer monday at once.  The workers load the row
+and call the callback, the same as WebHook.process_request.
+
+    ordering        events for one item (pulse_id) are processed one at a time in the order they arrived, events for
+                    different items run at the same time
+    back-pressure   when max_pending events are waiting submit() returns an error (code 429), the web server can
+                    answer with 429 and monday sends the webhook again later
+    dedupe          an event with a trigger_uuid seen in the last dedupe_size events is dropped, monday sends a
+                    webhook again when the answer was slow
+    debounce        with debounce_seconds the events for one item that arrive within debounce_seconds of the first
+                    one are merged into one CoalescedEvent, the row is loaded once and the callback is called as
+                    call_back(row, changes) with one change per column, see CoalescedEvent
+
+    Example: pipeline = WebHookPipeline(call_back, workers=8).start()
+             @app.route('/webhook', methods=['POST'])
+             def webhook():
+                 result = pipeline.submit(request.get_json())
+                 return '', 200 if result.is_ok() else 429
+"""
+import logging
+import threading
+from collections import OrderedDict, deque
+from time import monotonic
+
+from monday.c_events import MondayEvent
+from monday.c_web_hook import WebHook
+from result.c_result import Result
+
+WORKERS = 4
+MAX_PENDING = 1000
+DEDUPE_SIZE = 10000
+BUSY_CODE = 429
+
+
+class CoalescedEvent:
+    """
+    the events for one item merged into one, data is the newest event so the row is found the same way.
+    changes has one entry per column in the order the columns first changed, when a column changed more than once
+    the entry is the newest change with previous_value from the oldest one.  events that are not column changes
+    (a new item, a new name) are kept as they are.
+    """
+    def __init__(self, event: MondayEvent, due):
+        self.type = event.type
+        self.data = event.data
+        self.due = due
+        self.count = 0
+        self.changes = []
+        self._columns = {}
+        self.add(event)
+
+    def add(self, event: MondayEvent):
+        self.data = event.data
+        self.count += 1
+        column_id = getattr(event.data, 'column_id', None)
+        if column_id is None:
+            self.changes.append(event.data)
+            return
+        index = self._columns.get(column_id)
+        if index is None:
+            self._columns[column_id] = len(self.changes)
+            self.changes.append(event.data)
+        else:
+            event.data.previous_value = self.changes[index].previous_value
+            self.changes[index] = event.data
+
+
+class WebHookPipeline:
+    def __init__(self, call_back, workers=WORKERS, max_pending=MAX_PENDING, dedupe_size=DEDUPE_SIZE, process=None,
+                 debounce_seconds=0):
+        """
+        call_back(row) is called for every event, or call_back(row, changes) for merged events when debounce_seconds
+        is set.  process(call_back, event) replaces the default that loads the row with WebHook().process_event
+        """
+        assert workers > 0, "workers must be 1 or more"
+        assert max_pending > 0, "max_pending must be 1 or more"
+        self.call_back = call_back
+        self.workers = workers
+        self.max_pending = max_pending
+        self.dedupe_size = dedupe_size
+        self.process = process if process is not None else WebHookPipeline.process_event
+        self.debounce_seconds = debounce_seconds
+        self._condition = threading.Condition()
+        self._events = {}               # item key -> deque of events, the key is in _ready or being processed
+        self._ready = deque()           # item keys with an event that no worker is processing
+        self._seen = OrderedDict()      # trigger uuids of recent events
+        self._batches = {}              # (board_id, pulse_id) -> CoalescedEvent that is still taking events
+        self._threads = []
+        self._stopping = False
+        self.pending = 0
+        self.processed = 0
+        self.failed = 0
+        self.duplicates = 0
+        self.rejected = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def process_event(call_back, event: MondayEvent) -> Result:
+        return WebHook().process_event(call_back, event)
+
+    @staticmethod
+    def item_key(event: MondayEvent):
+        data = event.data
+        return str(getattr(data, 'row_id', None) or getattr(data, 'pulse_id', None))
+
+    @staticmethod
+    def coalesce_key(event: MondayEvent):
+        return str(getattr(event.data, 'board_id', None)), WebHookPipeline.item_key(event)
+
+    @staticmethod
+    def dedupe_key(event: MondayEvent):
+        """ the trigger uuid of the event, monday sends it again with the same uuid """
+        data = event.data
+        trigger_uuid = getattr(data, 'trigger_uuid', None)
+        if trigger_uuid is not None:
+            return trigger_uuid
+        original_trigger_uuid = getattr(data, 'original_trigger_uuid', None)
+        if original_trigger_uuid is not None:
+            return f"{original_trigger_uuid}:{event.type}:{WebHookPipeline.item_key(event)}"
+        return None
+
+    def is_duplicate(self, key) -> bool:
+        if key is None or self.dedupe_size <= 0:
+            return False
+        if key in self._seen:
+            self._seen.move_to_end(key)
+            return True
+        self._seen[key] = True
+        while len(self._seen) > self.dedupe_size:
+            self._seen.popitem(last=False)
+        return False
+
+    def start(self):
+        with self._condition:
+            self._stopping = False
+            while len(self._threads) < self.workers:
+                thread = threading.Thread(target=self._work, name=f"webhook-{len(self._threads)}", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+        return self
+
+    def stop(self, wait=True, timeout=None):
+        """ stops the workers after the events that are queued have been processed """
+        if wait:
+            self.join(timeout)
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def submit(self, args) -> Result:
+        """ queues the webhook request, returns at once """
+        if args is None or args.get('event') is None:
+            return Result(-1, 'Process request args are missing')
+        event = MondayEvent(args.get('event'))
+        if event.data is None:
+            return Result(-1, f"Unknown event type [{event.type}]")
+
+        with self._condition:
+            # a rejected event is not remembered, monday sends it again
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                return Result(BUSY_CODE, f"{self.pending} webhook events are waiting, try again later")
+            if self.is_duplicate(self.dedupe_key(event)):
+                self.duplicates += 1
+                return Result(0, 'Duplicate event')
+
+            self.pending += 1
+            if self.debounce_seconds > 0:
+                self._coalesce(event)
+            else:
+                self._enqueue(event)
+        return Result(0, 'Queued')
+
+    def _enqueue(self, event):
+        key = self.item_key(event)
+        events = self._events.get(key)
+        if events is None:
+            self._events[key] = deque([event])
+            self._ready.append(key)
+            self._condition.notify()
+        else:
+            # a worker has this item, it takes the event when it is done with the one before it
+            events.append(event)
+
+    def _coalesce(self, event):
+        key = self.coalesce_key(event)
+        batch: CoalescedEvent = self._batches.get(key)
+        if batch is None:
+            self._batches[key] = CoalescedEvent(event, monotonic() + self.debounce_seconds)
+            # a waiting worker has to wake up when this batch is due
+            self._condition.notify()
+        else:
+            batch.add(event)
+            self.coalesced += 1
+
+    def _release_due(self):
+        """ queues the merged events whose debounce window has passed, all of them when the pipeline stops """
+        now = monotonic()
+        for key, batch in list(self._batches.items()):
+            if self._stopping or batch.due <= now:
+                self._batches.pop(key)
+                self._enqueue(batch)
+
+    def _wait_seconds(self):
+        if len(self._batches) == 0:
+            return None
+        return max(0.0, min(batch.due for batch in self._batches.values()) - monotonic())
+
+    def _next(self):
+        """ the next item key and its oldest event, None when the pipeline stops """
+        with self._condition:
+            while True:
+                self._release_due()
+                if len(self._ready) > 0:
+                    break
+                if self._stopping:
+                    return None, None
+                self._condition.wait(self._wait_seconds())
+            key = self._ready.popleft()
+            return key, self._events[key][0]
+
+    def _done(self, key, ok):
+        with self._condition:
+            events = self._events[key]
+            event = events.popleft()
+            if len(events) == 0:
+                self._events.pop(key)
+            else:
+                self._ready.append(key)
+            self.pending -= getattr(event, 'count', 1)
+            self.processed += 1
+            if not ok:
+                self.failed += 1
+            self._condition.notify_all()
+
+    def _work(self):
+        while True:
+            key, event = self._next()
+            if event is None:
+                return
+            ok = False
+            try:
+                result = self.process(self.call_back, event)
+                ok = not isinstance(result, Result) or result.is_ok()
+            except Exception as ex:
+                logging.exception(ex)
+            finally:
+                self._done(key, ok)
+
+    def join(self, timeout=None) -> bool:
+        """ waits until every queued event has been processed, returns False on a timeout """
+        with self._condition:
+            return self._condition.wait_for(lambda: self.pending == 0, timeout)
+
+    def stats(self) -> dict:
+        with self._condition:
+            return {'pending': self.pending, 'processed': self.processed, 'failed': self.failed,
+                    'duplicates': self.duplicates, 'rejected': self.rejected, 'coalesced': self.coalesced,
+                    'workers': len(self._threads)}
@@ -1,11 +1,44 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from time import time
 from time import sleep
 import requests
 from requests import Timeout, Response
 import logging
 
+from networking.c_session_pool import SessionPool
+
+_executor_lock = threading.Lock()
+
 
 class Network:
+    # when True, requests are sent using the shared keep-alive sessions from the SessionPool
+    use_pool = True
+
+    # worker threads used by the async calls, sized to the number of pooled connections per host
+    _executor: ThreadPoolExecutor = None
+
+    @staticmethod
+    def executor() -> ThreadPoolExecutor:
+        if Network._executor is None:
+            with _executor_lock:
+                if Network._executor is None:
+                    Network._executor = ThreadPoolExecutor(max_workers=SessionPool().pool_maxsize,
+                                                           thread_name_prefix='network')
+        return Network._executor
+
+    @staticmethod
+    def session():
+        if Network.use_pool:
+            return SessionPool().session()
+        return requests
+
+    @staticmethod
+    def stats() -> dict:
+        """ connection reuse counters for the pooled sessions """
+        return SessionPool().stats
 
     @staticmethod
     def get(url, data=None, headers=None, timeout=60, show_info=True):
@@ -16,11 +49,28 @@ class Network:
         return Network._execute_get(url, 'GET', headers=headers, timeout=timeout, show_info=show_info, params=params)
 
     @staticmethod
-    def post(url, data=None, headers=None, timeout=60, files=None):
-        return Network._execute_get(url, 'POST', params=data, headers=headers, timeout=timeout, files=files)
+    def post(url, data=None, headers=None, timeout=60, files=None, json=None):
+        """ data is sent as a form, json is sent as a json body (used for graphql variables) """
+        return Network._execute_get(url, 'POST', params=data, headers=headers, timeout=timeout, files=files,
+                                    json=json)
+
+    @staticmethod
+    async def post_async(url, data=None, headers=None, timeout=60, files=None, json=None) -> Response:
+        """ post without blocking the event loop, the request runs on a pooled session in a worker thread """
+        loop = asyncio.get_running_loop()
+        call = functools.partial(Network.post, url, data=data, headers=headers, timeout=timeout, files=files,
+                                 json=json)
+        return await loop.run_in_executor(Network.executor(), call)
+
+    @staticmethod
+    async def get_async(url, data=None, headers=None, timeout=60, show_info=True) -> Response:
+        loop = asyncio.get_running_loop()
+        call = functools.partial(Network.get, url, data=data, headers=headers, timeout=timeout, show_info=show_info)
+        return await loop.run_in_executor(Network.executor(), call)
 
     @staticmethod
-    def _execute_get(url, _type=None, params=None, headers=None, timeout=60, show_info=True, files=None) -> Response:
+    def _execute_get(url, _type=None, params=None, headers=None, timeout=60, show_info=True, files=None,
+                     json=None) -> Response:
 
         """Executes a get request and times out if get reaches timeout
 
@@ -29,6 +79,7 @@ class Network:
             params: The arguments
             headers: Header
             timeout: Timeout
+            json: a json body for a POST, used instead of params
 
         Returns: Response
 
@@ -43,13 +94,14 @@ class Network:
 
         start = time()
         logging.debug("timer set")
+        session = Network.session()
         # retry in the event of complexity limit reached.
         while retry_count < 5 and try_again:
             try:
                 if _type == 'GET':
-                    retval = requests.get(url, params=params, headers=headers, timeout=timeout)
+                    retval = session.get(url, params=params, headers=headers, timeout=timeout)
                 else:  # POST
-                    retval = requests.post(url, data=params, headers=headers, timeout=timeout, files=files)
+                    retval = session.post(url, data=params, headers=headers, timeout=timeout, files=files, json=json)
                 try_again = False
             except Timeout:
                 sleep(wait_seconds_for_retry)
@@ -0,0 +1,177 @@
+"""
+  ***********************************************
+    SessionPool: a per process registry of requests.Session objects so that every call to the same host
+    reuses an open (keep-alive) connection instead of paying for a new TCP + TLS handshake.
+
+    usage:
+        session = SessionPool().session()
+        r = session.post(url, data=data)
+
+    configure the pool once at startup (optional), the defaults are fine for most workers:
+        SessionPool().configure(pool_connections=10, pool_maxsize=20, max_retries=3)
+
+    connection statistics:
+        SessionPool().stats  ->  {'requests': 120, 'new_connections': 2, 'reused_connections': 118}
+  ***********************************************
+"""
+import logging
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from cache.c_singleton import Singleton
+
+DEFAULT_POOL_CONNECTIONS = 10       # number of hosts we keep a pool for
+DEFAULT_POOL_MAXSIZE = 10           # number of open connections kept per host
+DEFAULT_MAX_RETRIES = 3             # connection level retries (the request was never sent)
+DEFAULT_BACKOFF_FACTOR = 0.5
+
+
+class ConnectionCounter:
+    """ thread safe counters for requests sent and connections opened """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+
+    def add_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def add_connection(self):
+        with self._lock:
+            self.new_connections += 1
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.new_connections = 0
+
+    @property
+    def reused_connections(self):
+        return max(self.requests - self.new_connections, 0)
+
+    def as_dict(self):
+        return {'requests': self.requests,
+                'new_connections': self.new_connections,
+                'reused_connections': self.reused_connections}
+
+
+def _counted_pool_class(base_class, counter: ConnectionCounter):
+    """ creates a connection pool class that counts every new connection it opens """
+
+    class CountedConnectionPool(base_class):
+        def _new_conn(self):
+            counter.add_connection()
+            return super()._new_conn()
+
+    return CountedConnectionPool
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """ HTTPAdapter that counts requests and new connections so we can report on connection reuse """
+
+    def __init__(self, counter: ConnectionCounter = None, **kwargs):
+        self.counter = counter if counter is not None else ConnectionCounter()
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        # the pool class map is shared by all pool managers, so we replace it with our own copy.
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _counted_pool_class(HTTPConnectionPool, self.counter),
+            'https': _counted_pool_class(HTTPSConnectionPool, self.counter),
+        }
+
+    def send(self, request, **kwargs):
+        self.counter.add_request()
+        return super().send(request, **kwargs)
+
+
+@Singleton
+class SessionPool(object):
+    def __init__(self, pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                 max_retries=DEFAULT_MAX_RETRIES, backoff_factor=DEFAULT_BACKOFF_FACTOR):
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._pid = os.getpid()
+        self.counter = ConnectionCounter()
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+
+    def configure(self, pool_connections=None, pool_maxsize=None, max_retries=None, backoff_factor=None):
+        """ change the pool settings, existing sessions are closed and rebuilt on next use. """
+        with self._lock:
+            if pool_connections is not None:
+                self.pool_connections = pool_connections
+            if pool_maxsize is not None:
+                self.pool_maxsize = pool_maxsize
+            if max_retries is not None:
+                self.max_retries = max_retries
+            if backoff_factor is not None:
+                self.backoff_factor = backoff_factor
+            self._close_sessions()
+
+    def _retry(self) -> Retry:
+        # only retry when the connection could not be made, never re-send a POST that reached the server.
+        # GET requests are also retried on gateway errors.
+        return Retry(total=self.max_retries,
+                     connect=self.max_retries,
+                     read=0,
+                     status=self.max_retries,
+                     status_forcelist=[502, 503, 504],
+                     backoff_factor=self.backoff_factor,
+                     raise_on_status=False)
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = PooledHTTPAdapter(counter=self.counter,
+                                    pool_connections=self.pool_connections,
+                                    pool_maxsize=self.pool_maxsize,
+                                    max_retries=self._retry())
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _close_sessions(self):
+        for session in self._sessions.values():
+            try:
+                session.close()
+            except Exception as ex:
+                logging.debug(f"Unable to close session: {ex}")
+        self._sessions = {}
+
+    def session(self, name='default') -> requests.Session:
+        """ returns the shared session for this process, sessions are never shared across a fork. """
+        with self._lock:
+            if self._pid != os.getpid():
+                # we are in a forked child, the parent's sockets can not be used here.
+                self._sessions = {}
+                self._pid = os.getpid()
+                self.counter.reset()
+
+            session = self._sessions.get(name)
+            if session is None:
+                session = self._new_session()
+                self._sessions[name] = session
+                logging.debug(f"Created pooled http session [{name}]")
+            return session
+
+    def close(self):
+        with self._lock:
+            self._close_sessions()
+
+    @property
+    def size(self):
+        return len(self._sessions)
+
+    @property
+    def stats(self) -> dict:
+        return self.counter.as_dict()
@@ -59,7 +59,7 @@ class Status:
         if message is None:
             message = self.message
 
-        logging.log(message)
+        logging.log(logging.ERROR if level == ERROR else logging.INFO, message)
 
 
     """
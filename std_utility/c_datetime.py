@@ -37,6 +37,10 @@ import pytz
 from dateutil.relativedelta import relativedelta
 from dateutil import parser
 
+# the lengths of the dates monday sends: YYYY-MM-DD, YYYY-MM-DD HH:MM and YYYY-MM-DD HH:MM:SS
+FIXED_LENGTHS = (10, 16, 19)
+DATE_CACHE_SIZE = 10000
+
 
 class DateTime:
 
@@ -66,16 +70,50 @@ class DateTime:
         try:
             dt = str(dt)
             if isinstance(dt, str):
-                self._datetime = parser.parse(dt)
+                self._datetime = DateTime.parse_text(dt)
             else:
                 if dt is None:
                     self._datetime = datetime.now()
                 else:
                     self._datetime = dt
-            self._datetime = self.plus(years, months, days, hours, minutes, seconds)
+            if years or months or days or hours or minutes or seconds:
+                self._datetime = self.plus(years, months, days, hours, minutes, seconds)
         except parser.ParserError as ex:
             logging.info(f"Error caused by date with the following value [{dt}]")
 
+    @staticmethod
+    def parse_fixed(text: str):
+        """ the datetime for the formats monday sends, None for any other text """
+        if len(text) in FIXED_LENGTHS and text[4] == '-' and text[7] == '-' and (len(text) == 10 or text[10] in ' T'):
+            try:
+                return datetime.fromisoformat(text)
+            except ValueError:
+                return None
+        return None
+
+    @staticmethod
+    def parse_text(text: str) -> datetime:
+        """ monday's formats are read directly, anything else is parsed by dateutil """
+        value = DateTime.parse_fixed(text)
+        if value is None:
+            value = parser.parse(text)
+        return value
+
+    @staticmethod
+    def from_text(text, cache=None):
+        """ the same as DateTime(text), cache is an optional DateCache that parses a text once """
+        if cache is None or not isinstance(text, str):
+            return DateTime(text)
+        if len(text) < 8:
+            text = '1970-01-01 00:00:00'
+        new_datetime = DateTime.__new__(DateTime)
+        new_datetime.dt = text
+        try:
+            new_datetime._datetime = cache.parse(text)
+        except parser.ParserError:
+            logging.info(f"Error caused by date with the following value [{text}]")
+        return new_datetime
+
     @property
     def is_datetime(self):
         return self._datetime.hour != 0 and self._datetime.min != 0 and self._datetime.second != 0
@@ -203,6 +241,43 @@ class DateTime:
         return parser.parse(date_str)
 
 
+class DateCache:
+    """
+    the parsed datetime for each text, a board's date cells repeat the same few dates.  a datetime can not be
+    changed so the DateTime objects made from the same text share it.  The cache is emptied when it is full.
+        Example: board = Board(board_id, token, date_cache=DateCache())
+    """
+    def __init__(self, max_entries=DATE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._values = {}
+        self.hits = 0
+        self.misses = 0
+
+    # shared by every copy of a board
+    __cache_shared__ = True
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def parse(self, text: str) -> datetime:
+        value = self._values.get(text)
+        if value is not None:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = DateTime.parse_text(text)
+        if len(self._values) >= self.max_entries:
+            self._values.clear()
+        self._values[text] = value
+        return value
+
+    def stats(self) -> dict:
+        return {'size': len(self._values), 'hits': self.hits, 'misses': self.misses}
+
+
 def unit_test():
     try:
         z = DateTime(now=True, tz='America/New_York').iso8601
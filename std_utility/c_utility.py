@@ -1,3 +1,4 @@
+import functools
 import os
 import re
 import unicodedata
@@ -8,7 +9,7 @@ import stringcase as sc
 import string
 import random
 
-from conversion.c_format import Format
+from conversion.c_format import Format, NAME_CACHE_SIZE, NAME_CACHES
 from std_utility.c_datetime import DateTime
 
 
@@ -166,9 +167,18 @@ class Utility:
 
     @staticmethod
     def db_name(name):
+        if isinstance(name, str):
+            return Utility.db_name_of(name)
         x = Format(name).snake_case
         if name is None:
             x = ''
+        return x
+
+    @staticmethod
+    @functools.lru_cache(maxsize=NAME_CACHE_SIZE)
+    def db_name_of(name: str) -> str:
+        """ db_name for a string, the result is kept so a column name is converted once """
+        x = Format(name).snake_case
         # if not isinstance(name, str):
         #     name = str(name)
         # name = re.sub('[^A-Za-z0-9 _]+', '', name)
@@ -310,3 +320,6 @@ class Utility:
 
         return True
 
+
+# Format.clear_name_caches clears the db names as well
+NAME_CACHES.append(Utility.db_name_of)
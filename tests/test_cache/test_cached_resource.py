@@ -0,0 +1,82 @@
+import threading
+import time
+import unittest
+
+from cache.c_cached_resource import CachedResource
+
+
+class Rows:
+    __slots__ = ('rows',)
+
+    def __init__(self, count):
+        self.rows = [{'id': str(i), 'name': f"row {i}" * 10} for i in range(count)]
+
+
+class TestCachedResource(unittest.TestCase):
+    def test_round_trip_and_counters(self):
+        cache = CachedResource(expire_seconds=60)
+        self.assertIsNone(cache.get_cache_item(1, 'board'))
+        cache.update_cache({'a': 1}, 1, 'board')
+        self.assertEqual({'a': 1}, cache.get_cache_item(1, 'board'))
+        self.assertTrue(cache.is_available(cache.get_key(1, 'board')))
+        cache.remove(1, 'board')
+        self.assertEqual(0, cache.size)
+        self.assertEqual({'size': 0, 'bytes': 0, 'hits': 1, 'misses': 1, 'evictions': 0, 'expirations': 0},
+                         cache.stats())
+
+    def test_least_recently_used_is_evicted(self):
+        cache = CachedResource(max_entries=3)
+        for i in range(3):
+            cache.update_cache(i, i)
+        cache.get_cache_item(0)
+        cache.update_cache(3, 3)
+        self.assertEqual(3, cache.size)
+        self.assertIsNone(cache.get_cache_item(1))
+        self.assertEqual(0, cache.get_cache_item(0))
+        self.assertEqual(1, cache.evictions)
+
+    def test_max_bytes(self):
+        one = CachedResource.approximate_size(Rows(100))
+        self.assertGreater(CachedResource.approximate_size(Rows(200)), one * 1.5)
+        cache = CachedResource(max_bytes=int(one * 2.5))
+        for i in range(5):
+            cache.update_cache(Rows(100), i)
+        self.assertEqual(2, cache.size)
+        self.assertLessEqual(cache.bytes, one * 2.5)
+        # an entry larger than the limit is still kept, it is the newest one
+        cache.update_cache(Rows(1000), 'big')
+        self.assertEqual(1, cache.size)
+
+    def test_expired_entries_are_swept(self):
+        cache = CachedResource(expire_seconds=0.05, sweep_seconds=0.05)
+        for i in range(10):
+            cache.update_cache(i, i)
+        cache.update_cache_item(obj='kept', key=cache.get_key('kept'), expire_seconds=60)
+        time.sleep(0.1)
+        # a read of any key removes every expired entry
+        self.assertEqual('kept', cache.get_cache_item('kept'))
+        self.assertEqual(1, cache.size)
+        self.assertEqual(10, cache.expirations)
+
+    def test_disabled(self):
+        cache = CachedResource(enable_cache=False)
+        cache.update_cache(1, 1)
+        self.assertIsNone(cache.get_cache_item(1))
+        self.assertEqual(0, cache.size)
+
+    def test_threads(self):
+        cache = CachedResource(max_entries=50)
+
+        def work(n):
+            for i in range(500):
+                cache.update_cache(i, n, i % 80)
+                cache.get_cache_item(n, (i + 7) % 80)
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+        [t.start() for t in threads]
+        [t.join() for t in threads]
+        self.assertEqual(50, cache.size)
+
+
+if __name__ == '__main__':
+    unittest.main()
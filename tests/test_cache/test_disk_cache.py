@@ -0,0 +1,47 @@
+import json
+import os
+import tempfile
+import unittest
+
+from cache.c_disk_cache import DiskCache
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.temp = tempfile.TemporaryDirectory()
+        self.cache = DiskCache(self.temp.name, expire_seconds=60)
+
+    def tearDown(self):
+        self.temp.cleanup()
+
+    def test_round_trip(self):
+        self.assertIsNone(self.cache.get_cache_item(1, 'schema'))
+        self.cache.update_cache({'a': [1, 2]}, 1, 'schema')
+        self.assertEqual({'a': [1, 2]}, self.cache.get_cache_item(1, 'schema'))
+        self.assertEqual({'a': [1, 2]}, DiskCache(self.temp.name).get_cache_item(1, 'schema'))
+        self.assertEqual(1, self.cache.size)
+
+    def test_expired_entries_are_removed(self):
+        self.cache.update_cache({'a': 1}, 1, expire_seconds=-1)
+        self.assertIsNone(self.cache.get_cache_item(1))
+        self.assertEqual(0, self.cache.size)
+
+    def test_version_and_corruption(self):
+        self.cache.update_cache({'a': 1}, 1)
+        self.assertIsNone(DiskCache(self.temp.name, version=2).get_cache_item(1))
+
+        self.cache.update_cache({'a': 1}, 2)
+        with open(self.cache.file_name(self.cache.get_key(2)), 'w') as f:
+            f.write('{"version": 1, "key"')
+        self.assertIsNone(self.cache.get_cache_item(2))
+        self.assertFalse(os.path.exists(self.cache.file_name(self.cache.get_key(2))))
+
+    def test_no_temp_files_left(self):
+        self.cache.update_cache({'a': 1}, 1)
+        self.assertEqual([], [n for n in os.listdir(self.temp.name) if n.endswith('.tmp')])
+        with open(self.cache.file_name(self.cache.get_key(1))) as f:
+            self.assertEqual(':1', json.load(f).get('key'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+from conversion.c_format import Format
+from std_utility.c_utility import Utility
+
+
+class TestNameCaches(unittest.TestCase):
+    def setUp(self):
+        Format.clear_name_caches()
+
+    def test_same_results(self):
+        self.assertEqual('team_name', Format('Team Name').snake_case)
+        self.assertEqual('item_and_co', Format('Item & Co').snake_case)
+        self.assertEqual('already_snake', Format('already_snake').snake_case)
+        self.assertEqual('Item and Co', Format('Item &  Co').name)
+        self.assertEqual('c_class', Utility.db_name('class'))
+        self.assertEqual('', Utility.db_name(None))
+        self.assertIsNone(Format(None).snake_case)
+        self.assertEqual(12, Format(12).name)
+
+    def test_names_are_converted_once(self):
+        first = Format('Due Date').snake_case
+        for _ in range(10):
+            self.assertIs(first, Format('Due ' + 'Date').snake_case)
+        info = Format.snake_case_of.cache_info()
+        self.assertEqual((10, 1), (info.hits, info.misses))
+
+        Utility.db_name('Due Date')
+        Format.clear_name_caches()
+        self.assertEqual(0, Format.snake_case_of.cache_info().currsize)
+        self.assertEqual(0, Utility.db_name_of.cache_info().currsize)
+
+
+if __name__ == '__main__':
+    unittest.main()
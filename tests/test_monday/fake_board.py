@@ -0,0 +1,253 @@
+"""
+FakeBoard: a Board that answers queries from generated json instead of Monday.com, used by the offline tests.
+"""
+import asyncio
+import json
+import re
+import threading
+import time
+
+from monday.c_board import Board
+from result.c_result import Result
+
+STATUS_LABELS = {'0': 'Working on it', '1': 'Done', '2': 'Stuck'}
+
+COLUMNS = [
+    {'id': 'name', 'title': 'Name', 'type': 'name', 'settings_str': '{}'},
+    {'id': 'status', 'title': 'Status', 'type': 'color', 'settings_str': json.dumps({'labels': STATUS_LABELS})},
+    {'id': 'date4', 'title': 'Date', 'type': 'date', 'settings_str': '{}'},
+    {'id': 'text', 'title': 'Text', 'type': 'text', 'settings_str': '{}'},
+    {'id': 'numbers', 'title': 'Numbers', 'type': 'numeric', 'settings_str': '{}'},
+    {'id': 'email', 'title': 'Email', 'type': 'email', 'settings_str': '{}'},
+]
+
+SUBITEMS_COLUMN = {'id': 'subitems', 'title': 'Subitems', 'type': 'subtasks', 'settings_str': '{}'}
+
+USERS = [{'id': '501', 'name': 'Ann Smith', 'email': 'ann@example.com'},
+         {'id': '502', 'name': 'Bob Jones', 'email': 'bob@example.com'}]
+
+GROUPS = [{'id': 'topics', 'title': 'Default Group'}, {'id': 'rtg', 'title': 'RTG'}, {'id': 'west', 'title': 'West'}]
+
+
+def make_item(item_id, group, index):
+    status = STATUS_LABELS[str(index % 3)]
+    return {
+        'id': str(item_id),
+        'name': f"Item {item_id}",
+        'assets': [],
+        'group': {'id': group.get('id'), 'title': group.get('title')},
+        'column_values': [
+            {'id': 'status', 'column': {'title': 'Status'}, 'text': status},
+            {'id': 'date4', 'column': {'title': 'Date'}, 'text': f"2024-01-{(index % 28) + 1:02d}"},
+            {'id': 'text', 'column': {'title': 'Text'}, 'text': f"text {index}"},
+            {'id': 'numbers', 'column': {'title': 'Numbers'}, 'text': str(index)},
+            {'id': 'email', 'column': {'title': 'Email'}, 'text': f"user{item_id}@example.com"},
+        ]
+    }
+
+
+def make_items(items_per_group=10, subitems_per_item=0):
+    items = {}
+    item_id = 1000
+    for group in GROUPS:
+        items[group.get('id')] = []
+        for index in range(items_per_group):
+            item = make_item(item_id, group, index)
+            if subitems_per_item > 0:
+                item['column_values'].append({'id': 'subitems', 'column': {'title': 'Subitems'},
+                                              'text': f"{subitems_per_item} subitems"})
+            items[group.get('id')].append(item)
+            item_id += 1
+    return items
+
+
+def make_subitem(parent_id, index):
+    return {'id': f"{parent_id}{index:02d}", 'name': f"Task {index}", 'board': {'id': '5678'}, 'assets': [],
+            'column_values': [
+                {'id': 'status', 'column': {'title': 'Status'}, 'value': None, 'text': 'Done', 'type': 'status'},
+                {'id': 'text', 'column': {'title': 'Owner'}, 'value': None, 'text': f"owner {index}",
+                 'type': 'text'}]}
+
+
+class FakeBoard(Board):
+    def __init__(self, items_per_group=10, delay=0.0, subitems_per_item=0, **kwargs):
+        self.items = make_items(items_per_group, subitems_per_item)
+        self.subitems_per_item = subitems_per_item
+        self.columns = COLUMNS + [SUBITEMS_COLUMN] if subitems_per_item > 0 else COLUMNS
+        self.delay = delay
+        self.queries = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        self.cursor_rules = []
+        self.items_sent = 0
+        self.fail_ids = set()
+        self.mutation_log = []
+        self.next_id = 9000
+        super().__init__(1234, 'fake-token', **kwargs)
+
+    def all_items(self):
+        return [item for items in self.items.values() for item in items]
+
+    def respond(self, query) -> Result:
+        text = query.get('query') if isinstance(query, dict) else str(query)
+        variables = (query.get('variables') if isinstance(query, dict) else None) or {}
+        self.queries.append(text)
+
+        if 'columns {' in text:
+            first = self.all_items()[:1]
+            return Result(0, data={'data': {'boards': [{
+                'id': '1234', 'name': 'Fake Board', 'permissions': 'everyone', 'tags': [],
+                'groups': GROUPS, 'items_page': {'items': first}, 'columns': self.columns}]}})
+
+        if 'users {' in text:
+            return Result(0, data={'data': {'users': USERS}})
+
+        if 'subitems {' in text:
+            ids = [str(i) for i in variables.get('ids')]
+            return Result(0, data={'data': {'items': [
+                {'id': i, 'subitems': [make_subitem(i, n) for n in range(self.subitems_per_item)]} for i in ids]}})
+
+        if text.startswith('mutation'):
+            return self.mutations(text)
+
+        if 'items_page' in text:
+            return Result(0, data=self.items_page(text, variables))
+
+        match = re.search(r'items \(ids: \[([^\]]*)\]', text)
+        if match or 'ids' in variables:
+            ids = [str(i) for i in variables.get('ids')] if 'ids' in variables else \
+                [i.strip() for i in match.group(1).split(',') if i.strip()]
+            by_id = {item.get('id'): item for item in self.all_items()}
+            return Result(0, data={'data': {'items': [by_id[i] for i in ids if i in by_id]}})
+
+        return Result(0, data={'data': {}})
+
+    def mutations(self, text) -> Result:
+        """ answers aliased mutations, an item id or item name in fail_ids returns an error for that alias """
+        data = {}
+        errors = []
+        for alias, name, args in re.findall(r'(\w+): (\w+) \(([^)]*)\)', text):
+            item_id = re.search(r'(?:item_id|parent_item_id): (\d+)', args)
+            item_id = item_id.group(1) if item_id is not None else None
+            item_name = re.search(r'item_name: "([^"]*)"', args)
+            item_name = item_name.group(1) if item_name is not None else None
+            self.mutation_log.append((name, item_id or item_name))
+            if item_id in self.fail_ids or item_name in self.fail_ids:
+                data[alias] = None
+                errors.append({'message': f"Item {item_id or item_name} not found", 'path': [alias]})
+            elif name == 'create_item':
+                self.next_id += 1
+                data[alias] = {'id': str(self.next_id)}
+            elif name == 'create_subitem':
+                self.next_id += 1
+                data[alias] = {'id': str(self.next_id), 'board': {'id': '5678'}, 'name': item_name,
+                               'assets': [], 'column_values': []}
+            else:
+                data[alias] = {'id': item_id}
+        if 'complexity' in text:
+            data['complexity'] = {'before': 10000000, 'after': 10000000 - 100 * len(data),
+                                  'query': 100 * len(data), 'reset_in_x_seconds': 60}
+        if len(errors) > 0:
+            return Result(4001, message=json.dumps(errors), data={'data': data, 'errors': errors})
+        return Result(0, data={'data': data})
+
+    @staticmethod
+    def item_matches(item, rule):
+        """ runs one query_params rule the way monday does """
+        column_id, compare_value, operator = rule
+        text = {v.get('id'): v.get('text') for v in item.get('column_values')}.get(column_id)
+        if column_id == 'status':
+            compare_value = [STATUS_LABELS.get(str(v)) for v in compare_value]
+        elif column_id == 'numbers':
+            text = float(text)
+        if len(compare_value) == 2 and compare_value[0] == 'EXACT':
+            compare_value = compare_value[1:]
+
+        if operator == 'any_of':
+            return text in compare_value
+        if operator == 'not_any_of':
+            return text not in compare_value
+        if operator == 'between':
+            return compare_value[0] <= text <= compare_value[1]
+        value = compare_value[0]
+        return {'greater_than': text > value, 'greater_than_or_equals': text >= value,
+                'lower_than': text < value, 'lower_than_or_equal': text <= value}.get(operator)
+
+    def query_params(self, text):
+        """ returns the query_params rules and the join operator, the rules are remembered with the cursor """
+        match = re.search(r'query_params: \{rules: \[(.*)\], operator: (\w+)\}', text)
+        if match is None:
+            return [], 'and'
+        rules = [(column_id, json.loads(compare_value), operator) for column_id, compare_value, operator in
+                 re.findall(r'\{column_id: "([^"]+)", compare_value: (\[[^\]]*\]), operator: (\w+)\}',
+                            match.group(1))]
+        return rules, match.group(2)
+
+    def items_page(self, text, variables=None):
+        """ limit, cursor and groups come from the variables of a template query or from the query text """
+        variables = variables or {}
+        if 'limit' in variables:
+            limit = int(variables.get('limit'))
+            cursor = variables.get('cursor')
+        else:
+            limit = int(re.search(r'limit: (\d+)', text).group(1))
+            cursor = re.search(r'cursor: "([^"]*)"', text)
+            cursor = cursor if cursor is not None else None
+        rules, join = self.query_params(text)
+        if cursor is not None and len(cursor.split(':')) > 2:
+            rules, join = self.cursor_rules[int(cursor.split(':')[2])]
+        rule_key = None
+        if len(rules) > 0:
+            self.cursor_rules.append((rules, join))
+            rule_key = len(self.cursor_rules) - 1
+        match = all if join == 'and' else any
+        group_ids = re.search(r'groups \(ids: \[([^\]]*)\]', text)
+        if variables.get('groups') is not None:
+            group_ids = variables.get('groups')
+        elif group_ids is not None:
+            group_ids = [g.strip().strip('"') for g in group_ids.group(1).split(',')]
+        else:
+            group_ids = [g.get('id') for g in GROUPS]
+
+        groups = []
+        for group in GROUPS:
+            if group.get('id') not in group_ids:
+                continue
+            offset = 0
+            if cursor is not None:
+                offset = int(cursor.split(':')[1])
+            group_items = [item for item in self.items.get(group.get('id'))
+                           if len(rules) == 0 or match(self.item_matches(item, rule) for rule in rules)]
+            items = group_items[offset:offset + limit]
+            self.items_sent += len(items)
+            next_cursor = None
+            if offset + limit < len(group_items):
+                next_cursor = f"{group.get('id')}:{offset + limit}"
+                if rule_key is not None:
+                    next_cursor += f":{rule_key}"
+            groups.append({'id': group.get('id'), 'title': group.get('title'),
+                           'items_page': {'cursor': next_cursor, 'items': [dict(i) for i in items]}})
+        return {'data': {'boards': [{'groups': groups}]}}
+
+    def execute(self, query, files=None) -> Result:
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            with self.lock:
+                return self.respond(query)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    async def execute_async(self, query, files=None) -> Result:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            return self.respond(query)
+        finally:
+            self.in_flight -= 1
@@ -0,0 +1,37 @@
+import unittest
+
+from tests.test_monday.fake_board import FakeBoard
+
+
+class TestBoardClone(unittest.TestCase):
+    def setUp(self):
+        self.board = FakeBoard(items_per_group=5)
+
+    def test_schema_is_shared(self):
+        clone = self.board.clone()
+        self.assertIs(self.board.column_id_map, clone.column_id_map)
+        self.assertIs(self.board.group_map, clone.group_map)
+        self.assertIs(self.board.board_info_json, clone.board_info_json)
+        self.assertIs(self.board.column_info_map.get('Status'), clone.column_info_map.get('Status'))
+        self.assertEqual(self.board.name, clone.name)
+
+    def test_request_state_is_fresh(self):
+        self.board.select(limit=10)
+        self.board.begin()
+        clone = self.board.clone()
+        self.assertEqual(15, self.board.row_count)
+        self.assertEqual(0, clone.row_count)
+        self.assertIsNone(clone.unit_of_work)
+        self.assertIs(clone.col_map, clone.column_info_map)
+
+        rows = clone.select(groups='RTG', limit=10).data
+        self.assertEqual(5, len(rows))
+        self.assertTrue(all(row.board is clone for row in rows))
+        self.assertEqual(15, self.board.row_count)
+
+        clone.column_info_map['Extra'] = clone.column_info_map.get('Text')
+        self.assertNotIn('Extra', self.board.column_info_map)
+
+
+if __name__ == '__main__':
+    unittest.main()
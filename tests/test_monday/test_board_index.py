@@ -0,0 +1,95 @@
+import unittest
+
+from monday.c_key import Key
+from tests.test_monday.fake_board import FakeBoard
+
+
+def ids(rows):
+    return [row.row_id for row in rows]
+
+
+class TestBoardIndex(unittest.TestCase):
+    def setUp(self):
+        self.board = FakeBoard(items_per_group=5)
+        self.rows = self.board.select(limit=100).data
+
+    def test_find(self):
+        self.assertEqual(['1001', '1004', '1006', '1009', '1011', '1014'], ids(self.board.find('Status', 'Done')))
+        self.assertEqual(['1007'], ids(self.board.find(column='Email', value='user1007@example.com')))
+        self.assertEqual([], self.board.find('Email', 'nobody@example.com'))
+        self.assertEqual(['1002', '1007', '1012'], ids(self.board.find('Numbers', 2)))
+        self.assertIs(self.rows[3], self.board.find_row(1003))
+        self.assertIsNone(self.board.find_row('999'))
+
+    def test_unique_key(self):
+        key = Key.unique(group_name=True, field_names=['Email'])
+        self.assertTrue(self.board.create_index(key, unique=True).is_ok())
+        self.assertEqual(['1010'], ids(self.board.find(key, ['West', 'user1010@example.com'])))
+        self.assertEqual([], self.board.find(key, ['RTG', 'user1010@example.com']))
+
+        result = self.board.create_index('Status', unique=True)
+        self.assertTrue(result.is_error())
+        self.assertEqual(12, len(result.data))
+        self.assertNotIn(('hash', ('Status',)), self.board.indexes.indexes)
+
+    def test_unique_key_conflict(self):
+        self.assertTrue(self.board.create_index('Email', unique=True).is_ok())
+        with self.assertLogs(level='WARNING'):
+            self.rows[1].set('Email', 'user1002@example.com')
+        # the row keeps its old entry, the row with the key keeps its own
+        self.assertEqual(['1001'], ids(self.board.find('Email', 'user1001@example.com')))
+        self.assertEqual(['1002'], ids(self.board.find('Email', 'user1002@example.com')))
+
+        self.rows[1].set('Email', 'new@example.com')
+        self.assertEqual(['1001'], ids(self.board.find('Email', 'new@example.com')))
+        self.assertEqual([], self.board.find('Email', 'user1001@example.com'))
+
+    def test_find_range(self):
+        self.assertEqual(['1001', '1006', '1011', '1002', '1007', '1012'], ids(self.board.find_range('Numbers', 1, 2)))
+        self.assertEqual(['1003', '1008', '1013', '1004', '1009', '1014'],
+                         ids(self.board.find_range('Date', '2024-01-04', None)))
+        self.assertEqual(15, len(self.board.find_range('Date')))
+
+    def test_indexes_follow_changes(self):
+        self.board.create_index('Numbers', ordered=True)
+        self.assertEqual(3, len(self.board.find('Status', 'Stuck')))
+        self.rows[0].set('Status', 'Stuck')
+        self.rows[1].get('Numbers').value = '100'
+        self.assertEqual(['1002', '1007', '1012', '1000'], ids(self.board.find('Status', 'Stuck')))
+        self.assertNotIn('1000', ids(self.board.find('Status', 'Working on it')))
+        self.assertEqual(['1001'], ids(self.board.find_range('Numbers', 50)))
+
+        self.assertTrue(self.board.delete('1000').is_ok())
+        self.assertEqual(14, len(self.board.rows))
+        self.assertEqual(['1002', '1007', '1012'], ids(self.board.find('Status', 'Stuck')))
+        self.assertIsNone(self.board.find_row('1000'))
+
+        unit_of_work = self.board.begin()
+        new_row = unit_of_work.insert(self.board.new_row('New item'))
+        new_row.set('Status', 'Stuck')
+        self.assertTrue(self.board.flush().is_ok())
+        self.assertEqual(['1002', '1007', '1012', new_row.row_id], ids(self.board.find('Status', 'Stuck')))
+        self.assertIs(new_row, self.board.find_row(new_row.row_id))
+
+        # a new select replaces the rows, the indexes are built again
+        self.board.select(groups='RTG', limit=100)
+        self.assertEqual(['1007'], ids(self.board.find('Status', 'Stuck')))
+
+    def test_clone_keeps_the_index_definitions(self):
+        self.board.create_index('Email')
+        clone = self.board.clone()
+        self.assertEqual([], clone.find('Email', 'user1007@example.com'))
+        clone.select(limit=100)
+        self.assertEqual(['1007'], ids(clone.find('Email', 'user1007@example.com')))
+        self.assertEqual(1, len(clone.indexes.indexes))
+        self.assertIsNot(self.board.indexes, clone.indexes)
+
+    def test_key_create(self):
+        key = Key.unique(group_name=True, row_name=True, field_names=['Email', 'Numbers'])
+        self.assertEqual('groupname:defaultgroup!rowname:item1000!numbers:0!email:user1000@example.com',
+                         Key.create(self.rows[0], key).data)
+        self.assertTrue(Key.create(self.rows[0], ['Missing']).is_error())
+
+
+if __name__ == '__main__':
+    unittest.main()
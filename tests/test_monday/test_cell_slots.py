@@ -0,0 +1,36 @@
+import unittest
+
+from tests.test_monday.fake_board import FakeBoard
+
+
+class TestCellSlots(unittest.TestCase):
+    def test_cells_share_column_info(self):
+        board = FakeBoard(items_per_group=3)
+        rows = board.select().data
+        first, second = rows[0].get('Status'), rows[1].get('Status')
+
+        self.assertFalse(hasattr(first, '__dict__'))
+        self.assertFalse(hasattr(rows[0], '__dict__'))
+        self.assertIs(first.column, second.column)
+        self.assertIs(first.labels, board.column_info_map.get('Status').labels)
+        self.assertTrue(first.has_labels)
+        self.assertEqual('color', first.type)
+
+    def test_labels_are_checked(self):
+        board = FakeBoard(items_per_group=1)
+        cell = board.select().data[0].get('Status')
+        cell.value = 'Not a label'
+        self.assertNotEqual('Not a label', cell.value)
+        cell.value = 'Done'
+        self.assertEqual('Done', cell.value)
+        self.assertTrue(cell.modified)
+
+    def test_titles_are_shared(self):
+        board = FakeBoard(items_per_group=2)
+        rows = board.select().data
+        self.assertIs(rows[0].title, rows[1].title)
+        self.assertEqual('Status', rows[0].title.status)
+
+
+if __name__ == '__main__':
+    unittest.main()
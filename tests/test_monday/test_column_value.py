@@ -0,0 +1,80 @@
+import json
+import unittest
+
+from monday.c_cell import Cell
+from monday.c_column import Column
+from monday.c_column_value import ColumnValue
+from monday.c_query import MondayQuery
+from std_utility.c_datetime import DateTime
+from tests.test_monday.fake_board import FakeBoard
+
+
+def cell(c_id, c_type, value, value2=None, source=None):
+    new_cell = Cell().new(c_value=value, column_info=Column(c_index=0, c_id=c_id, c_name=c_id, c_type=c_type))
+    new_cell.value2 = value2
+    new_cell.source = source
+    return new_cell
+
+
+class TestColumnValue(unittest.TestCase):
+    def test_types(self):
+        cells = [cell('status', 'color', 'Done'),
+                 cell('date4', 'date', DateTime('2024-01-31')),
+                 cell('when', 'datetime', DateTime('2024-01-31 13:45:10')),
+                 cell('check', 'boolean', True),
+                 cell('link', 'link', 'https://example.com', source={'title': 'Example'}),
+                 cell('people', 'people', '12, 34'),
+                 cell('numbers', 'numeric', 42.0),
+                 cell('tags', 'dropdown', ['A', 'B']),
+                 cell('text', 'text', 'plain')]
+        self.assertEqual({'status': {'label': 'Done'},
+                          'date4': {'date': '2024-01-31'},
+                          'when': {'date': '2024-01-31', 'time': '13:45:10'},
+                          'check': {'checked': 'true'},
+                          'link': {'url': 'https://example.com', 'text': 'Example'},
+                          'people': {'personsAndTeams': [{'id': 12, 'kind': 'person'}, {'id': 34, 'kind': 'person'}]},
+                          'numbers': '42',
+                          'tags': {'labels': ['A', 'B']},
+                          'text': 'plain'}, json.loads(ColumnValue.dumps(cells)))
+
+    def test_people_by_name_or_email(self):
+        board = FakeBoard(items_per_group=1)
+        row = board.select(limit=10).data[0]
+        column = Column(c_index=0, c_id='people', c_name='Owner', c_type='people')
+        owners = Cell(row, column).new('Ann Smith, bob@example.com, 7', column_info=column)
+        self.assertEqual({'people': {'personsAndTeams': [{'id': 501, 'kind': 'person'}, {'id': 502, 'kind': 'person'},
+                                                         {'id': 7, 'kind': 'person'}]}}, ColumnValue.payload([owners]))
+        self.assertEqual(1, len([q for q in board.queries if 'users {' in q]))
+
+        unknown = Cell(row, column).new('Nobody', column_info=column)
+        with self.assertLogs(level='ERROR') as logs:
+            self.assertEqual({}, ColumnValue.payload([unknown]))
+        self.assertIn('Unable to find the monday user [Nobody]', logs.output[0])
+
+    def test_only_modified_cells(self):
+        cells = [cell('text', 'text', 'sent'), cell('text2', 'text', 'not sent'), cell('text3', 'text', None)]
+        cells[1].modified = False
+        self.assertEqual({'text': 'sent'}, ColumnValue.payload(cells))
+        self.assertEqual({'a': '1'}, ColumnValue.payload({'a': 1, 'b': None}))
+
+    def test_values_are_not_templated(self):
+        # the old builders replaced the literals ID and VALUE inside the values
+        cells = [cell('text', 'text', 'ID "quoted" VALUE \\ slash')]
+        self.assertEqual({'text': 'ID "quoted" VALUE \\ slash'}, json.loads(MondayQuery._generate_update_query_v3(cells)))
+        escaped = MondayQuery._generate_update_query_v2(cells)
+        self.assertEqual({'text': 'ID "quoted" VALUE \\ slash'}, json.loads(json.loads(f'"{escaped}"')))
+
+    def test_update_sends_variables(self):
+        board = FakeBoard(items_per_group=1)
+        row = board.select(limit=10).data[0]
+        row.set('Text', 'ID and VALUE')
+        queries = []
+        board.execute = lambda query, files=None: queries.append(query) or board.respond(query)
+
+        self.assertTrue(row.update().is_ok())
+        self.assertIn('column_values: $columnValues', queries[0].get('query'))
+        self.assertEqual({'text': 'ID and VALUE'}, json.loads(queries[0].get('variables').get('columnValues')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from unittest import mock
+
+from monday.c_async_connection import AsyncMondayConnection
+from monday.c_complexity_scheduler import ComplexityBudget, ComplexityScheduler, Priority
+from monday.c_connection import MondayConnection
+from result.c_result import Result
+
+
+class ErrorResponse:
+    """ a requests response with graphql errors """
+    status_code = 200
+    reason = 'OK'
+
+    def __init__(self, body):
+        self.body = body
+        self.text = json.dumps(body)
+
+    def json(self):
+        return self.body
+
+
+def complexity_result(after, query_cost=100, reset_in=30):
+    return Result(0, data={'data': {'complexity': {'before': after + query_cost, 'after': after,
+                                                   'query': query_cost, 'reset_in_x_seconds': reset_in}}})
+
+
+class TestComplexityScheduler(unittest.TestCase):
+    def setUp(self):
+        # a fresh scheduler for each test, ComplexityScheduler() is the process wide instance
+        self.scheduler = ComplexityScheduler.klass(capacity=1000, window_seconds=60, default_cost=100)
+
+    def test_with_complexity(self):
+        query = {'query': 'query { boards (ids: 1) { id } }'}
+        scheduled = ComplexityScheduler.klass.with_complexity(query)
+        self.assertIn('complexity { before after query reset_in_x_seconds }', scheduled.get('query'))
+        self.assertTrue(scheduled.get('query').endswith('}'))
+        self.assertNotIn('complexity', query.get('query'))
+        self.assertIs(scheduled, ComplexityScheduler.klass.with_complexity(scheduled))
+
+    def test_budget_follows_responses(self):
+        ticket = self.scheduler.acquire('token', {'query': '{ boards (ids: 1) { id } }'})
+        self.assertEqual(900, self.scheduler.budget('token').get('remaining'))
+
+        self.scheduler.release(ticket, complexity_result(after=400, query_cost=250))
+        budget = self.scheduler.budget('token')
+        self.assertLess(budget.get('remaining'), 410)
+        self.assertGreater(budget.get('reset_in_seconds'), 25)
+
+        # the observed cost is used for the next query with the same shape
+        self.assertEqual(250, self.scheduler.estimate({'query': '{ boards (ids: 2) { id } }'}))
+
+    def test_exhausted_budget_waits(self):
+        ticket = self.scheduler.acquire('token', cost=100)
+        self.scheduler.release(ticket, Result(4000, data='30'))
+        self.assertEqual(1, self.scheduler.stats.get('exhausted'))
+
+        ticket = self.scheduler.enqueue('token', cost=100)
+        self.assertIsNotNone(self.scheduler.try_admit(ticket))
+        self.assertEqual(1, self.scheduler.queue_depth)
+
+        # other tokens have their own budget
+        self.assertIsNone(self.scheduler.try_admit(self.scheduler.enqueue('other', cost=100)))
+
+    def test_exhausted_budget_is_held_until_reset(self):
+        budget = ComplexityBudget(capacity=1000, window_seconds=60)
+        budget.exhausted(60)
+        budget.refill(budget.updated + 59)
+        self.assertEqual(0, budget.remaining)
+        self.assertGreater(budget.seconds_until(100), 50)
+        budget.refill(budget.reset_at + 0.1)
+        self.assertEqual(1000, budget.remaining)
+
+        ticket = self.scheduler.acquire('token', cost=100)
+        self.scheduler.release(ticket, Result(4000, data='60'))
+        # without the hold the bucket refills 1000 points over the 61 seconds, 10 of them in 0.6 seconds
+        waiting = self.scheduler.enqueue('token', cost=10)
+        self.assertIsNotNone(self.scheduler.try_admit(waiting))
+        time.sleep(0.7)
+        self.assertIsNotNone(self.scheduler.try_admit(waiting))
+
+    def test_priority_order(self):
+        ticket = self.scheduler.acquire('token', cost=1000)
+        batch = self.scheduler.enqueue('token', cost=100, priority=Priority.batch)
+        webhook = self.scheduler.enqueue('token', cost=100, priority=Priority.webhook)
+        self.assertIsNotNone(self.scheduler.try_admit(batch))
+
+        self.scheduler.release(ticket, complexity_result(after=1000))
+        self.assertIsNotNone(self.scheduler.try_admit(batch))
+        self.assertIsNone(self.scheduler.try_admit(webhook))
+        self.assertIsNone(self.scheduler.try_admit(batch))
+        self.assertEqual(0, self.scheduler.queue_depth)
+
+    def test_acquire_blocks_until_released(self):
+        ticket = self.scheduler.acquire('token', cost=1000)
+        admitted = []
+        waiter = threading.Thread(target=lambda: admitted.append(self.scheduler.acquire('token', cost=500)))
+        waiter.start()
+        waiter.join(timeout=0.2)
+        self.assertEqual([], admitted)
+
+        self.scheduler.release(ticket, complexity_result(after=1000))
+        waiter.join(timeout=5)
+        self.assertEqual(1, len(admitted))
+        self.assertEqual(1, self.scheduler.stats.get('delayed'))
+
+    def test_cancelled_acquire_does_not_block_the_queue(self):
+        connection = MondayConnection('1', 'token', 'account')
+        connection.scheduler = self.scheduler
+        ticket = self.scheduler.acquire('token', cost=1000)
+
+        async def timed_out_acquire():
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(AsyncMondayConnection(connection).acquire({'query': '{ boards { id } }'}),
+                                       timeout=0.1)
+        asyncio.run(timed_out_acquire())
+        self.assertEqual(0, self.scheduler.queue_depth)
+
+        self.scheduler.release(ticket, complexity_result(after=1000))
+        self.assertIsNone(self.scheduler.try_admit(self.scheduler.enqueue('token', cost=100)))
+
+    def test_cancel(self):
+        ticket = self.scheduler.acquire('token', cost=1000)
+        first = self.scheduler.enqueue('token', cost=100)
+        second = self.scheduler.enqueue('token', cost=100)
+        self.scheduler.cancel(first)
+        self.scheduler.release(ticket, complexity_result(after=1000))
+        self.assertIsNone(self.scheduler.try_admit(second))
+        self.assertEqual(0, self.scheduler.queue_depth)
+
+
+class TestComplexityErrors(unittest.TestCase):
+    def connection(self, body):
+        connection = MondayConnection('1', 'token', 'account')
+        connection.scheduler = ComplexityScheduler.klass(capacity=1000, window_seconds=60, default_cost=100)
+        sent = []
+
+        def post(url, **kwargs):
+            sent.append(kwargs)
+            return ErrorResponse(body)
+        return connection, sent, post
+
+    def test_other_errors_are_not_complexity_errors(self):
+        # every scheduled query asks for the complexity field, so it is in the body of every response
+        body = {'data': {'complexity': {'before': 1000, 'after': 900, 'query': 100, 'reset_in_x_seconds': 30}},
+                'errors': [{'message': 'Invalid column value', 'extensions': {'code': 'ColumnValueException'}}]}
+        connection, sent, post = self.connection(body)
+        with mock.patch('monday.c_connection.Network.post', side_effect=post), \
+                mock.patch('monday.c_connection.sleep') as sleep:
+            result = connection.execute({'query': 'mutation { change_column_value (item_id: 1) { id } }'})
+
+        self.assertEqual(4001, result.status.code)
+        self.assertEqual(body, result.data)
+        self.assertIn('Invalid column value', result.message)
+        self.assertIn('complexity', sent[0].get('data').get('query'))
+        self.assertNotIn(60, [call.args[0] for call in sleep.call_args_list])
+        self.assertEqual(0, connection.scheduler.stats.get('exhausted'))
+
+    def test_complexity_error(self):
+        body = {'errors': [{'message': 'Complexity budget exhausted, query cost 30001 budget remaining 3000 out of '
+                                       '1000000 reset in 42 seconds',
+                            'extensions': {'code': 'ComplexityException'}}]}
+        result = MondayConnection.check_response(ErrorResponse(body))
+        self.assertEqual(4000, result.status.code)
+        self.assertEqual('42', result.data)
+
+        result = MondayConnection.check_response(ErrorResponse({'errors': [
+            {'message': 'Too many requests', 'extensions': {'code': 'ComplexityException'}}]}))
+        self.assertEqual(4000, result.status.code)
+        self.assertEqual(60, MondayConnection.retry_wait_seconds(result) - 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import time
+import types
+import unittest
+
+from monday.c_column import Column
+from monday.c_filter import MondayFilter
+from monday.c_select import MondaySelect
+from tests.test_monday.fake_board import FakeBoard
+
+
+class TestFilter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.board = FakeBoard(items_per_group=30)
+        cls.rows = cls.board.select().data
+
+    def ids(self, rows):
+        return [row.row_id for row in rows]
+
+    def test_in_and_equals(self):
+        done = MondayFilter.for_board(self.board, 'Status', None, ['Done'])
+        self.assertEqual(30, len(done.apply(self.rows)))
+        equals = MondayFilter.for_board(self.board, 'Status', '=', ['Done', 'Stuck'])
+        self.assertEqual(60, len(equals.apply(self.rows)))
+        not_in = MondayFilter.for_board(self.board, 'Status', 'not in', ['Done'])
+        self.assertEqual(60, len(not_in.apply(self.rows)))
+
+    def test_numbers_compare_as_numbers(self):
+        rows = MondayFilter.for_board(self.board, 'Numbers', '>', [9]).apply(self.rows)
+        self.assertEqual(60, len(rows))
+        rows = MondayFilter.for_board(self.board, 'Numbers', 'between', ['10', '19']).apply(self.rows)
+        self.assertEqual(30, len(rows))
+
+    def test_dates(self):
+        rows = MondayFilter.for_board(self.board, 'Date', '>=', ['2024-01-28']).apply(self.rows)
+        self.assertEqual(3, len(rows))
+        rows = MondayFilter.for_board(self.board, 'Date', '=', ['2024-01-02']).apply(self.rows)
+        self.assertEqual(6, len(rows))
+
+    def test_rows_match_once(self):
+        # the row matches both values, it is only returned once
+        rows = MondaySelect.filter('Numbers', '>', [1, 2], self.rows)
+        self.assertEqual(len(set(self.ids(rows))), len(rows))
+        self.assertEqual(84, len(rows))
+
+    def test_and_or(self):
+        done = MondayFilter('Status', 'in', ['Done'])
+        small = MondayFilter('Numbers', '<', 5)
+        where = (done & small).bind(self.board)
+        self.assertEqual(['1001', '1004', '1031', '1034', '1061', '1064'], self.ids(where.apply(self.rows)))
+        where = (done | small).bind(self.board)
+        self.assertEqual(30 + 9, len(where.apply(self.rows)))
+
+    def test_bind_does_not_change_the_filter(self):
+        where = MondayFilter('Numbers', '>', 9) & MondayFilter('Status', 'in', ['Done'])
+        bound = where.bind(self.board)
+        self.assertEqual('numeric', bound.filters[0].col_type)
+        self.assertIsNone(where.filters[0].col_type)
+
+        # the same filter on a board where the column is text
+        text_board = types.SimpleNamespace(column_info_map={'Numbers': Column(0, 'numbers', 'Numbers', 'text')})
+        self.assertEqual('text', where.bind(text_board).filters[0].col_type)
+        expected = [row for row in self.rows
+                    if row.get('Status').value == 'Done' and float(row.get('Numbers').value) > 9]
+        self.assertEqual(self.ids(expected), self.ids(where.bind(self.board).apply(self.rows)))
+
+    def test_select_where(self):
+        where = MondayFilter('Status', 'in', ['Stuck']) & MondayFilter('Date', '<', '2024-01-10')
+        rows = FakeBoard(items_per_group=30).select(where=where).data
+        frame = FakeBoard(items_per_group=30).select_frame(where=where).data
+        self.assertEqual(self.ids(rows), list(frame['row_id']))
+        self.assertEqual(12, len(rows))
+
+    def test_filter_speed(self):
+        rows = self.rows * 1000
+        where = MondayFilter.for_board(self.board, 'Date', 'between', ['2024-01-05', '2024-01-20'])
+        start = time.time()
+        where.apply(rows)
+        self.assertLess(time.time() - start, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
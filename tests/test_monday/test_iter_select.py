@@ -0,0 +1,58 @@
+import types
+import unittest
+
+from result.c_result import Result
+from tests.test_monday.fake_board import FakeBoard
+
+
+class FailingBoard(FakeBoard):
+    """ answers the second page query with an error """
+    def execute(self, query, files=None) -> Result:
+        text = query.get('query') if isinstance(query, dict) else str(query)
+        if 'items_page' in text and 'columns {' not in text:
+            self.pages = getattr(self, 'pages', 0) + 1
+            if self.pages == 2:
+                return Result(4001, message='Internal error')
+        return super().execute(query, files)
+
+
+class TestIterSelect(unittest.TestCase):
+    def test_iter_select_matches_select(self):
+        board = FakeBoard(items_per_group=25)
+        expected = [row.row_id for row in board.select(limit=10).data]
+
+        board = FakeBoard(items_per_group=25)
+        rows = board.iter_select(limit=10)
+        self.assertIsInstance(rows, types.GeneratorType)
+        self.assertEqual(expected, [row.row_id for row in rows])
+        self.assertEqual(0, board.row_count)
+        self.assertEqual(0, len(board.row_multimap))
+
+    def test_iter_select_is_lazy(self):
+        board = FakeBoard(items_per_group=25)
+        queries = len(board.queries)
+        rows = board.iter_select(groups='RTG', limit=10)
+        first = next(rows)
+        self.assertEqual('RTG', first.group_name)
+        self.assertEqual(1, len(board.queries) - queries)
+
+    def test_iter_select_filter(self):
+        board = FakeBoard(items_per_group=9)
+        rows = list(board.iter_select(col_name='Status', values=['Stuck'], limit=4))
+        self.assertEqual(9, len(rows))
+        for row in rows:
+            self.assertEqual('Stuck', row.get('Status').value)
+
+    def test_iter_select_error_stops_every_group(self):
+        board = FailingBoard(items_per_group=5)
+        rows = []
+        with self.assertRaises(Exception) as context:
+            for row in board.iter_select(limit=10):
+                rows.append(row)
+        self.assertIn('Internal error', str(context.exception))
+        self.assertEqual(5, len(rows))
+        self.assertEqual(2, board.pages)
+
+
+if __name__ == '__main__':
+    unittest.main()
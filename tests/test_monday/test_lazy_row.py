@@ -0,0 +1,61 @@
+import json
+import unittest
+
+from monday.c_filter import MondayFilter
+from monday.c_row import LazyRow
+from tests.test_monday.fake_board import FakeBoard
+
+
+class TestLazyRow(unittest.TestCase):
+    def setUp(self):
+        self.board = FakeBoard(items_per_group=5)
+
+    def test_same_values_as_row(self):
+        eager = self.board.select(limit=100).data
+        lazy = self.board.select(limit=100, lazy=True).data
+        self.assertEqual(15, len(lazy))
+        self.assertTrue(all(isinstance(row, LazyRow) for row in lazy))
+        for a, b in zip(eager, lazy):
+            self.assertEqual(a.value('Status'), b.value('Status'))
+            self.assertEqual(a.value('Date').db_format, b.value('Date').db_format)
+            self.assertEqual(a.as_db_dict(), b.as_db_dict())
+            self.assertEqual([c.name for c in a.cells], [c.name for c in b.cells])
+            self.assertEqual(sorted(vars(a.readonly)), sorted(vars(b.readonly)))
+            self.assertEqual(a.readonly.text, b.readonly.text)
+            self.assertEqual(list(a.cell_db_map), list(b.cell_db_map))
+        self.assertEqual('Status', lazy[0].title.status)
+
+    def test_cells_are_created_when_used(self):
+        row = self.board.select(limit=100, lazy=True).data[0]
+        self.assertEqual(['Name'], [c.name for c in row.loaded_cells])
+        self.assertEqual('text 0', row.value('Text'))
+        self.assertIs(row.get('Text'), row.get('Text'))
+        self.assertEqual(['Name', 'Text'], [c.name for c in row.loaded_cells])
+        self.assertFalse(row.is_loaded)
+
+        # every cell is created in column order, the Text cell is kept
+        text = row.get('Text')
+        self.assertEqual(['Name', 'Status', 'Date', 'Text', 'Numbers', 'Email'], [c.name for c in row.cells])
+        self.assertIs(text, row.cell_map.get('Text'))
+        self.assertTrue(row.is_loaded)
+        self.assertIsNone(row.find_cell('Missing'))
+
+    def test_filter_creates_the_filtered_cell(self):
+        rows = self.board.select(limit=100, lazy=True, where=MondayFilter('Status', '=', 'Done')).data
+        self.assertEqual(6, len(rows))
+        self.assertEqual(['Name', 'Status'], [c.name for c in rows[0].loaded_cells])
+
+    def test_update_sends_modified_cells(self):
+        row = self.board.select(limit=100, lazy=True).data[0]
+        row.set('Text', 'changed')
+        queries = []
+        self.board.execute = lambda query, files=None: queries.append(query) or self.board.respond(query)
+
+        self.assertTrue(row.update().is_ok())
+        self.assertEqual({'text': 'changed'}, json.loads(queries[0].get('variables').get('columnValues')))
+        self.assertFalse(row.get('Text').modified)
+        self.assertFalse(row.is_loaded)
+
+
+if __name__ == '__main__':
+    unittest.main()
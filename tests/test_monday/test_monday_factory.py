@@ -0,0 +1,103 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+import monday.c_monday_factory as factory_module
+from cache.c_single_flight import SingleFlight
+from monday.c_monday_factory import MondayFactory
+from monday.c_schema_cache import SCHEMA_CACHE_DIR_ENV
+from tests.test_monday.fake_board import FakeBoard
+
+
+class SlowBoard(FakeBoard):
+    loads = 0
+
+    def __init__(self, board_id, monday_token=None, **kwargs):
+        SlowBoard.loads += 1
+        time.sleep(0.05)
+        super().__init__(items_per_group=1, **kwargs)
+        self.board_id = board_id
+
+
+def run_threads(count, target):
+    results = [None] * count
+
+    def work(i):
+        results[i] = target()
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(count)]
+    [t.start() for t in threads]
+    [t.join() for t in threads]
+    return results
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_callers_share_one_call(self):
+        flight = SingleFlight()
+        calls = []
+
+        def load():
+            calls.append(1)
+            time.sleep(0.05)
+            return object()
+
+        results = run_threads(8, lambda: flight.do('key', load))
+        self.assertEqual(1, len(calls))
+        self.assertEqual(1, len({id(r) for r in results}))
+        self.assertEqual({'calls': 1, 'shared': 7, 'in_flight': 0}, flight.stats())
+
+    def test_errors_are_shared_and_not_kept(self):
+        flight = SingleFlight()
+
+        def fail():
+            time.sleep(0.05)
+            raise ValueError('no board')
+
+        errors = run_threads(4, lambda: self.assertRaises(ValueError, flight.do, 'key', fail))
+        self.assertEqual(4, len(errors))
+        self.assertEqual('ok', flight.do('key', lambda: 'ok'))
+
+
+class TestMondayFactory(unittest.TestCase):
+    def setUp(self):
+        self.board_class = factory_module.Board
+        factory_module.Board = SlowBoard
+        SlowBoard.loads = 0
+        self.factory = MondayFactory.klass()
+
+    def tearDown(self):
+        factory_module.Board = self.board_class
+
+    def test_one_load_per_board(self):
+        boards = run_threads(6, lambda: self.factory.board(1234, monday_token='token'))
+        self.assertEqual(1, SlowBoard.loads)
+        self.assertTrue(all(board is boards[0] for board in boards))
+
+        run_threads(6, lambda: self.factory.board('5678', monday_token='token'))
+        self.assertEqual(2, SlowBoard.loads)
+        self.assertIs(boards[0], self.factory.board(1234))
+
+    def test_refresh(self):
+        first = self.factory.board(1234, monday_token='token')
+        boards = run_threads(4, lambda: self.factory.refresh(1234, monday_token='token'))
+        self.assertEqual(2, SlowBoard.loads)
+        self.assertIsNot(first, self.factory.board(1234))
+        self.assertIn(self.factory.board(1234), boards)
+
+    def test_refresh_reads_the_schema_from_monday(self):
+        with tempfile.TemporaryDirectory() as directory:
+            os.environ[SCHEMA_CACHE_DIR_ENV] = directory
+            try:
+                self.factory.board(1234, monday_token='token')
+                refreshed = self.factory.refresh(1234, monday_token='token')
+                cleared = self.factory.board(1234, monday_token='token', clear_cache=True)
+            finally:
+                os.environ.pop(SCHEMA_CACHE_DIR_ENV, None)
+        for board in (refreshed, cleared):
+            self.assertEqual(1, len([q for q in board.queries if 'columns {' in q]))
+
+
+if __name__ == '__main__':
+    unittest.main()
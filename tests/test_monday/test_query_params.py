@@ -0,0 +1,81 @@
+import unittest
+
+from monday.c_filter import MondayFilter
+from monday.c_query_params import QueryParams
+from std_utility.c_datetime import DateTime
+from tests.test_monday.fake_board import FakeBoard
+
+
+class TestQueryParams(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.board = FakeBoard(items_per_group=30)
+
+    def test_compile(self):
+        params = QueryParams(self.board)
+        self.assertEqual('', params.compile())
+        self.assertTrue(params.add('Status', 'in', ['Done', 'Stuck']))
+        self.assertTrue(params.add('Date', '>=', '2024-01-10'))
+        self.assertTrue(params.add('Numbers', 'between', [5, 10]))
+        self.assertEqual(', query_params: {rules: ['
+                         '{column_id: "status", compare_value: [1, 2], operator: any_of}, '
+                         '{column_id: "date4", compare_value: ["EXACT", "2024-01-10"], operator: greater_than_or_equals}, '
+                         '{column_id: "numbers", compare_value: [5, 10], operator: between}], operator: and}',
+                         params.compile())
+
+    def test_unsupported_rules(self):
+        params = QueryParams(self.board)
+        self.assertFalse(params.add('Name', '=', ['Item 1000']))
+        self.assertFalse(params.add('Status', 'in', ['Not a label']))
+        self.assertFalse(params.add('Numbers', '>', [1, 2]))
+        self.assertFalse(params.add('Missing', 'in', ['x']))
+        self.assertEqual(0, len(params))
+
+    def test_dates_with_a_time_stay_on_the_client(self):
+        params = QueryParams(self.board)
+        self.assertFalse(params.add('Date', '>', '2024-01-10 15:00'))
+        self.assertFalse(params.add('Date', '=', DateTime('2024-01-10 15:00:00')))
+        self.assertTrue(params.add('Date', '<', DateTime('2024-01-10')))
+        self.assertEqual(1, len(params))
+
+        where = MondayFilter('Date', '>', '2024-01-10 15:00')
+        expected = [row.row_id for row in FakeBoard(items_per_group=30).select(where=where).data]
+        rows = FakeBoard(items_per_group=30).select(where=where, server_filter=True).data
+        self.assertEqual(expected, [row.row_id for row in rows])
+        self.assertNotIn('2024-01-10', [row.get('Date').value.to_str()[:10] for row in rows])
+
+    def test_gen_filter(self):
+        q_filter = self.board.gen_filter([('Status', ['Done']), ('Text', 'text 1')])
+        self.assertIn('{column_id: "status", compare_value: [1], operator: any_of}', q_filter)
+        self.assertIn('{column_id: "text", compare_value: ["text 1"], operator: any_of}', q_filter)
+
+    def test_select_server_filter(self):
+        board = FakeBoard(items_per_group=30)
+        expected = [row.row_id for row in board.select(col_name='Status', operator='in', values=['Done'], limit=7).data]
+
+        board = FakeBoard(items_per_group=30)
+        result = board.select(col_name='Status', values=['Done'], limit=7, server_filter=True)
+        self.assertEqual(expected, [row.row_id for row in result.data])
+        self.assertEqual(30, board.items_sent)
+
+    def test_where_is_split(self):
+        where = MondayFilter('Numbers', '<', 10) & MondayFilter('Name', 'in', ['Item 1001', 'Item 1004', 'Item 1031'])
+        board = FakeBoard(items_per_group=30)
+        rows = board.select(where=where, server_filter=True).data
+        self.assertEqual(['1001', '1004', '1031'], [row.row_id for row in rows])
+        self.assertEqual(30, board.items_sent)
+
+        frame = FakeBoard(items_per_group=30).select_frame(where=where, server_filter=True).data
+        self.assertEqual(['1001', '1004', '1031'], list(frame['row_id']))
+
+    def test_or_filter(self):
+        where = MondayFilter('Status', 'in', ['Stuck']) | MondayFilter('Numbers', '>=', 28)
+        expected = [row.row_id for row in FakeBoard(items_per_group=30).select(where=where).data]
+        board = FakeBoard(items_per_group=30)
+        rows = list(board.iter_select(where=where, server_filter=True))
+        self.assertEqual(expected, [row.row_id for row in rows])
+        self.assertEqual(len(expected), board.items_sent)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+from monday.c_query_templates import QueryTemplates
+from tests.test_monday.fake_board import FakeBoard
+
+
+class TestQueryTemplates(unittest.TestCase):
+    def test_text_is_minified_once(self):
+        template = QueryTemplates.get('item_count')
+        self.assertEqual('query item_count ($boardId: [ID!]) { boards (ids: $boardId) { items_count } }', template.text)
+        self.assertIs(template.text, QueryTemplates.query('item_count', boardId=[1]).get('query'))
+
+    def test_values_stay_in_variables(self):
+        query = QueryTemplates.query('rename_column', boardId=1, columnId='text', title='"BOARD_ID" NAME \\ }')
+        self.assertNotIn('NAME', query.get('query'))
+        self.assertEqual('"BOARD_ID" NAME \\ }', query.get('variables').get('title'))
+
+    def test_fragments(self):
+        query = QueryTemplates.query('select_groups', fragments={'QUERY_PARAMS': ', query_params: {rules: []}'},
+                                     boardId=[1], groups=['topics'], limit=10, cursor=None, fields=None)
+        self.assertIn('limit: $limit , query_params: {rules: []})', query.get('query'))
+        query = QueryTemplates.query('select_groups', fragments={'QUERY_PARAMS': None}, limit=10)
+        self.assertNotIn('QUERY_PARAMS', query.get('query'))
+
+    def test_cache_key(self):
+        first = QueryTemplates.query('rows', ids=[1, 2], fields=['text'])
+        second = QueryTemplates.query('rows', fields=['text'], ids=[1, 2])
+        self.assertEqual(QueryTemplates.cache_key(first), QueryTemplates.cache_key(second))
+        self.assertNotEqual(QueryTemplates.cache_key(first), QueryTemplates.cache_key(QueryTemplates.query('rows', ids=[1])))
+
+    def test_unknown_and_duplicate_names(self):
+        self.assertRaises(AssertionError, QueryTemplates.get, 'missing')
+        self.assertRaises(AssertionError, QueryTemplates.register, 'rows', 'query { items { id } }')
+
+    def test_select_pages_send_the_same_text(self):
+        board = FakeBoard(items_per_group=25)
+        queries = []
+        respond = board.respond
+        board.respond = lambda query: queries.append(query) or respond(query)
+        rows = board.select(groups='RTG', limit=10).data
+        self.assertEqual(25, len(rows))
+        pages = [q for q in queries if isinstance(q, dict) and 'select_groups' in q.get('query')]
+        self.assertEqual(3, len(pages))
+        self.assertEqual(1, len({q.get('query') for q in pages}))
+        self.assertEqual([None, 'rtg:10', 'rtg:20'], [q.get('variables').get('cursor') for q in pages])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import copy
+import time
+import unittest
+
+from cache.c_cached_resource import CachedResource
+from monday.c_complexity_scheduler import ComplexityScheduler
+from monday.c_events import MondayEvent
+from monday.c_monday_factory import MondayFactory
+from monday.c_query_templates import QueryTemplates
+from monday.c_response_cache import ResponseCache
+from monday.c_web_hook import WebHook
+from result.c_result import Result
+from tests.test_monday.fake_board import FakeBoard
+
+
+def rows_result(item_id):
+    return Result(0, data={'data': {'items': [{'id': str(item_id), 'name': 'Item'}]}})
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = ResponseCache(max_entries=3, ttls={'rows': 60})
+
+    def test_read_through(self):
+        query = QueryTemplates.query('rows', ids=[1001], fields=None)
+        self.assertIsNone(self.cache.get('token', query))
+        self.cache.put('token', query, rows_result(1001), board_id=1234)
+
+        hit = self.cache.get('token', QueryTemplates.query('rows', fields=None, ids=[1001]))
+        self.assertEqual('1001', hit.data.get('data').get('items')[0].get('id'))
+        # every hit is a copy, the cached json can not be changed by a caller
+        hit.data.get('data').get('items').clear()
+        self.assertEqual(1, len(self.cache.get('token', query).data.get('data').get('items')))
+        # other tokens do not share entries
+        self.assertIsNone(self.cache.get('other token', query))
+        self.assertEqual({'size': 1, 'hits': 2, 'misses': 2, 'evictions': 0, 'invalidations': 0}, self.cache.stats())
+
+    def test_errors_and_mutations_are_not_cached(self):
+        query = QueryTemplates.query('rows', ids=[1001])
+        self.cache.put('token', query, Result(-1, message='failed'))
+        self.cache.put('token', QueryTemplates.query('delete_item', itemId=1001), rows_result(1001))
+        self.assertEqual(0, self.cache.size)
+
+    def test_ttl_per_operation(self):
+        cache = ResponseCache(ttls={'rows': 0.05, 'users': 60})
+        rows = QueryTemplates.query('rows', ids=[1001])
+        users = 'query { users { id name email } }'
+        self.assertEqual('users', cache.operation(users))
+        cache.put('token', rows, rows_result(1001))
+        cache.put('token', users, Result(0, data={'data': {'users': []}}))
+        time.sleep(0.1)
+        self.assertIsNone(cache.get('token', rows))
+        self.assertIsNotNone(cache.get('token', users))
+
+    def test_least_recently_used_is_dropped(self):
+        queries = [QueryTemplates.query('rows', ids=[i]) for i in range(4)]
+        for i, query in enumerate(queries[:3]):
+            self.cache.put('token', query, rows_result(i))
+        self.cache.get('token', queries[0])
+        self.cache.put('token', queries[3], rows_result(3))
+        self.assertIsNotNone(self.cache.get('token', queries[0]))
+        self.assertIsNone(self.cache.get('token', queries[1]))
+        self.assertEqual(1, self.cache.evictions)
+
+    def test_invalidate(self):
+        self.cache.put('token', QueryTemplates.query('rows', ids=[1001]), rows_result(1001), board_id=1234)
+        self.cache.put('token', 'query { items (ids: [2001]) { id } }', rows_result(2001), board_id=5678)
+        self.cache.put('token', QueryTemplates.query('item_count', boardId=[1234]), rows_result(0), board_id=1234)
+        self.assertEqual(1, self.cache.invalidate(item_id=2001))
+        self.assertEqual(2, self.cache.invalidate(board_id='1234'))
+        self.assertEqual(0, self.cache.size)
+
+    def test_mutations_invalidate_through_the_connection(self):
+        board = FakeBoard(items_per_group=2, response_cache=self.cache)
+        self.assertIs(self.cache, copy.deepcopy({"cache": self.cache}).get("cache"))
+        query = QueryTemplates.query('rows', ids=[1000])
+        board.cache_response(query, board.respond(query))
+        self.assertIsNotNone(board.cached_response(query))
+        self.assertIsNone(board.cached_response(query, files={'file': b''}))
+
+        board.cache_response(QueryTemplates.query('delete_item', itemId=1000), Result(0))
+        self.assertIsNone(board.cached_response(query))
+
+    def test_webhook_invalidates(self):
+        factory = MondayFactory()
+        factory.response_cache = self.cache
+        try:
+            self.cache.put('token', QueryTemplates.query('rows', ids=[1001]), rows_result(1001), board_id=1234)
+            self.cache.put('token', QueryTemplates.query('rows', ids=[900]), rows_result(900), board_id=4321)
+            WebHook.invalidate(MondayEvent({'type': 'update_column_value', 'boardId': 5678, 'pulseId': 3001,
+                                            'parentItemId': 1001, 'parentItemBoardId': 1234}))
+            self.assertEqual(1, self.cache.size)
+        finally:
+            factory.response_cache = None
+
+
+class TestSharedCacheSize(unittest.TestCase):
+    def test_boards_are_not_charged_for_the_shared_cache(self):
+        response_cache = ResponseCache(max_entries=1000)
+        scheduler = ComplexityScheduler.klass()
+        boards = [FakeBoard(items_per_group=5, response_cache=response_cache, scheduler=scheduler)
+                  for _ in range(2)]
+        [board.select() for board in boards]
+        sizes = [CachedResource.approximate_size(board) for board in boards]
+
+        for i in range(200):
+            response_cache.put('token', QueryTemplates.query('rows', ids=[i], fields=None), rows_result(i))
+        for board, size in zip(boards, sizes):
+            self.assertEqual(size, CachedResource.approximate_size(board))
+        self.assertGreater(CachedResource.approximate_size(response_cache), 100000)
+
+        # room for the two boards, neither is evicted because of the response cache
+        cache = CachedResource(max_bytes=sum(sizes) * 2)
+        cache.update_cache(boards[0], 1)
+        cache.update_cache(boards[1], 2)
+        self.assertEqual(2, cache.size)
+        self.assertEqual(0, cache.evictions)
+
+
+if __name__ == '__main__':
+    unittest.main()
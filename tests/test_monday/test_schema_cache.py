@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+
+from monday.c_schema_cache import SchemaCache, SCHEMA_CACHE_DIR_ENV
+from tests.test_monday.fake_board import FakeBoard
+
+
+class TestSchemaCache(unittest.TestCase):
+    def setUp(self):
+        self.temp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        os.environ.pop(SCHEMA_CACHE_DIR_ENV, None)
+        self.temp.cleanup()
+
+    def schema_queries(self, board):
+        return [q for q in board.queries if 'columns {' in q]
+
+    def test_second_board_uses_the_cache(self):
+        first = FakeBoard(schema_cache=SchemaCache(self.temp.name))
+        self.assertEqual(1, len(self.schema_queries(first)))
+
+        second = FakeBoard(schema_cache=SchemaCache(self.temp.name))
+        self.assertEqual(0, len(self.schema_queries(second)))
+        self.assertEqual(list(first.column_info_map.keys()), list(second.column_info_map.keys()))
+        self.assertEqual(first.group_map, second.group_map)
+        self.assertEqual({'Working on it': 0, 'Done': 1, 'Stuck': 2}, second.col_map.get('Status').label_map)
+        self.assertEqual(30, len(second.select().data))
+
+    def test_token_scope(self):
+        FakeBoard(schema_cache=SchemaCache(self.temp.name))
+        cache = SchemaCache(self.temp.name)
+        self.assertIsNotNone(cache.get_schema(1234, 'fake-token'))
+        self.assertIsNone(cache.get_schema(1234, 'other-token'))
+        for name in os.listdir(self.temp.name):
+            with open(os.path.join(self.temp.name, name)) as f:
+                self.assertNotIn('fake-token', f.read())
+
+    def test_environment(self):
+        self.assertIsNone(FakeBoard().schema_cache)
+        os.environ[SCHEMA_CACHE_DIR_ENV] = self.temp.name
+        FakeBoard()
+        board = FakeBoard()
+        self.assertEqual(0, len(self.schema_queries(board)))
+
+    def test_invalid_schema_is_not_used(self):
+        cache = SchemaCache(self.temp.name)
+        cache.update_cache({'data': {'boards': []}}, 1234, cache.token_scope('fake-token'), 'schema')
+        self.assertIsNone(cache.get_schema(1234, 'fake-token'))
+        board = FakeBoard(schema_cache=cache)
+        self.assertEqual(1, len(self.schema_queries(board)))
+
+    def test_schema_changes_remove_the_cached_schema(self):
+        cache = SchemaCache(self.temp.name)
+        changes = [lambda board: board.add_column('Notes'),
+                   lambda board: board.rename_column('Status', 'State'),
+                   lambda board: board.create_group('East'),
+                   lambda board: board.monday_update('1', {'Status': 'Blocked'}, add_missing_labels=True)]
+        for change in changes:
+            board = FakeBoard(items_per_group=1, schema_cache=cache)
+            self.assertIsNotNone(cache.get_schema(1234, 'fake-token'))
+            change(board)
+            self.assertIsNone(cache.get_schema(1234, 'fake-token'))
+            self.assertEqual(1, len(self.schema_queries(FakeBoard(items_per_group=1, schema_cache=cache))))
+
+        board = FakeBoard(items_per_group=1, schema_cache=cache)
+        board.monday_update('1', {'Status': 'Done'})
+        self.assertIsNotNone(cache.get_schema(1234, 'fake-token'))
+
+    def test_refresh_schema(self):
+        cache = SchemaCache(self.temp.name)
+        FakeBoard(items_per_group=1, schema_cache=cache)
+        board = FakeBoard(items_per_group=1, schema_cache=cache, refresh_schema=True)
+        self.assertEqual(1, len(self.schema_queries(board)))
+        self.assertIsNotNone(cache.get_schema(1234, 'fake-token'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import asyncio
+import unittest
+
+from tests.test_monday.fake_board import FakeBoard
+
+
+class TestSelectAsync(unittest.TestCase):
+    def test_select_async_matches_select(self):
+        board = FakeBoard(items_per_group=25)
+        result = board.select(limit=10)
+        self.assertTrue(result.is_ok())
+        expected = [row.row_id for row in result.data]
+
+        async_board = FakeBoard(items_per_group=25, delay=0.01)
+        result = asyncio.run(async_board.select_async(limit=10))
+        self.assertTrue(result.is_ok())
+        self.assertEqual(expected, [row.row_id for row in result.data])
+        self.assertEqual(75, async_board.row_count)
+        self.assertGreater(async_board.max_in_flight, 1)
+
+    def test_select_async_filter(self):
+        board = FakeBoard(items_per_group=9, delay=0.01)
+        result = asyncio.run(board.select_async(col_name='Status', values=['Done']))
+        self.assertTrue(result.is_ok())
+        self.assertEqual(9, len(result.data))
+        for row in result.data:
+            self.assertEqual('Done', row.get('Status').value)
+
+    def test_load_rows_async(self):
+        board = FakeBoard(items_per_group=100, delay=0.01)
+        ids = [item.get('id') for item in board.all_items()][:250]
+        rows = asyncio.run(board.load_rows_async(ids))
+        self.assertEqual(ids, [row.row_id for row in rows])
+        self.assertEqual(3, board.max_in_flight)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+
+from tests.test_monday.fake_board import FakeBoard
+
+
+class TestSelectFrame(unittest.TestCase):
+    def test_frame_matches_rows(self):
+        board = FakeBoard(items_per_group=12)
+        rows = board.select(limit=5).data
+
+        result = board.select_frame(limit=5)
+        self.assertTrue(result.is_ok())
+        frame = result.data
+        self.assertEqual(len(rows), len(frame))
+        self.assertEqual([row.row_id for row in rows], list(frame['row_id']))
+        self.assertEqual([row.get('Status').value for row in rows], list(frame['Status']))
+        self.assertEqual([row.group_name for row in rows], list(frame['group_name']))
+        self.assertEqual([row.row_name for row in rows], list(frame['Name']))
+
+    def test_typed_columns(self):
+        board = FakeBoard(items_per_group=10)
+        frame = board.select_frame(groups='RTG', parallel=True).data
+        self.assertEqual(10, len(frame))
+        self.assertEqual('datetime64[ns]', str(frame['Date'].dtype))
+        self.assertEqual(45, frame['Numbers'].sum())
+        self.assertEqual(3, (frame['Date'] > '2024-01-07').sum())
+        self.assertEqual(0, board.row_count)
+
+    def test_fields(self):
+        board = FakeBoard(items_per_group=2)
+        frame = board.select_frame(fields=['Status']).data
+        self.assertEqual(['row_id', 'group_id', 'group_name', 'Name', 'Status'], list(frame.columns))
+
+
+if __name__ == '__main__':
+    unittest.main()
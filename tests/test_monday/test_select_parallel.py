@@ -0,0 +1,33 @@
+import unittest
+
+from tests.test_monday.fake_board import FakeBoard
+
+
+class TestSelectParallel(unittest.TestCase):
+    def test_parallel_matches_serial(self):
+        board = FakeBoard(items_per_group=25)
+        expected = [row.row_id for row in board.select(limit=10).data]
+
+        parallel_board = FakeBoard(items_per_group=25, delay=0.02)
+        result = parallel_board.select(limit=10, parallel=True)
+        self.assertTrue(result.is_ok())
+        self.assertEqual(expected, [row.row_id for row in result.data])
+        self.assertEqual(75, parallel_board.row_count)
+        self.assertEqual(3, parallel_board.max_in_flight)
+
+    def test_max_workers(self):
+        board = FakeBoard(items_per_group=5, delay=0.02)
+        result = board.select(limit=2, parallel=True, max_workers=2)
+        self.assertEqual(15, len(result.data))
+        self.assertEqual(2, board.max_in_flight)
+
+    def test_parallel_filter(self):
+        board = FakeBoard(items_per_group=9, delay=0.01)
+        result = board.select(col_name='Status', values=['Done'], parallel=True)
+        self.assertEqual(9, len(result.data))
+        for row in result.data:
+            self.assertEqual('Done', row.get('Status').value)
+
+
+if __name__ == '__main__':
+    unittest.main()
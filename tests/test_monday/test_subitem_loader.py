@@ -0,0 +1,56 @@
+import unittest
+
+from monday.c_subitem_loader import SubItemLoader
+from result.c_result import Result
+from tests.test_monday.fake_board import FakeBoard
+
+
+class TestSubItemLoader(unittest.TestCase):
+    def setUp(self):
+        self.board = FakeBoard(items_per_group=70, subitems_per_item=2)
+
+    def subitem_queries(self):
+        return [q for q in self.board.queries if 'subitems {' in q]
+
+    def test_select_with_subitems(self):
+        rows = self.board.select(limit=100, with_subitems=True).data
+        self.assertEqual(210, len(rows))
+        # 210 parents in batches of 100
+        self.assertEqual(3, len(self.subitem_queries()))
+        for row in rows:
+            self.assertEqual(['Task 0', 'Task 1'], [s.row_name for s in row.sub_items])
+            self.assertIs(row, row.sub_items[0].parent_row)
+        sub_item = rows[5].sub_items[1]
+        self.assertEqual('5678', sub_item.sub_board_id)
+        self.assertEqual('owner 1', sub_item.cell_map.get('Owner').value)
+        self.assertIn('Owner', self.board.column_info_sub_map)
+        self.assertEqual([sub_item], rows[5].find_sub_rows('Task 1', None))
+
+    def test_without_subitems(self):
+        rows = self.board.select(groups='RTG', limit=100).data
+        self.assertEqual(0, len(self.subitem_queries()))
+        self.assertTrue(all(len(row.sub_items) == 0 for row in rows))
+        self.assertEqual(0, SubItemLoader(FakeBoard(items_per_group=1)).load(rows).data)
+
+    def test_errors_keep_loaded_batches(self):
+        rows = self.board.select(limit=100).data
+        respond = self.board.respond
+        calls = []
+
+        def fail_second(query):
+            if 'subitems {' in query.get('query'):
+                calls.append(query)
+                if len(calls) == 2:
+                    return Result(500, message='server error')
+            return respond(query)
+
+        self.board.execute = lambda query, files=None: fail_second(query)
+        result = SubItemLoader(self.board).load(rows)
+        self.assertTrue(result.is_error())
+        self.assertEqual(200, result.data)
+        self.assertEqual(2, len(rows[0].sub_items))
+        self.assertEqual(0, len(rows[-1].sub_items))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+
+from tests.test_monday.fake_board import FakeBoard
+
+
+class TestUnitOfWork(unittest.TestCase):
+    def setUp(self):
+        self.board = FakeBoard(items_per_group=10)
+        self.rows = self.board.select(limit=100).data
+
+    def mutation_count(self):
+        return len([q for q in self.board.queries if q.startswith('mutation')])
+
+    def test_changes_are_recorded(self):
+        # changes before begin are not recorded
+        self.rows[0].set('Text', 'before')
+        unit_of_work = self.board.begin()
+        self.assertEqual(0, len(unit_of_work))
+
+        self.rows[1].set('Text', 'one')
+        self.rows[1].set('Email', 'one@example.com')
+        self.rows[2].get('Text').value = 'two'
+        self.assertEqual([self.rows[1], self.rows[2]], list(unit_of_work.rows.values()))
+
+    def test_loaded_rows_are_not_recorded(self):
+        unit_of_work = self.board.begin()
+        rows = self.board.select(limit=100).data
+        self.board.select(limit=100, lazy=True).data[0].get('Text')
+        self.assertEqual(0, len(unit_of_work))
+        self.assertFalse(rows[0].get('Name').modified)
+
+        rows[0].set('Text', 'changed')
+        self.assertEqual([rows[0]], list(unit_of_work.rows.values()))
+
+    def test_flush_order_and_report(self):
+        unit_of_work = self.board.begin()
+        for row in self.rows[:12]:
+            row.set('Text', f"new {row.row_id}")
+        new_row = unit_of_work.insert(self.board.new_row('New item'))
+        new_row.set('Text', 'new row')
+        unit_of_work.add_subitem(new_row, 'Task 1', {'text': 'first'})
+        unit_of_work.add_subitem(self.rows[0], 'Task 2')
+        unit_of_work.delete(self.rows[20])
+
+        result = self.board.flush()
+        self.assertTrue(result.is_ok())
+        # one request for each kind of change, parents before subitems
+        self.assertEqual(4, self.mutation_count())
+        self.assertEqual(['create_item', 'change_multiple_column_values', 'create_subitem', 'delete_item'],
+                         list(dict.fromkeys(name for name, _ in self.board.mutation_log)))
+        self.assertIn(('create_subitem', '9001'), self.board.mutation_log)
+
+        actions = [outcome.action for outcome in result.data]
+        self.assertEqual(['insert'] + ['update'] * 12 + ['subitem insert'] * 2 + ['delete'], actions)
+        self.assertEqual('9001', new_row.row_id)
+        self.assertTrue(new_row.on_monday)
+        self.assertEqual(1, len(new_row.sub_items))
+        self.assertIn(new_row, self.board.rows)
+        self.assertNotIn(self.rows[20], self.board.rows)
+        self.assertFalse(any(row.get('Text').modified for row in self.rows[:12]))
+        self.assertEqual(0, len(unit_of_work))
+
+        # nothing left to send
+        self.assertTrue(self.board.flush().is_ok())
+        self.assertEqual(4, self.mutation_count())
+
+    def test_failed_rows_stay_pending(self):
+        unit_of_work = self.board.begin()
+        for row in self.rows[:3]:
+            row.set('Text', 'changed')
+        failed_row = unit_of_work.insert(self.board.new_row('Bad item'))
+        unit_of_work.add_subitem(failed_row, 'Task')
+        self.board.fail_ids = {self.rows[1].row_id, 'Bad item'}
+
+        result = self.board.flush()
+        self.assertTrue(result.is_error())
+        self.assertEqual([(failed_row, 'insert'), (self.rows[1], 'update')],
+                         [(o.row, o.action) for o in result.data if not o.ok])
+        self.assertTrue(self.rows[1].get('Text').modified)
+        self.assertCountEqual([self.rows[1], failed_row], unit_of_work.rows.values())
+        self.assertEqual(1, len(unit_of_work.subitems))
+
+        self.board.fail_ids = set()
+        result = self.board.flush()
+        self.assertTrue(result.is_ok())
+        self.assertEqual(['insert', 'update', 'subitem insert'], [o.action for o in result.data])
+        self.assertEqual(0, len(unit_of_work))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import json
+import unittest
+
+from monday.c_complexity_scheduler import ComplexityScheduler
+from monday.c_connection import MondayConnection
+from result.c_result import Result
+from tests.test_monday.fake_board import FakeBoard
+
+
+class PartialResponse:
+    """ a requests response with graphql errors and data for the aliases that worked """
+    status_code = 200
+    reason = 'OK'
+
+    def __init__(self, body):
+        self.body = body
+        self.text = json.dumps(body)
+
+    def json(self):
+        return self.body
+
+
+class TestUpdateRows(unittest.TestCase):
+    def modified_rows(self, board, count):
+        rows = board.select(limit=100).data[:count]
+        for row in rows:
+            row.set('Text', f"new {row.row_id}")
+        return rows
+
+    def test_one_request_per_batch(self):
+        board = FakeBoard(items_per_group=10)
+        rows = self.modified_rows(board, 25)
+        board.queries.clear()
+
+        result = board.update_rows(rows, batch_size=10)
+        self.assertTrue(result.is_ok())
+        self.assertEqual(3, result.data.requests)
+        self.assertEqual(3, len([q for q in board.queries if 'change_multiple_column_values' in q]))
+        self.assertEqual([row.row_id for row in rows], [row.row_id for row in result.data.updated])
+        self.assertIn('m9: change_multiple_column_values', board.queries[0])
+        self.assertFalse(any(row.get('Text').modified for row in rows))
+
+    def test_failed_aliases_keep_modified(self):
+        board = FakeBoard(items_per_group=10)
+        rows = self.modified_rows(board, 6)
+        board.fail_ids = {rows[1].row_id, rows[4].row_id}
+
+        result = board.update_rows(rows, batch_size=4)
+        self.assertTrue(result.is_error())
+        self.assertEqual([(rows[1], f"Item {rows[1].row_id} not found"),
+                          (rows[4], f"Item {rows[4].row_id} not found")], result.data.failed)
+        self.assertEqual(4, len(result.data.updated))
+        self.assertEqual([False, True, False, False, True, False], [row.get('Text').modified for row in rows])
+
+    def test_failed_inserts_are_all_reported(self):
+        board = FakeBoard(items_per_group=10)
+        board.insert = lambda group_id, row_name, q_data=None: Result(-1, message=f"Unable to create {row_name}")
+        rows = [board.new_row(f"New {i}") for i in range(3)]
+
+        result = board.update_rows(rows)
+        self.assertEqual([(row, f"Unable to create {row.row_name}") for row in rows], result.data.failed)
+        self.assertEqual("3 of 3 rows were not updated", result.message)
+
+    def test_unmodified_rows_are_skipped(self):
+        board = FakeBoard(items_per_group=10)
+        rows = board.select(limit=100).data[:5]
+        rows[2].set('Text', 'changed')
+        board.queries.clear()
+
+        result = board.update_rows(rows)
+        self.assertEqual([rows[2]], result.data.updated)
+        self.assertEqual(4, len(result.data.skipped))
+        self.assertEqual(1, result.data.requests)
+
+    def test_batch_size_follows_budget(self):
+        scheduler = ComplexityScheduler.klass(capacity=1000, window_seconds=60, default_cost=100)
+        board = FakeBoard(items_per_group=10, scheduler=scheduler)
+        rows = self.modified_rows(board, 12)
+
+        result = board.update_rows(rows, batch_size=50)
+        self.assertTrue(result.is_ok())
+        # half of a 1000 point budget pays for 5 mutations of 100 points
+        self.assertEqual(3, result.data.requests)
+
+    def test_partial_response(self):
+        body = {'data': {'u0': {'id': '1'}, 'u1': None},
+                'errors': [{'message': 'Item not found', 'path': ['u1']}]}
+        result = MondayConnection.check_response(PartialResponse(body))
+        self.assertEqual(4001, result.status.code)
+        self.assertEqual(body, result.data)
+        self.assertIsNone(MondayConnection.retry_wait_seconds(result))
+        self.assertIsNotNone(MondayConnection.retry_wait_seconds(
+            MondayConnection.check_response(PartialResponse({'errors': [{'message': 'Parse error'}]}))))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import threading
+import time
+import unittest
+
+from monday.c_web_hook_pipeline import WebHookPipeline
+from result.c_result import Result
+
+
+def column_event(pulse_id, value, trigger_uuid=None):
+    return {'event': {'type': 'update_column_value', 'boardId': 1234, 'pulseId': pulse_id, 'columnId': 'text',
+                      'value': {'value': value}, 'triggerUuid': trigger_uuid or f"{pulse_id}-{value}"}}
+
+
+class TestWebHookPipeline(unittest.TestCase):
+    def setUp(self):
+        self.lock = threading.Lock()
+        self.seen = []
+        self.running = set()
+        self.overlap = False
+        self.max_running = 0
+        self.wait_for_company = False
+        self.company = threading.Event()
+
+    def process(self, call_back, event):
+        pulse_id = event.data.pulse_id
+        with self.lock:
+            self.overlap = self.overlap or pulse_id in self.running
+            self.running.add(pulse_id)
+            self.max_running = max(self.max_running, len(self.running))
+            if len(self.running) > 1:
+                self.company.set()
+        if self.wait_for_company:
+            # held until a second event runs, with one worker at a time this times out
+            self.company.wait(timeout=5)
+        time.sleep(0.01)
+        with self.lock:
+            self.running.discard(pulse_id)
+            self.seen.append((pulse_id, event.data.value.value))
+        return call_back(event)
+
+    def test_order_per_item(self):
+        pipeline = WebHookPipeline(lambda event: Result(0), workers=4, process=self.process).start()
+        for value in range(5):
+            for pulse_id in (1, 2, 3):
+                self.assertTrue(pipeline.submit(column_event(pulse_id, value)).is_ok())
+        self.assertTrue(pipeline.join(timeout=5))
+        pipeline.stop()
+
+        self.assertFalse(self.overlap)
+        for pulse_id in (1, 2, 3):
+            self.assertEqual(list(range(5)), [value for p, value in self.seen if p == pulse_id])
+        self.assertEqual(15, pipeline.stats().get('processed'))
+
+    def test_items_run_at_the_same_time(self):
+        self.wait_for_company = True
+        pipeline = WebHookPipeline(lambda event: Result(0), workers=5, process=self.process).start()
+        for pulse_id in range(10):
+            pipeline.submit(column_event(pulse_id, 0))
+        pipeline.stop()
+        self.assertGreater(self.max_running, 1)
+        self.assertEqual(10, len(self.seen))
+
+    def test_duplicates_are_dropped(self):
+        pipeline = WebHookPipeline(lambda event: Result(0), process=self.process).start()
+        pipeline.submit(column_event(1, 'a', trigger_uuid='same'))
+        self.assertEqual('Duplicate event', pipeline.submit(column_event(1, 'a', trigger_uuid='same')).message)
+        pipeline.stop()
+        self.assertEqual(1, len(self.seen))
+        self.assertEqual(1, pipeline.stats().get('duplicates'))
+
+    def test_back_pressure(self):
+        pipeline = WebHookPipeline(lambda event: Result(0), max_pending=3, process=self.process)
+        results = [pipeline.submit(column_event(1, value)) for value in range(5)]
+        self.assertEqual([0, 0, 0, 429, 429], [result.status.code for result in results])
+        pipeline.start().stop()
+        self.assertEqual([0, 1, 2], [value for _, value in self.seen])
+
+    def test_rejected_events_can_be_sent_again(self):
+        pipeline = WebHookPipeline(lambda event: Result(0), max_pending=1, process=self.process)
+        pipeline.submit(column_event(1, 'a'))
+        self.assertEqual(429, pipeline.submit(column_event(2, 'b')).status.code)
+        pipeline.start().stop()
+        self.assertEqual('Queued', pipeline.submit(column_event(2, 'b')).message)
+
+    def test_events_for_an_item_are_merged(self):
+        calls = []
+
+        def process(call_back, event):
+            calls.append(event)
+            return call_back(event.data, event.changes)
+
+        pipeline = WebHookPipeline(lambda row, changes: Result(0), debounce_seconds=0.05, process=process).start()
+        for value, column_id in (('a', 'text'), ('b', 'status'), ('c', 'text'), ('d', 'date4')):
+            event = column_event(1, value)
+            event['event']['columnId'] = column_id
+            event['event']['previousValue'] = {'value': f"before {value}"}
+            pipeline.submit(event)
+        pipeline.submit(column_event(2, 'x'))
+        pipeline.stop()
+
+        self.assertEqual(2, len(calls))
+        merged = [event for event in calls if event.data.pulse_id == 1][0]
+        self.assertEqual(4, merged.count)
+        self.assertEqual(['text', 'status', 'date4'], [change.column_id for change in merged.changes])
+        self.assertEqual('c', merged.changes[0].value.value)
+        self.assertEqual('before a', merged.changes[0].previous_value.value)
+        self.assertEqual('d', merged.data.value.value)
+        self.assertEqual(3, pipeline.stats().get('coalesced'))
+        self.assertEqual(0, pipeline.stats().get('pending'))
+
+    def test_failures_are_counted(self):
+        def call_back(event):
+            if event.data.value.value == 'bad':
+                raise ValueError('bad event')
+            return Result(-1) if event.data.value.value == 'error' else Result(0)
+
+        pipeline = WebHookPipeline(call_back, process=self.process).start()
+        for value in ('bad', 'error', 'good'):
+            pipeline.submit(column_event(7, value))
+        self.assertTrue(pipeline.submit({'event': {'type': 'unknown'}}).is_error())
+        pipeline.stop()
+        self.assertEqual({'pending': 0, 'processed': 3, 'failed': 2, 'duplicates': 0, 'rejected': 0, 'coalesced': 0,
+                          'workers': 0},
+                         pipeline.stats())
+
+
+if __name__ == '__main__':
+    unittest.main()
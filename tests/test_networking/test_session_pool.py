@@ -0,0 +1,73 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from networking.c_requests import Network
+from networking.c_session_pool import SessionPool
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def _reply(self):
+        length = int(self.headers.get('Content-Length', 0))
+        if length:
+            self.rfile.read(length)
+        body = b'{"data": {}}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._reply()
+
+    def do_POST(self):
+        self._reply()
+
+    def log_message(self, *args):
+        pass
+
+
+class TestSessionPool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}/v2/"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        SessionPool().close()
+        SessionPool().counter.reset()
+
+    def test_same_session_is_returned(self):
+        self.assertIs(SessionPool().session(), SessionPool().session())
+        self.assertIsNot(SessionPool().session(), SessionPool().session('other'))
+
+    def test_connections_are_reused(self):
+        for _ in range(5):
+            r = Network.post(self.url, data={'query': '{ me { id } }'})
+            self.assertEqual(200, r.status_code)
+
+        stats = Network.stats()
+        self.assertEqual(5, stats.get('requests'))
+        self.assertEqual(1, stats.get('new_connections'))
+        self.assertEqual(4, stats.get('reused_connections'))
+
+    def test_configure_rebuilds_sessions(self):
+        first = SessionPool().session()
+        SessionPool().configure(pool_maxsize=4)
+        self.assertIsNot(first, SessionPool().session())
+        self.assertEqual(4, SessionPool().pool_maxsize)
+        SessionPool().configure(pool_maxsize=10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+from datetime import datetime
+
+from dateutil import parser
+
+from std_utility.c_datetime import DateTime, DateCache
+
+
+class TestDateTimeParse(unittest.TestCase):
+    def test_fixed_formats_match_dateutil(self):
+        for text in ['2024-01-31', '2024-01-31 13:45', '2024-01-31 13:45:10', '2024-01-31T13:45:10']:
+            self.assertIsNotNone(DateTime.parse_fixed(text))
+            self.assertEqual(parser.parse(text), DateTime(text).datetime)
+
+    def test_other_formats_use_dateutil(self):
+        for text in ['Jan 5 2024', '2021-01-02 23:22:14.123456', '2022-03-22T18:55:45.360251Z', '01/31/2024']:
+            self.assertIsNone(DateTime.parse_fixed(text))
+            self.assertEqual(parser.parse(text), DateTime(text).datetime)
+        self.assertIsNone(DateTime.parse_fixed('2024-02-30'))
+        self.assertEqual('1970-01-01 00:00:00', DateTime(None).to_str())
+        self.assertEqual(datetime(2021, 5, 2), DateTime('2021-01-02', months=4).datetime)
+
+    def test_date_cache(self):
+        cache = DateCache(max_entries=2)
+        first = DateTime.from_text('2024-01-31', cache)
+        second = DateTime.from_text('2024-01-31', cache)
+        self.assertIsNot(first, second)
+        self.assertIs(first.datetime, second.datetime)
+        # a DateTime from the cache can be changed without changing the others
+        second.offset(days=1)
+        self.assertEqual('2024-01-31', first.to_date_str())
+        self.assertEqual({'size': 1, 'hits': 1, 'misses': 1}, cache.stats())
+
+        DateTime.from_text('2024-02-01', cache)
+        DateTime.from_text('2024-02-02', cache)
+        self.assertEqual(1, cache.stats().get('size'))
+        self.assertEqual('1970-01-01 00:00:00', DateTime.from_text('', cache).to_str())
+
+
+if __name__ == '__main__':
+    unittest.main()